@@ -22,6 +22,8 @@ SECONDARY FLOW (Recruiter Analytics) - OPTIONAL BATCH RANKING:
     - Used later by recruiter for dashboard/analytics
     - Batch analysis with ranking
     - Returns ALL qualified candidates (NO top-K limit)
+    - Optional limit/offset paging for very large pools (default: all)
+    - Optional near-duplicate pass (dedupe=True) so copies are encoded once
     - NOT used during candidate apply flow
     - Keep for future recruiter dashboard features
 
@@ -32,36 +34,225 @@ KEY PRINCIPLE:
 ================================================================================
 """
 
+from __future__ import annotations
+
 import json
-from typing import List, Dict, Tuple, Optional
+import threading
+from typing import List, Dict, Tuple, Optional, Iterator, TYPE_CHECKING
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Heavy dependencies (sentence_transformers -> torch) are imported
+# lazily, so callers that only need generate_reason() or the threshold logic
+# pay no model import cost. Use warm_model() to load in the background.
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+try:
+    from .embedding_cache import EmbeddingCache
+    from .jd_registry import JDEmbeddingRegistry
+    from .encoding_coalescer import EmbeddingCoalescer
+except ImportError:
+    from embedding_cache import EmbeddingCache
+    from jd_registry import JDEmbeddingRegistry
+    from encoding_coalescer import EmbeddingCoalescer
+
+MODEL_NAME = 'all-mpnet-base-v2'
+
+# Inference backends selectable in load_model():
+#   "torch" - fp32 PyTorch (reference)
+#   "int8"  - PyTorch with dynamic int8 quantization of Linear layers (CPU)
+#   "onnx"  - ONNX Runtime export (requires: pip install "sentence-transformers[onnx]")
+SUPPORTED_BACKENDS = ("torch", "int8", "onnx")
 
 # Global model cache for backend integration (load once, reuse many times)
 _model_cache: Optional[SentenceTransformer] = None
+_model_backend: Optional[str] = None
+_model_version: Optional[str] = None
+_model_lock = threading.Lock()
+
+# Background warm-up state (see warm_model())
+_model_ready = threading.Event()
+_warm_thread: Optional[threading.Thread] = None
+_warm_error: Optional[str] = None
+
+# Per-process JD embedding registry for the Apply hot path
+_jd_registry = JDEmbeddingRegistry()
+
+# Optional micro-batching service in front of the cached model (opt-in)
+_coalescer: Optional[EmbeddingCoalescer] = None
 
 
-def load_model(force_reload: bool = False) -> SentenceTransformer:
+def _build_model(backend: str) -> SentenceTransformer:
+    """Instantiate the MPNet model for the requested inference backend."""
+    from sentence_transformers import SentenceTransformer
+    
+    if backend == "onnx":
+        return SentenceTransformer(MODEL_NAME, backend="onnx")
+    
+    model = SentenceTransformer(MODEL_NAME, device="cpu" if backend == "int8" else None)
+    
+    if backend == "int8":
+        import torch
+        torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    
+    return model
+
+
+def load_model(force_reload: bool = False, backend: Optional[str] = None) -> SentenceTransformer:
     """
     Load all-mpnet-base-v2 model once and keep in memory.
     Uses caching for backend efficiency - model loaded once and reused.
     
     Args:
         force_reload: If True, reload model even if cached (default: False)
+        backend: Inference backend - "torch" (fp32), "int8" (dynamic quantization)
+                 or "onnx" (ONNX Runtime). Requesting a backend different from
+                 the cached one reloads the model. (default: None - keep the
+                 cached backend, "torch" on first load)
+        
+    A (re)load runs a dummy encode on the new model before it replaces the
+    cached one, so is_model_ready() only turns True once the model is
+    warmed. If a reload fails, the previous model keeps serving and stays
+    ready.
         
     Returns:
         SentenceTransformer model instance
+        
+    Raises:
+        ValueError: If backend is not supported
+        RuntimeError: If model loading fails
+    """
+    global _model_cache, _model_backend, _model_version
+    
+    if backend is None:
+        backend = _model_backend or "torch"
+    
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError(f"backend must be one of {SUPPORTED_BACKENDS}")
+    
+    # Lock so a background warm-up and a first request never load twice
+    with _model_lock:
+        if _model_cache is None or force_reload or backend != _model_backend:
+            _model_ready.clear()
+            try:
+                model = _build_model(backend)
+                # Allocate weights and buffers before the first real request
+                model.encode(["warm up"], show_progress_bar=False, normalize_embeddings=True)
+            except Exception as e:
+                if _model_cache is not None:
+                    _model_ready.set()  # Previous model is still cached and serving
+                raise RuntimeError(f"Failed to load model ({backend} backend): {str(e)}")
+            _model_cache = model
+            _model_backend = backend
+            _model_version = f"{MODEL_NAME}:{backend}"
+            # Tag the instance so stored vectors can record where they came from
+            _model_cache.model_version = _model_version
+            _jd_registry.clear()  # Embeddings from a previous model are incomparable
+            if _coalescer is not None:
+                _coalescer.model = _model_cache
+            _model_ready.set()
+        
+        return _model_cache
+
+
+def warm_model(backend: Optional[str] = None, background: bool = True) -> Optional[threading.Thread]:
+    """
+    Load the model (load_model() runs a dummy encode so weights and buffers
+    are allocated) before the first real request.
+    
+    With background=True the work runs in a daemon thread, so the service can
+    start answering health checks immediately; poll is_model_ready() or
+    model_status() to know when to accept traffic.
+    
+    Args:
+        backend: Inference backend passed to load_model() (default: None)
+        background: If True, warm in a background thread (default: True)
+        
+    Returns:
+        The warm-up thread (background=True) or None
+        
+    Raises:
+        RuntimeError: If model loading fails (background=False only; in the
+                      background the error is reported by model_status())
     """
-    global _model_cache
+    global _warm_thread, _warm_error
     
-    if _model_cache is None or force_reload:
+    def _warm():
+        global _warm_error
         try:
-            _model_cache = SentenceTransformer('all-mpnet-base-v2')
+            load_model(backend=backend)
+            _warm_error = None
         except Exception as e:
-            raise RuntimeError(f"Failed to load model: {str(e)}")
+            _warm_error = str(e)
+            if not background:
+                raise RuntimeError(f"Model warm-up failed: {str(e)}")
     
-    return _model_cache
+    if not background:
+        _warm()
+        return None
+    
+    if _warm_thread is None or not _warm_thread.is_alive():
+        _warm_thread = threading.Thread(target=_warm, name="model-warm-up", daemon=True)
+        _warm_thread.start()
+    return _warm_thread
+
+
+def is_model_ready() -> bool:
+    """
+    Check whether the model is loaded and warmed, i.e. ready for traffic.
+    
+    Set once load_model() (or warm_model()) has loaded the model and run its
+    warm-up encode; cleared while a reload is in progress.
+    
+    Returns:
+        True once the model is loaded and warmed
+    """
+    return _model_ready.is_set()
+
+
+def model_status() -> Dict:
+    """
+    Health-check friendly model status.
+    
+    Returns:
+        {"loaded": bool, "ready": bool, "warming": bool, "backend": str|None, "error": str|None}
+    """
+    return {
+        "loaded": _model_cache is not None,
+        "ready": _model_ready.is_set(),
+        "warming": _warm_thread is not None and _warm_thread.is_alive(),
+        "backend": _model_backend,
+        "error": _warm_error
+    }
+
+
+def get_model_backend() -> Optional[str]:
+    """
+    Get the inference backend of the cached model.
+    
+    Returns:
+        "torch", "int8", "onnx", or None if no model is loaded
+    """
+    return _model_backend
+
+
+def get_model_version(model=None) -> Optional[str]:
+    """
+    Get the embedding version tag ("<model name>:<backend>") of a model.
+    
+    Vectors produced under different tags are not comparable; persistent
+    stores record the tag with every vector so stale ones can be re-embedded.
+    
+    Args:
+        model: Model or encoder (coalescer, worker pool) to inspect
+               (default: None - the cached model)
+        
+    Returns:
+        Version tag, or None if no model is loaded / the encoder is untagged
+    """
+    if model is None:
+        return _model_version
+    return getattr(model, "model_version", None)
 
 
 def get_model() -> Optional[SentenceTransformer]:
@@ -75,6 +266,94 @@ def get_model() -> Optional[SentenceTransformer]:
     return _model_cache
 
 
+def start_coalescer(max_wait_ms: float = 5.0, max_batch_size: int = 64) -> EmbeddingCoalescer:
+    """
+    Enable micro-batching of concurrent encode requests (opt-in).
+    
+    Once started, evaluate_application() and batch_match_for_recruiter()
+    calls without an explicit model are routed through the coalescer, so
+    concurrent applies share one model.encode() call.
+    
+    Args:
+        max_wait_ms: Maximum time a request waits for others to join its batch (default: 5.0)
+        max_batch_size: Maximum number of texts per model.encode() call (default: 64)
+        
+    Returns:
+        Running EmbeddingCoalescer (also usable directly via encode()/encode_async())
+    """
+    global _coalescer
+    
+    if _coalescer is None:
+        _coalescer = EmbeddingCoalescer(load_model(), max_wait_ms=max_wait_ms, max_batch_size=max_batch_size)
+    
+    return _coalescer
+
+
+def stop_coalescer() -> None:
+    """Disable micro-batching; queued requests are still completed."""
+    global _coalescer
+    
+    if _coalescer is not None:
+        _coalescer.shutdown()
+        _coalescer = None
+
+
+def get_coalescer() -> Optional[EmbeddingCoalescer]:
+    """
+    Get the running coalescer, if start_coalescer() was called.
+    
+    Returns:
+        EmbeddingCoalescer instance or None
+    """
+    return _coalescer
+
+
+def _resolve_model(model):
+    """
+    Resolve the encoder used by the public entry points.
+    
+    None -> running coalescer if enabled, otherwise the cached model.
+    Explicit models are used as-is: a SentenceTransformer, or a drop-in
+    encoder exposing the same encode() (EmbeddingCoalescer, EmbeddingWorkerPool).
+    Duck-typed so the check never imports sentence_transformers.
+    """
+    if model is None:
+        return _coalescer if _coalescer is not None else load_model()
+    
+    if not callable(getattr(model, "encode", None)):
+        raise ValueError("model must be a SentenceTransformer instance or an encoder exposing encode()")
+    
+    return model
+
+
+def get_jd_registry() -> JDEmbeddingRegistry:
+    """
+    Get the per-process JD embedding registry used by evaluate_application().
+    Useful for tuning the TTL or reading hit/miss counters.
+    
+    Returns:
+        JDEmbeddingRegistry instance
+    """
+    return _jd_registry
+
+
+def invalidate_job_description(job_id: Optional[str] = None, jd_text: Optional[str] = None) -> bool:
+    """
+    Drop a memoized JD embedding. Call this when a recruiter edits or closes a posting.
+    
+    Args:
+        job_id: Job id passed to evaluate_application()
+        jd_text: JD text, when evaluate_application() was called without a job id
+        
+    Returns:
+        True if an entry was removed
+    """
+    return _jd_registry.invalidate(
+        job_id=job_id,
+        jd_text=clean_text(jd_text) if jd_text is not None else None
+    )
+
+
 def clean_text(text: str) -> str:
     """Minimal text cleanup - whitespace normalization only."""
     if not text or not isinstance(text, str):
@@ -82,13 +361,23 @@ def clean_text(text: str) -> str:
     return ' '.join(text.split())
 
 
-def generate_embeddings(model: SentenceTransformer, texts: List[str]) -> np.ndarray:
+def generate_embeddings(
+    model: SentenceTransformer,
+    texts: List[str],
+    cache: Optional[EmbeddingCache] = None
+) -> np.ndarray:
     """
     Generate embeddings using batch encoding.
     
+    If a cache is given, texts already seen are served from it and only the
+    misses are sent through the model (in a single batch). Cache keys carry
+    the model's version tag (get_model_version()), so switching backend or
+    model never returns vectors from the previous one.
+    
     Args:
         model: Loaded SentenceTransformer model
         texts: List of text strings
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
         
     Returns:
         numpy array of shape (N, 768) for 768-dimensional embeddings
@@ -97,19 +386,116 @@ def generate_embeddings(model: SentenceTransformer, texts: List[str]) -> np.ndar
         return np.array([]).reshape(0, 768)
     
     cleaned_texts = [clean_text(text) for text in texts]
+    
+    if cache is None:
+        return _encode(model, cleaned_texts)
+    
+    version = get_model_version(model) or cache.model_version
+    embeddings: List[Optional[np.ndarray]] = [cache.get(text, version) for text in cleaned_texts]
+    
+    # Encode each distinct missing text once
+    missing = list(dict.fromkeys(
+        text for text, embedding in zip(cleaned_texts, embeddings) if embedding is None
+    ))
+    if missing:
+        fresh = dict(zip(missing, _encode(model, missing)))
+        for text, embedding in fresh.items():
+            cache.put(text, embedding, version)
+        embeddings = [
+            fresh[text] if embedding is None else embedding
+            for text, embedding in zip(cleaned_texts, embeddings)
+        ]
+    
+    return np.vstack(embeddings).astype(np.float32, copy=False)
+
+
+def _encode(model: SentenceTransformer, cleaned_texts: List[str]) -> np.ndarray:
+    """
+    Run the model on already-cleaned texts (normalized embeddings).
+    SentenceTransformer.encode() already groups texts of similar length into
+    padding batches (length_sorted_idx) and returns them in input order.
+    """
     embeddings = model.encode(
         cleaned_texts,
         batch_size=32,
         show_progress_bar=False,
         normalize_embeddings=True
     )
-    return np.array(embeddings)
+    return np.asarray(embeddings)
+
+
+def encode_jd_and_resumes(
+    model: SentenceTransformer,
+    jd_texts: List[str],
+    resume_texts: List[str],
+    cache: Optional[EmbeddingCache] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode job descriptions and resumes in a single batched model call.
+    
+    JDs and resumes share one tokenizer pass and one set of length-sorted
+    padding batches instead of two separate encode() invocations.
+    Works for any number of JDs (multi-JD workloads).
+    
+    Args:
+        model: Loaded SentenceTransformer model
+        jd_texts: List of job description texts
+        resume_texts: List of resume texts
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+        
+    Returns:
+        Tuple of (jd_embeddings (M, 768), resume_embeddings (N, 768))
+    """
+    embeddings = generate_embeddings(model, list(jd_texts) + list(resume_texts), cache=cache)
+    return embeddings[:len(jd_texts)], embeddings[len(jd_texts):]
+
+
+# Rows of float16 storage upcast to float32 per block in score_matrix()
+_SCORE_BLOCK_ROWS = 16384
+
+
+def score_matrix(jd_embeddings: np.ndarray, resume_embeddings: np.ndarray) -> np.ndarray:
+    """
+    Scoring kernel for pre-normalized embeddings: M JDs x N resumes in one matmul.
+    
+    Embeddings from generate_embeddings() are unit-length, so cosine similarity
+    is a plain dot product - no re-normalization or extra copies. Resume
+    embeddings may be stored as float16 to halve memory; they are upcast to
+    float32 block by block, so the temporary never exceeds one block (this
+    trades some CPU for memory - the upcast is slower than the matmul).
+    
+    Use cases: "match all open jobs against this new resume" (M JDs x 1 resume)
+    and bulk re-scoring (M JDs x N resumes).
+    
+    Args:
+        jd_embeddings: Normalized JD embeddings of shape (M, 768) or (768,)
+        resume_embeddings: Normalized resume embeddings of shape (N, 768),
+                           float32 or float16
+        
+    Returns:
+        float32 array of shape (M, N) with scores clipped to [0, 1]
+    """
+    jd_embeddings = np.atleast_2d(np.asarray(jd_embeddings, dtype=np.float32))
+    resume_embeddings = np.asarray(resume_embeddings)
+    
+    if resume_embeddings.dtype == np.float32:
+        scores = jd_embeddings @ resume_embeddings.T
+    else:
+        scores = np.empty((jd_embeddings.shape[0], resume_embeddings.shape[0]), dtype=np.float32)
+        for start in range(0, resume_embeddings.shape[0], _SCORE_BLOCK_ROWS):
+            block = resume_embeddings[start:start + _SCORE_BLOCK_ROWS].astype(np.float32)
+            np.matmul(jd_embeddings, block.T, out=scores[:, start:start + len(block)])
+    
+    return np.clip(scores, 0.0, 1.0, out=scores)
 
 
 def compute_similarity(jd_embedding: np.ndarray, resume_embeddings: np.ndarray) -> np.ndarray:
     """
     Compute cosine similarity between JD and resumes.
     
+    Embeddings must be normalized (as produced by generate_embeddings());
+    see score_matrix().
+    
     Args:
         jd_embedding: JD embedding of shape (768,)
         resume_embeddings: Resume embeddings of shape (N, 768)
@@ -120,9 +506,72 @@ def compute_similarity(jd_embedding: np.ndarray, resume_embeddings: np.ndarray)
     if resume_embeddings.shape[0] == 0:
         return np.array([])
     
-    jd_reshaped = jd_embedding.reshape(1, -1)
-    similarities = cosine_similarity(jd_reshaped, resume_embeddings)[0]
-    return np.clip(similarities, 0.0, 1.0)
+    return score_matrix(jd_embedding.reshape(1, -1), resume_embeddings)[0]
+
+
+# Long-resume windows: MPNet truncates at 384 tokens (~250-300 words of
+# resume prose), so windows stay well under that and overlap by 50 words.
+WINDOW_WORDS = 200
+WINDOW_STRIDE_WORDS = 150
+SUPPORTED_POOLING = ("max", "mean")
+
+
+def split_resume_windows(
+    resume_texts: List[str],
+    window_words: int = WINDOW_WORDS,
+    stride_words: int = WINDOW_STRIDE_WORDS
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Split resumes into overlapping word windows for chunked scoring.
+    
+    A resume that fits in one window yields exactly its cleaned text, so
+    short resumes score the same in chunked and non-chunked mode.
+    
+    Args:
+        resume_texts: List of resume texts
+        window_words: Words per window (default: 200)
+        stride_words: Words between window starts; < window_words overlaps (default: 150)
+        
+    Returns:
+        Tuple of (flat list of windows for all resumes, offsets) where
+        resume i owns windows[offsets[i]:offsets[i + 1]]
+    """
+    if stride_words < 1 or stride_words > window_words:
+        raise ValueError("stride_words must be between 1 and window_words")
+    
+    windows: List[str] = []
+    offsets = [0]
+    for text in resume_texts:
+        words = clean_text(text).split()
+        last_start = max(len(words) - window_words, 0)
+        starts = list(range(0, last_start + 1, stride_words))
+        if starts[-1] != last_start:
+            starts.append(last_start)  # Make sure the tail is covered
+        windows.extend(' '.join(words[start:start + window_words]) for start in starts)
+        offsets.append(len(windows))
+    
+    return windows, np.array(offsets, dtype=np.int64)
+
+
+def pool_window_scores(window_scores: np.ndarray, offsets: np.ndarray, pooling: str = "max") -> np.ndarray:
+    """
+    Aggregate per-window similarity scores into one score per resume (vectorized).
+    
+    Args:
+        window_scores: Scores of shape (W,), as returned by compute_similarity()
+        offsets: Window offsets from split_resume_windows(), shape (N + 1,)
+        pooling: "max" (best-matching section) or "mean" (default: "max")
+        
+    Returns:
+        Array of shape (N,) with pooled scores in [0, 1]
+    """
+    if pooling not in SUPPORTED_POOLING:
+        raise ValueError(f"pooling must be one of {SUPPORTED_POOLING}")
+    
+    starts = offsets[:-1]
+    if pooling == "max":
+        return np.maximum.reduceat(window_scores, starts)
+    return np.add.reduceat(window_scores, starts) / np.diff(offsets)
 
 
 def generate_reason(score: float) -> str:
@@ -187,11 +636,160 @@ def _filter_qualified_candidates(
     return qualified_candidates
 
 
+def rank_qualified_candidates(
+    similarities: np.ndarray,
+    min_score_threshold: float = 0.50,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized threshold filter + ranking (no per-candidate Python objects).
+    
+    Equivalent to _filter_qualified_candidates(rank_candidates(...)) followed by
+    slicing [offset:offset + limit], including tie order (lower id first).
+    With a limit, only the top offset + limit scores are sorted (argpartition).
+    
+    Args:
+        similarities: Array of similarity scores
+        min_score_threshold: Minimum score required (default: 0.50)
+        limit: Maximum number of candidates returned (default: None, all qualified)
+        offset: Number of top-ranked candidates to skip, for paging (default: 0)
+        
+    Returns:
+        Tuple of (candidate_ids, scores) arrays, ranked descending
+    """
+    # Compare in float64 so threshold semantics match the Python-float path
+    similarities = np.asarray(similarities, dtype=np.float64)
+    qualified_ids = np.flatnonzero(similarities >= min_score_threshold)
+    qualified_scores = similarities[qualified_ids]
+    
+    end = len(qualified_ids) if limit is None else min(offset + limit, len(qualified_ids))
+    if offset >= end:
+        return qualified_ids[:0], qualified_scores[:0]
+    
+    if end < len(qualified_ids):
+        # Keep everything scoring >= the end-th best score (ties included),
+        # then stable-sort just that subset
+        kth_best = -np.partition(-qualified_scores, end - 1)[end - 1]
+        subset = np.flatnonzero(qualified_scores >= kth_best)
+    else:
+        subset = np.arange(len(qualified_ids))
+    
+    order = subset[np.argsort(-qualified_scores[subset], kind="stable")][offset:end]
+    return qualified_ids[order], qualified_scores[order]
+
+
+def iter_ranked_results(
+    similarities: np.ndarray,
+    min_score_threshold: float = 0.50,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Iterator[Dict]:
+    """
+    Lazily yield result rows in the batch_match_for_recruiter() format.
+    
+    Args:
+        similarities: Array of similarity scores
+        min_score_threshold: Minimum score required (default: 0.50)
+        limit: Maximum number of rows (default: None, all qualified)
+        offset: Number of top-ranked candidates to skip (default: 0)
+        
+    Yields:
+        {"candidate_id": int, "score": float, "rank": int, "reason": str}
+    """
+    candidate_ids, scores = rank_qualified_candidates(similarities, min_score_threshold, limit, offset)
+    for rank, (candidate_id, score) in enumerate(zip(candidate_ids.tolist(), scores.tolist()), start=offset + 1):
+        yield {
+            "candidate_id": candidate_id,
+            "score": round(score, 4),
+            "rank": rank,
+            "reason": generate_reason(score)
+        }
+
+
+def _dedupe_resumes(resume_texts: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Near-duplicate pass for batch matching.
+    
+    Returns:
+        Tuple of (texts to encode, representative index per resume, rows of
+        the resumes that are their own representative)
+    """
+    try:
+        from .duplicate_detector import find_near_duplicates
+    except ImportError:
+        from duplicate_detector import find_near_duplicates
+    
+    representative = find_near_duplicates(resume_texts)
+    unique_rows = np.flatnonzero(representative == np.arange(len(resume_texts)))
+    return [resume_texts[i] for i in unique_rows.tolist()], representative, unique_rows
+
+
+def _batch_result(
+    similarities: np.ndarray,
+    total_candidates: int,
+    min_score_threshold: float,
+    limit: Optional[int],
+    offset: int,
+    representative: Optional[np.ndarray] = None,
+    unique_rows: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    Threshold, rank and format batch scores (shared by the sync and async batch paths).
+    
+    Args:
+        similarities: One score per encoded resume (per representative with dedupe)
+        total_candidates: Number of resumes submitted
+        min_score_threshold: Minimum score required
+        limit: Maximum number of results returned
+        offset: Number of top-ranked qualified candidates to skip
+        representative: From _dedupe_resumes(), or None without dedupe
+        unique_rows: From _dedupe_resumes(), or None without dedupe
+        
+    Returns:
+        batch_match_for_recruiter() result dictionary
+    """
+    # Only representatives are scored; group members get no score of their own
+    # (-inf never meets a threshold) and are listed on their representative's row
+    if representative is not None:
+        scored = np.full(total_candidates, -np.inf, dtype=similarities.dtype)
+        scored[unique_rows] = similarities
+        similarities = scored
+    
+    # Filter by quality threshold and rank (vectorized, NO top-K limit by default)
+    # IMPORTANT: Only candidates with score >= min_score_threshold are returned
+    # Candidates with score < min_score_threshold are FILTERED OUT (not shortlisted)
+    shortlisted = int(np.count_nonzero(np.asarray(similarities, dtype=np.float64) >= min_score_threshold))
+    
+    result = {
+        "total_candidates": total_candidates,
+        "shortlisted": shortlisted,  # All qualified candidates
+        "results": list(iter_ranked_results(similarities, min_score_threshold, limit, offset))
+    }
+    
+    if representative is not None:
+        result["duplicates"] = {
+            int(i): int(representative[i]) for i in np.flatnonzero(representative != np.arange(total_candidates))
+        }
+        members: Dict[int, List[int]] = {}
+        for member, rep in result["duplicates"].items():
+            members.setdefault(rep, []).append(member)
+        for row in result["results"]:
+            row["duplicates"] = members.get(row["candidate_id"], [])
+    
+    return result
+
+
 def evaluate_application(
     jd_text: str,
     resume_text: str,
     min_score_threshold: float,
-    model: Optional[SentenceTransformer] = None
+    model: Optional[SentenceTransformer] = None,
+    cache: Optional[EmbeddingCache] = None,
+    job_id: Optional[str] = None,
+    chunked: bool = False,
+    pooling: str = "max",
+    explain_skills: bool = False
 ) -> Dict:
     """
     PRIMARY FUNCTION: Evaluate single candidate application (threshold-based decision).
@@ -204,12 +802,21 @@ def evaluate_application(
     - Binary result: shortlisted/not shortlisted
     - Instant decision for candidate application flow
     - Used in production for real-time application evaluation
+    - JD embedding is memoized per process, so repeat applies encode only the resume
     
     Args:
         jd_text: Job description text
         resume_text: Single candidate resume text
         min_score_threshold: Minimum score required by recruiter (0.0 to 1.0)
         model: Optional pre-loaded model instance (for backend efficiency)
+        cache: Optional EmbeddingCache so repeat JDs/resumes skip the model
+        job_id: Optional job id used to memoize the JD embedding (default: keyed
+                by JD text hash). A changed jd_text for the same job_id re-encodes.
+        chunked: If True, score overlapping windows of the whole resume instead
+                 of the first 384 tokens only (default: False)
+        pooling: Window score aggregation in chunked mode, "max" or "mean" (default: "max")
+        explain_skills: If True, append per-skill matched/missing details to the
+                        reason and add a "skills" entry (default: False)
         
     Returns:
         Dictionary with application result:
@@ -219,6 +826,8 @@ def evaluate_application(
             "reason": str,            # Explanation of decision
             "threshold": float        # Recruiter's minimum score threshold
         }
+        With explain_skills=True also:
+            "skills": {"matched": [...], "missing": [...], "skill_scores": {...}, "explanation": str}
         
     Raises:
         ValueError: If inputs are invalid
@@ -242,28 +851,46 @@ def evaluate_application(
     if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
         raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
     
-    # Use provided model or load/cache model
-    if model is None:
-        model = load_model()
-    elif not isinstance(model, SentenceTransformer):
-        raise ValueError("model must be a SentenceTransformer instance")
+    if pooling not in SUPPORTED_POOLING:
+        raise ValueError(f"pooling must be one of {SUPPORTED_POOLING}")
+    
+    # Use provided model, running coalescer, or load/cache model
+    model = _resolve_model(model)
     
     try:
+        # Whole resume, or all of its overlapping windows in chunked mode
+        if chunked:
+            resume_inputs, window_offsets = split_resume_windows([resume_text])
+        else:
+            resume_inputs = [resume_text]
+        
         # Generate embeddings
-        jd_embedding = generate_embeddings(model, [jd_text])[0]
-        resume_embedding = generate_embeddings(model, [resume_text])[0]
+        # Reuse the memoized JD embedding when this posting was seen before
+        cleaned_jd = clean_text(jd_text)
+        jd_embedding = _jd_registry.get(cleaned_jd, model, job_id=job_id)
+        if jd_embedding is None:
+            # Encode JD and resume together in one batch
+            jd_embeddings, resume_embeddings = encode_jd_and_resumes(
+                model, [jd_text], resume_inputs, cache=cache
+            )
+            jd_embedding = jd_embeddings[0]
+            _jd_registry.put(cleaned_jd, jd_embedding, model, job_id=job_id)
+        else:
+            resume_embeddings = generate_embeddings(model, resume_inputs, cache=cache)
         
         # Validate embedding shapes
         if jd_embedding.shape[0] != 768:
             raise RuntimeError(f"JD embedding shape mismatch: expected 768, got {jd_embedding.shape[0]}")
         
-        if resume_embedding.shape[0] != 768:
-            raise RuntimeError(f"Resume embedding shape mismatch: expected 768, got {resume_embedding.shape[0]}")
+        if resume_embeddings.shape[1] != 768:
+            raise RuntimeError(f"Resume embedding shape mismatch: expected 768, got {resume_embeddings.shape[1]}")
         
-        # Compute similarity
-        jd_reshaped = jd_embedding.reshape(1, -1)
-        resume_reshaped = resume_embedding.reshape(1, -1)
-        similarity_score = float(cosine_similarity(jd_reshaped, resume_reshaped)[0][0])
+        # Compute similarity (normalized dot product)
+        scores = compute_similarity(jd_embedding, resume_embeddings)
+        if chunked:
+            similarity_score = float(pool_window_scores(scores, window_offsets, pooling)[0])
+        else:
+            similarity_score = float(scores[0])
         similarity_score = max(0.0, min(1.0, similarity_score))  # Clip to [0, 1]
         
         # Check if candidate meets threshold
@@ -275,13 +902,26 @@ def evaluate_application(
         else:
             reason = f"Score {similarity_score:.4f} below required threshold {min_score_threshold:.4f}"
         
-        return {
+        result = {
             "shortlisted": is_shortlisted,
             "score": round(similarity_score, 4),
             "reason": reason,
             "threshold": round(min_score_threshold, 4)
         }
         
+        # Per-skill explanation from the embeddings computed above (no extra model call)
+        if explain_skills:
+            try:
+                from .skill_explainer import get_skill_explainer
+            except ImportError:
+                from skill_explainer import get_skill_explainer
+            
+            skills = get_skill_explainer().explain(jd_text, resume_text, resume_embeddings, model)
+            result["skills"] = skills
+            result["reason"] = f"{reason}; {skills['explanation']}"
+        
+        return result
+        
     except Exception as e:
         raise RuntimeError(f"Error during candidate application evaluation: {str(e)}")
 
@@ -290,7 +930,13 @@ def batch_match_for_recruiter(
     jd_text: str, 
     resume_texts: List[str], 
     min_score_threshold: float = 0.50,
-    model: Optional[SentenceTransformer] = None
+    model: Optional[SentenceTransformer] = None,
+    cache: Optional[EmbeddingCache] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    chunked: bool = False,
+    pooling: str = "max",
+    dedupe: bool = False
 ) -> Dict:
     """
     SECONDARY FUNCTION: Batch matching for recruiter dashboard/analytics (OPTIONAL).
@@ -314,13 +960,24 @@ def batch_match_for_recruiter(
         resume_texts: List of resume texts
         min_score_threshold: Minimum similarity score required (default: 0.50)
                             Only candidates with score >= threshold are returned
-        model: Optional pre-loaded model instance (for backend efficiency)
+        model: Optional pre-loaded model instance (for backend efficiency), or an
+               EmbeddingWorkerPool to shard encoding across processes
+        cache: Optional EmbeddingCache so repeat JDs/resumes skip the model
+        limit: Optional page size for large pools (default: None, all qualified)
+        offset: Number of top-ranked candidates to skip when paging (default: 0)
+        chunked: If True, score overlapping windows of each full resume; all
+                 windows of all resumes are encoded in one batch (default: False)
+        pooling: Window score aggregation in chunked mode, "max" or "mean" (default: "max")
+        dedupe: If True, run a MinHash/LSH near-duplicate pass first; each group of
+                near-identical resumes is encoded and scored once, through its
+                representative (first resume of the group). Other members get
+                no score or rank of their own (default: False)
         
     Returns:
         Dictionary with ranked results (ALL qualified candidates):
         {
             "total_candidates": int,
-            "shortlisted": int,  # All candidates meeting threshold
+            "shortlisted": int,  # All candidates meeting threshold (not just this page)
             "results": [
                 {
                     "candidate_id": int,
@@ -330,6 +987,10 @@ def batch_match_for_recruiter(
                 }
             ]
         }
+        With dedupe=True, only representatives are scored, ranked and counted
+        in "shortlisted"; each result row also has "duplicates": [candidate_id, ...]
+        (the other members of its group), and the result has
+            "duplicates": {candidate_id: representative_candidate_id}
         
     Raises:
         ValueError: If inputs are invalid
@@ -338,7 +999,8 @@ def batch_match_for_recruiter(
     Note:
         This is an optional feature for recruiter analytics.
         Primary application flow uses evaluate_application() instead.
-        NO top-K parameter - all qualified candidates are returned.
+        Without limit, all qualified candidates are returned. limit/offset only
+        page through the ranked list; they never change who qualifies.
     """
     # Input validation
     if not jd_text or not isinstance(jd_text, str):
@@ -353,19 +1015,39 @@ def batch_match_for_recruiter(
     if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
         raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
     
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError("limit must be a non-negative integer")
+    
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("offset must be a non-negative integer")
+    
+    if pooling not in SUPPORTED_POOLING:
+        raise ValueError(f"pooling must be one of {SUPPORTED_POOLING}")
+    
     # Ensure threshold is enforced - candidates below threshold are NOT shortlisted
     # Default is 0.50, meaning candidates with score < 0.50 will be filtered out
     
-    # Use provided model or load/cache model
-    if model is None:
-        model = load_model()
-    elif not isinstance(model, SentenceTransformer):
-        raise ValueError("model must be a SentenceTransformer instance")
+    # Use provided model, running coalescer, or load/cache model
+    model = _resolve_model(model)
     
     try:
-        # Generate embeddings
-        jd_embedding = generate_embeddings(model, [jd_text])[0]
-        resume_embeddings = generate_embeddings(model, resume_texts)
+        # Near-duplicate groups are encoded once (representative resume only)
+        if dedupe:
+            unique_texts, representative, unique_rows = _dedupe_resumes(resume_texts)
+        else:
+            unique_texts, representative, unique_rows = resume_texts, None, None
+        
+        # Whole resumes, or all windows of all resumes in chunked mode
+        if chunked:
+            resume_inputs, window_offsets = split_resume_windows(unique_texts)
+        else:
+            resume_inputs = unique_texts
+        
+        # Generate embeddings (JD and resumes in one batch)
+        jd_embeddings, resume_embeddings = encode_jd_and_resumes(
+            model, [jd_text], resume_inputs, cache=cache
+        )
+        jd_embedding = jd_embeddings[0]
         
         # Validate embedding shapes
         if jd_embedding.shape[0] != 768:
@@ -376,30 +1058,13 @@ def batch_match_for_recruiter(
         
         # Compute similarities
         similarities = compute_similarity(jd_embedding, resume_embeddings)
-        
-        # Rank candidates
-        ranked_candidates = rank_candidates(similarities)
-        
-        # Filter candidates by quality threshold (NO top-K limit)
-        # IMPORTANT: Only candidates with score >= min_score_threshold are returned
-        # Candidates with score < min_score_threshold are FILTERED OUT (not shortlisted)
-        qualified_candidates = _filter_qualified_candidates(ranked_candidates, min_score_threshold)
+        if chunked:
+            similarities = pool_window_scores(similarities, window_offsets, pooling)
         
         # Build results (ONLY qualified candidates meeting threshold, ranked)
-        results = []
-        for rank, (candidate_id, score) in enumerate(qualified_candidates, start=1):
-            results.append({
-                "candidate_id": candidate_id,
-                "score": round(score, 4),
-                "rank": rank,
-                "reason": generate_reason(score)
-            })
-        
-        return {
-            "total_candidates": len(resume_texts),
-            "shortlisted": len(qualified_candidates),  # All qualified candidates
-            "results": results
-        }
+        return _batch_result(
+            similarities, len(resume_texts), min_score_threshold, limit, offset, representative, unique_rows
+        )
         
     except Exception as e:
         raise RuntimeError(f"Error during resume matching: {str(e)}")
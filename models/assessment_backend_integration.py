@@ -3,7 +3,9 @@ Backend Integration Example for Assessment Generator
 Shows how to use the module in backend services (Flask, FastAPI, Spring Boot)
 """
 
-from assessment_generator import generate_assessment, configure_gemini, DIFFICULTY_RANGE
+from assessment_generator import (
+    generate_assessment, configure_gemini, get_generation_stats, AssessmentGenerationError, DIFFICULTY_RANGE
+)
 
 # ============================================================================
 # BACKEND INTEGRATION PATTERNS
@@ -90,6 +92,11 @@ async def generate_assessment_endpoint(config: AssessmentConfig):
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/assessment-stats")
+async def assessment_stats():
+    # Wall-clock latency vs sequential section time, per-section timeouts/failures
+    return get_generation_stats()
 """
 
 # ============================================================================
@@ -113,6 +120,10 @@ def safe_generate_assessment(config: dict, api_key: str) -> dict:
         
     except ValueError as e:
         return {"success": False, "error": f"Invalid configuration: {str(e)}"}
+    except AssessmentGenerationError as e:
+        # Sections are generated concurrently; e.errors names the ones that
+        # failed or timed out, e.partial holds the ones that succeeded
+        return {"success": False, "error": f"Generation failed: {str(e)}", "failed_sections": e.errors}
     except RuntimeError as e:
         return {"success": False, "error": f"Generation failed: {str(e)}"}
     except Exception as e:
@@ -3,12 +3,28 @@ Assessment/Quiz Generator - Model-2B
 Generates MCQs, Subjective (SQL), and Coding (DSA) questions using Gemini API
 
 Standalone module - ready for backend integration
+
+generate_assessment() requests the three sections concurrently (one
+thread per section, each blocking on its own Gemini round trip), so an
+assessment takes about as long as its slowest section instead of the sum
+of all three. Each section has a timeout; failures are reported per
+section (AssessmentGenerationError, or allow_partial=True), and wall-clock
+latency is tracked in get_generation_stats().
 """
 
+from __future__ import annotations
+
 import json
 import os
-from typing import Dict, List, Optional, Tuple
-import google.generativeai as genai
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+# The Gemini SDK is imported where an API model is needed, so callers that
+# pass their own model (tests, offline use) work without it installed
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 # Import DSA Engine
 try:
@@ -44,6 +60,114 @@ EXPERIENCE_DEPTH = {
     }
 }
 
+SECTIONS = ("mcq", "subjective", "coding")
+
+# Seconds a section may take before it is reported as timed out. Sections
+# run concurrently, so this also bounds the latency of generate_assessment()
+SECTION_TIMEOUT_SECONDS = 120.0
+
+
+class AssessmentGenerationError(RuntimeError):
+    """
+    Raised by generate_assessment() when one or more sections fail.
+    
+    Attributes:
+        errors: {section: error message} for the failed sections
+        partial: {section: questions} for the sections that succeeded
+    """
+    
+    def __init__(self, message: str, errors: Dict[str, str], partial: Dict[str, List[Dict]]):
+        super().__init__(message)
+        self.errors = errors
+        self.partial = partial
+
+
+# ============================================================================
+# GENERATION STATS
+# ============================================================================
+
+class GenerationStats:
+    """Thread-safe assessment latency and per-section outcome counters."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.assessments = 0
+            self.partial_failures = 0
+            self.latency_seconds = 0.0
+            self.max_latency_seconds = 0.0
+            self.last_latency_seconds = 0.0
+            self.section_sum_seconds = 0.0
+            self.sections: Dict[str, Dict] = {}
+    
+    def record_section(self, section: str, seconds: float, outcome: str) -> None:
+        """outcome: "ok", "failed" or "timeout"."""
+        with self._lock:
+            entry = self.sections.setdefault(
+                section, {"calls": 0, "failures": 0, "timeouts": 0, "seconds": 0.0, "max_seconds": 0.0}
+            )
+            entry["calls"] += 1
+            entry["failures"] += outcome == "failed"
+            entry["timeouts"] += outcome == "timeout"
+            entry["seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+    
+    def record_assessment(self, seconds: float, section_seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.assessments += 1
+            self.partial_failures += not ok
+            self.latency_seconds += seconds
+            self.max_latency_seconds = max(self.max_latency_seconds, seconds)
+            self.last_latency_seconds = seconds
+            self.section_sum_seconds += section_seconds
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            count = self.assessments
+            return {
+                "assessments": count,
+                "partial_failures": self.partial_failures,
+                "avg_latency_ms": round(1000 * self.latency_seconds / count, 3) if count else 0.0,
+                "max_latency_ms": round(1000 * self.max_latency_seconds, 3),
+                "last_latency_ms": round(1000 * self.last_latency_seconds, 3),
+                # What the same sections would have cost back to back
+                "avg_sequential_ms": round(1000 * self.section_sum_seconds / count, 3) if count else 0.0,
+                "sections": {
+                    section: {
+                        "calls": entry["calls"],
+                        "failures": entry["failures"],
+                        "timeouts": entry["timeouts"],
+                        "avg_ms": round(1000 * entry["seconds"] / entry["calls"], 3),
+                        "max_ms": round(1000 * entry["max_seconds"], 3)
+                    }
+                    for section, entry in self.sections.items()
+                }
+            }
+
+
+_stats = GenerationStats()
+
+
+def get_generation_stats() -> Dict:
+    """
+    Get generate_assessment() latency and per-section outcomes.
+    
+    Returns:
+        Dictionary with assessments, partial_failures, avg_latency_ms,
+        max_latency_ms, last_latency_ms (wall clock), avg_sequential_ms (sum of
+        section times, i.e. the latency without concurrency) and sections
+        ({section: {calls, failures, timeouts, avg_ms, max_ms}})
+    """
+    return _stats.snapshot()
+
+
+def reset_generation_stats() -> None:
+    """Reset the counters reported by get_generation_stats()."""
+    _stats.reset()
+
 
 # ============================================================================
 # GEMINI API CONFIGURATION
@@ -68,6 +192,8 @@ def configure_gemini(api_key: Optional[str] = None) -> None:
             "Set GEMINI_API_KEY environment variable or pass api_key parameter."
         )
     
+    import google.generativeai as genai
+    
     genai.configure(api_key=api_key)
 
 
@@ -81,6 +207,8 @@ def get_available_model() -> Tuple[str, genai.GenerativeModel]:
     Raises:
         RuntimeError: If no suitable model is available
     """
+    import google.generativeai as genai
+    
     try:
         # Try Gemini first (prioritize latest/stable versions)
         models = list(genai.list_models())
@@ -145,6 +273,8 @@ def get_gemini_model(model_name: Optional[str] = None) -> genai.GenerativeModel:
         Configured model instance
     """
     if model_name:
+        import google.generativeai as genai
+        
         return genai.GenerativeModel(model_name)
     else:
         _, model = get_available_model()
@@ -585,7 +715,8 @@ def generate_subjective_questions(
 def generate_coding_questions(
     config: Dict,
     model: genai.GenerativeModel,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    configure: bool = True
 ) -> List[Dict]:
     """
     Generate Coding (DSA) questions using Gemini API.
@@ -593,12 +724,15 @@ def generate_coding_questions(
     Args:
         config: Assessment configuration dictionary
         model: Gemini model instance
-        api_key: Optional API key (if not configured globally)
+        api_key: Optional API key (if not configured globally); also passed
+                 to the DSA engine for test case generation
+        configure: If False, api_key only goes to the DSA engine and the
+                   Gemini SDK is not (re)configured (default: True)
         
     Returns:
         List of coding problem dictionaries
     """
-    if api_key:
+    if api_key and configure:
         configure_gemini(api_key)
     
     coding_config = config["sections"]["coding"]
@@ -709,16 +843,29 @@ def generate_coding_questions(
 # MAIN GENERATION FUNCTION
 # ============================================================================
 
+def _timed_section(func, config: Dict, model, **kwargs) -> Tuple[Optional[List[Dict]], Optional[str], float]:
+    """Run one section generator; returns (questions, error, seconds) instead of raising."""
+    start = time.perf_counter()
+    try:
+        return func(config, model, **kwargs), None, time.perf_counter() - start
+    except Exception as e:
+        return None, str(e), time.perf_counter() - start
+
+
 def generate_assessment(
     config: Dict,
     api_key: Optional[str] = None,
-    model_name: Optional[str] = None
+    model_name: Optional[str] = None,
+    model=None,
+    section_timeout: Optional[float] = SECTION_TIMEOUT_SECONDS,
+    allow_partial: bool = False
 ) -> Dict:
     """
     Main function: Generate complete assessment with all sections.
     
     This function generates MCQs, Subjective (SQL), and Coding (DSA) questions
-    based on recruiter-defined configuration.
+    based on recruiter-defined configuration. The three sections are
+    generated concurrently; latency is recorded in get_generation_stats().
     
     Args:
         config: Assessment configuration dictionary with structure:
@@ -746,6 +893,15 @@ def generate_assessment(
         api_key: Google AI API key (optional, can use GEMINI_API_KEY env var)
         model_name: Model name (e.g., "models/gemini-pro" or "models/text-bison-001")
                     If None, auto-detects available model
+        model: Pre-built model instance, or any object with generate_content()
+               (default: None, built from model_name / auto-detected). With a
+               model, api_key only goes to the DSA engine; the Gemini SDK is
+               neither imported nor configured
+        section_timeout: Seconds each section may take (default: 120.0, None to
+                         wait forever). A timed-out request is abandoned, not
+                         interrupted: its thread finishes in the background
+        allow_partial: If True, failed sections come back as empty lists and are
+                       listed under "errors" instead of raising (default: False)
         
     Returns:
         Dictionary with generated questions in strict JSON format:
@@ -772,12 +928,14 @@ def generate_assessment(
                     "difficulty": str,
                     "estimated_time": int
                 }
-            ]
+            ],
+            "errors": {section: str}  # Only with allow_partial=True
         }
         
     Raises:
         ValueError: If configuration is invalid
-        RuntimeError: If question generation fails
+        AssessmentGenerationError: If any section fails or times out (a
+            RuntimeError carrying .errors and the .partial sections that succeeded)
         
     Example:
         config = {
@@ -807,38 +965,80 @@ def generate_assessment(
     if config["difficulty"] not in DIFFICULTY_RANGE:
         raise ValueError(f"Invalid difficulty: {config['difficulty']}")
     
-    required_sections = ["mcq", "subjective", "coding"]
-    for section in required_sections:
+    for section in SECTIONS:
         if section not in config["sections"]:
             raise ValueError(f"Missing required section: {section}")
     
-    # Configure API
-    configure_gemini(api_key)
+    if section_timeout is not None and (not isinstance(section_timeout, (int, float)) or section_timeout <= 0):
+        raise ValueError("section_timeout must be a positive number or None")
     
-    # Get model (auto-detect if not specified)
-    if model_name:
-        model = genai.GenerativeModel(model_name)
-    else:
-        detected_name, model = get_available_model()
-        # Model auto-detected and ready to use
+    if model is None:
+        # Configure API
+        configure_gemini(api_key)
+        
+        # Get model (auto-detect if not specified)
+        if model_name:
+            model = get_gemini_model(model_name)
+        else:
+            detected_name, model = get_available_model()
+            # Model auto-detected and ready to use
     
-    # Generate questions for each section
+    generators = {
+        "mcq": generate_mcq_questions,
+        "subjective": generate_subjective_questions,
+        "coding": generate_coding_questions
+    }
+    
+    # One thread per section. The API is configured above (or the caller
+    # injected a model), so sections never re-configure it concurrently;
+    # coding gets the key for the DSA engine only
+    section_kwargs = {"coding": {"api_key": api_key, "configure": False}}
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=len(SECTIONS), thread_name_prefix="assessment-section")
     try:
-        mcq_questions = generate_mcq_questions(config, model, api_key)
-        subjective_questions = generate_subjective_questions(config, model, api_key)
-        coding_problems = generate_coding_questions(config, model, api_key)
-        
-        # Build result
-        result = {
-            "mcq": mcq_questions,
-            "subjective": subjective_questions,
-            "coding": coding_problems
+        futures = {
+            section: executor.submit(
+                _timed_section, generators[section], config, model, **section_kwargs.get(section, {})
+            )
+            for section in SECTIONS
         }
-        
-        return result
-        
-    except Exception as e:
-        raise RuntimeError(f"Failed to generate assessment: {str(e)}")
+        wait(futures.values(), timeout=section_timeout)
+    finally:
+        # Do not block on abandoned (timed-out) requests
+        executor.shutdown(wait=False, cancel_futures=True)
+    latency = time.perf_counter() - start
+    
+    result: Dict = {}
+    errors: Dict[str, str] = {}
+    section_seconds = 0.0
+    for section, future in futures.items():
+        if not future.done():
+            future.cancel()
+            _stats.record_section(section, latency, "timeout")
+            section_seconds += latency
+            errors[section] = f"Timed out after {section_timeout}s"
+            continue
+        questions, error, seconds = future.result()
+        section_seconds += seconds
+        _stats.record_section(section, seconds, "ok" if error is None else "failed")
+        if error is None:
+            result[section] = questions
+        else:
+            errors[section] = error
+    
+    _stats.record_assessment(latency, section_seconds, ok=not errors)
+    
+    if errors and not allow_partial:
+        details = "; ".join(f"{section}: {message}" for section, message in errors.items())
+        raise AssessmentGenerationError(f"Failed to generate assessment: {details}", errors, result)
+    
+    if allow_partial:
+        for section in errors:
+            result[section] = []
+        result = {section: result[section] for section in SECTIONS}
+        result["errors"] = errors
+    
+    return result
 
 
 if __name__ == "__main__":
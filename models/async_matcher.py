@@ -0,0 +1,458 @@
+"""
+Async Matcher - asyncio-native variants of the matching API for FastAPI
+Keeps the MPNet forward pass off the event loop
+
+evaluate_application() and batch_match_for_recruiter() are blocking: called
+directly from an `async def` endpoint they stall the event loop for the whole
+encode. AsyncMatcher runs them on a bounded thread pool instead and adds:
+- A concurrency limit (requests beyond it wait on a semaphore)
+- Load shedding once too many requests are waiting (MatcherOverloadedError)
+- Per-call timeouts and cancellation
+- Large batches encoded in chunks, so one big recruiter batch interleaves
+  with Apply requests instead of occupying a worker for its whole duration,
+  and a cancelled/timed-out batch stops after its current chunk
+- Backpressure metrics via stats()
+
+Usage (FastAPI):
+    matcher = AsyncMatcher(model=load_model(), max_workers=2, max_concurrency=8)
+
+    @app.post("/api/candidate/apply")
+    async def candidate_apply(request: ApplicationRequest):
+        return await matcher.evaluate_application(
+            request.jd_text, request.resume_text, request.min_score_threshold, timeout=10.0
+        )
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import (
+        SUPPORTED_POOLING, _batch_result, _dedupe_resumes, _resolve_model, batch_match_for_recruiter,
+        compute_similarity, evaluate_application, generate_embeddings, pool_window_scores,
+        split_resume_windows
+    )
+    from .embedding_cache import EmbeddingCache
+except ImportError:
+    from ai_resume_matcher import (
+        SUPPORTED_POOLING, _batch_result, _dedupe_resumes, _resolve_model, batch_match_for_recruiter,
+        compute_similarity, evaluate_application, generate_embeddings, pool_window_scores,
+        split_resume_windows
+    )
+    from embedding_cache import EmbeddingCache
+
+
+class MatcherOverloadedError(RuntimeError):
+    """Raised when too many requests are already waiting (map to HTTP 503)."""
+
+
+class AsyncMatcher:
+    """
+    Bounded, asyncio-native front end for the resume matcher.
+
+    Example:
+        matcher = AsyncMatcher(model=load_model(), max_workers=2, max_concurrency=8, max_waiting=64)
+        result = await matcher.batch_match_for_recruiter(jd, resumes, 0.6, timeout=30.0)
+        print(matcher.stats())
+        matcher.shutdown()
+    """
+
+    def __init__(
+        self,
+        model=None,
+        max_workers: int = 2,
+        max_concurrency: int = 8,
+        max_waiting: Optional[int] = 64,
+        chunk_size: int = 256,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Args:
+            model: Optional pre-loaded model instance (default: cached model / running coalescer)
+            max_workers: Threads running encodes (default: 2)
+            max_concurrency: Requests admitted at once; the rest wait (default: 8)
+            max_waiting: Requests allowed to wait before new ones are rejected
+                         (default: 64, None for unbounded)
+            chunk_size: Resumes encoded per executor job in batch matching (default: 256)
+            cache: Optional EmbeddingCache passed to every call (default: None)
+
+        Raises:
+            ValueError: If any limit is invalid
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        if max_waiting is not None and (not isinstance(max_waiting, int) or max_waiting < 0):
+            raise ValueError("max_waiting must be a non-negative integer or None")
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        self.model = model
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.max_waiting = max_waiting
+        self.chunk_size = chunk_size
+        self.cache = cache
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-matcher")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.executor_queued = 0
+        self.max_waiting_seen = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self._admitted = 0
+        self._wait_ms_total = 0.0
+        self._latency_ms_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def evaluate_application(
+        self,
+        jd_text: str,
+        resume_text: str,
+        min_score_threshold: float,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Async evaluate_application(); same arguments and result format.
+
+        Args:
+            jd_text: Job description text
+            resume_text: Candidate resume text
+            min_score_threshold: Minimum similarity score required
+            timeout: Seconds before asyncio.TimeoutError, including time spent
+                     waiting for a slot (default: None, no timeout)
+            **kwargs: Passed to evaluate_application() (job_id, chunked, pooling, ...)
+
+        Raises:
+            ValueError: If inputs are invalid
+            RuntimeError: If processing fails
+            MatcherOverloadedError: If too many requests are already waiting
+            asyncio.TimeoutError: If timeout elapses
+        """
+        kwargs.setdefault("model", self.model)
+        kwargs.setdefault("cache", self.cache)
+
+        return await self._admit(
+            lambda: self._run_blocking(
+                evaluate_application, jd_text, resume_text, min_score_threshold, **kwargs
+            ),
+            timeout
+        )
+
+    async def batch_match_for_recruiter(
+        self,
+        jd_text: str,
+        resume_texts: List[str],
+        min_score_threshold: float = 0.50,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        chunked: bool = False,
+        pooling: str = "max",
+        dedupe: bool = False,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Async batch_match_for_recruiter(); same arguments and result format.
+
+        Batches up to chunk_size resumes run as one executor job; larger ones
+        are encoded chunk by chunk so other requests can use the workers in
+        between. On cancellation or timeout no further chunks are started.
+        All CPU work (near-duplicate pass, windowing, scoring, pooling and
+        ranking) runs on the executor, never on the event loop.
+
+        Args:
+            jd_text: Job description text
+            resume_texts: List of resume texts
+            min_score_threshold: Minimum similarity score required (default: 0.50)
+            limit: Maximum number of results returned (default: None, all qualified)
+            offset: Number of top-ranked qualified candidates to skip (default: 0)
+            chunked: Score long resumes by sliding windows (default: False)
+            pooling: Window score aggregation, "max" or "mean" (default: "max")
+            dedupe: Encode each group of near-duplicate resumes once (default: False)
+            timeout: Seconds before asyncio.TimeoutError (default: None, no timeout)
+
+        Raises:
+            ValueError: If inputs are invalid
+            RuntimeError: If processing fails
+            MatcherOverloadedError: If too many requests are already waiting
+            asyncio.TimeoutError: If timeout elapses
+        """
+        if isinstance(resume_texts, list) and len(resume_texts) <= self.chunk_size:
+            return await self._admit(
+                lambda: self._run_blocking(
+                    batch_match_for_recruiter, jd_text, resume_texts, min_score_threshold,
+                    model=self.model, cache=self.cache, limit=limit, offset=offset,
+                    chunked=chunked, pooling=pooling, dedupe=dedupe
+                ),
+                timeout
+            )
+
+        return await self._admit(
+            lambda: self._chunked_batch_match(
+                jd_text, resume_texts, min_score_threshold, limit, offset, chunked, pooling, dedupe
+            ),
+            timeout
+        )
+
+    def stats(self) -> Dict:
+        """
+        Get backpressure metrics.
+
+        Returns:
+            Dictionary with waiting, in_flight, executor_queued, max_waiting_seen,
+            completed, failed, timed_out, cancelled, rejected, avg_wait_ms
+            (time spent waiting for a slot) and avg_latency_ms (admitted to done)
+        """
+        with self._lock:
+            finished = self._admitted - self.in_flight
+            return {
+                "waiting": self.waiting,
+                "in_flight": self.in_flight,
+                "executor_queued": self.executor_queued,
+                "max_waiting_seen": self.max_waiting_seen,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "cancelled": self.cancelled,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self._wait_ms_total / max(self._admitted, 1), 2),
+                "avg_latency_ms": round(self._latency_ms_total / max(finished, 1), 2),
+                "max_concurrency": self.max_concurrency,
+                "max_workers": self.max_workers
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the executor. Encodes already running are allowed to finish.
+
+        Args:
+            wait: If True, block until worker threads exit (default: True)
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Admission, timeouts and executor
+    # ------------------------------------------------------------------
+
+    async def _admit(self, make_work: Callable[[], Any], timeout: Optional[float]) -> Any:
+        """Apply load shedding, then run make_work() under the semaphore and timeout."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        with self._lock:
+            if self.max_waiting is not None and self._semaphore.locked() and self.waiting >= self.max_waiting:
+                self.rejected += 1
+                raise MatcherOverloadedError(
+                    f"Matcher overloaded: {self.waiting} requests waiting (max_waiting={self.max_waiting})"
+                )
+            self.waiting += 1
+            self.max_waiting_seen = max(self.max_waiting_seen, self.waiting)
+
+        try:
+            return await asyncio.wait_for(self._guarded(make_work), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise
+        except asyncio.CancelledError:
+            with self._lock:
+                self.cancelled += 1
+            raise
+
+    async def _guarded(self, make_work: Callable[[], Any]) -> Any:
+        queued_at = time.perf_counter()
+        admitted = False
+        try:
+            async with self._semaphore:
+                admitted_at = time.perf_counter()
+                with self._lock:
+                    self.waiting -= 1
+                    self.in_flight += 1
+                    self._admitted += 1
+                    self._wait_ms_total += (admitted_at - queued_at) * 1000
+                admitted = True
+
+                try:
+                    result = await make_work()
+                except Exception:
+                    with self._lock:
+                        self.failed += 1
+                    raise
+                else:
+                    with self._lock:
+                        self.completed += 1
+                    return result
+                finally:
+                    with self._lock:
+                        self.in_flight -= 1
+                        self._latency_ms_total += (time.perf_counter() - admitted_at) * 1000
+        finally:
+            if not admitted:
+                with self._lock:
+                    self.waiting -= 1
+
+    async def _run_blocking(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the bounded executor."""
+        with self._lock:
+            self.executor_queued += 1
+
+        def call():
+            with self._lock:
+                self.executor_queued -= 1
+            return fn(*args, **kwargs)
+
+        future = self._executor.submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Not started yet: drop it so the slot goes to someone else
+            if future.cancel():
+                with self._lock:
+                    self.executor_queued -= 1
+            raise
+
+    async def _chunked_batch_match(
+        self,
+        jd_text: str,
+        resume_texts: List[str],
+        min_score_threshold: float,
+        limit: Optional[int],
+        offset: int,
+        chunked: bool,
+        pooling: str,
+        dedupe: bool
+    ) -> Dict:
+        """batch_match_for_recruiter() with one executor job per chunk of resumes."""
+        # Same validation as the blocking API
+        if not jd_text or not isinstance(jd_text, str):
+            raise ValueError("jd_text must be a non-empty string")
+
+        if not resume_texts or not isinstance(resume_texts, list):
+            raise ValueError("resume_texts must be a non-empty list")
+
+        if not all(isinstance(r, str) and r.strip() for r in resume_texts):
+            raise ValueError("All resume_texts must be non-empty strings")
+
+        if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
+            raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
+
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise ValueError("limit must be a non-negative integer")
+
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+
+        if pooling not in SUPPORTED_POOLING:
+            raise ValueError(f"pooling must be one of {SUPPORTED_POOLING}")
+
+        model = await self._run_blocking(_resolve_model, self.model)
+
+        def prepare():
+            if dedupe:
+                unique_texts, representative, unique_rows = _dedupe_resumes(resume_texts)
+            else:
+                unique_texts, representative, unique_rows = resume_texts, None, None
+            if chunked:
+                resume_inputs, window_offsets = split_resume_windows(unique_texts)
+            else:
+                resume_inputs, window_offsets = unique_texts, None
+            return resume_inputs, window_offsets, representative, unique_rows
+
+        def score_chunk(jd_embedding, texts):
+            return compute_similarity(jd_embedding, generate_embeddings(model, texts, self.cache))
+
+        def finish(score_chunks, window_offsets, representative, unique_rows):
+            similarities = np.concatenate(score_chunks)
+            if chunked:
+                similarities = pool_window_scores(similarities, window_offsets, pooling)
+            return _batch_result(
+                similarities, len(resume_texts), min_score_threshold, limit, offset, representative, unique_rows
+            )
+
+        try:
+            resume_inputs, window_offsets, representative, unique_rows = await self._run_blocking(prepare)
+
+            jd_embedding = (await self._run_blocking(generate_embeddings, model, [jd_text], self.cache))[0]
+
+            score_chunks = []
+            for start in range(0, len(resume_inputs), self.chunk_size):
+                score_chunks.append(
+                    await self._run_blocking(score_chunk, jd_embedding, resume_inputs[start:start + self.chunk_size])
+                )
+
+            return await self._run_blocking(finish, score_chunks, window_offsets, representative, unique_rows)
+
+        except Exception as e:
+            raise RuntimeError(f"Error during resume matching: {str(e)}")
+
+
+# ============================================================================
+# DEFAULT INSTANCE
+# ============================================================================
+
+_default_matcher: Optional[AsyncMatcher] = None
+_default_lock = threading.Lock()
+
+
+def get_async_matcher(**kwargs) -> AsyncMatcher:
+    """
+    Get the process-wide AsyncMatcher, creating it on first use.
+
+    Args:
+        **kwargs: AsyncMatcher arguments, only used when the instance is created
+
+    Returns:
+        Shared AsyncMatcher
+    """
+    global _default_matcher
+
+    with _default_lock:
+        if _default_matcher is None:
+            _default_matcher = AsyncMatcher(**kwargs)
+        return _default_matcher
+
+
+async def evaluate_application_async(
+    jd_text: str,
+    resume_text: str,
+    min_score_threshold: float,
+    timeout: Optional[float] = None,
+    **kwargs
+) -> Dict:
+    """Async evaluate_application() on the shared AsyncMatcher."""
+    return await get_async_matcher().evaluate_application(
+        jd_text, resume_text, min_score_threshold, timeout=timeout, **kwargs
+    )
+
+
+async def batch_match_for_recruiter_async(
+    jd_text: str,
+    resume_texts: List[str],
+    min_score_threshold: float = 0.50,
+    timeout: Optional[float] = None,
+    **kwargs
+) -> Dict:
+    """Async batch_match_for_recruiter() on the shared AsyncMatcher."""
+    return await get_async_matcher().batch_match_for_recruiter(
+        jd_text, resume_texts, min_score_threshold, timeout=timeout, **kwargs
+    )
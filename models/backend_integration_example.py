@@ -117,12 +117,17 @@ def match_resumes_endpoint():
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List
-from ai_resume_matcher import load_model, match_resumes
+import asyncio
+from ai_resume_matcher import load_model
+from async_matcher import AsyncMatcher, MatcherOverloadedError
 
 app = FastAPI()
 
-# Load model once at startup
+# Load model once at startup; encoding runs on a bounded thread pool so it
+# never blocks the event loop (do NOT call batch_match_for_recruiter directly
+# from an async endpoint)
 model = load_model()
+matcher = AsyncMatcher(model=model, max_workers=2, max_concurrency=8, max_waiting=64)
 
 class MatchRequest(BaseModel):
     jd_text: str
@@ -134,15 +139,24 @@ async def match_resumes_endpoint(request: MatchRequest):
     try:
         # IMPORTANT: min_score_threshold ensures only qualified candidates
         # Returns ALL qualified candidates (NO top-K limit)
-        result = batch_match_for_recruiter(
+        result = await matcher.batch_match_for_recruiter(
             request.jd_text, 
             request.resume_texts, 
             min_score_threshold=request.min_score_threshold,
-            model=model
+            timeout=60.0
         )
         return result
+    except MatcherOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Matching timed out")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/matcher-stats")
+async def matcher_stats():
+    # Backpressure metrics: waiting, in_flight, rejected, timed_out, avg_wait_ms, ...
+    return matcher.stats()
 """
 
 # ============================================================================
@@ -260,10 +274,13 @@ def candidate_apply():
 """
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from ai_resume_matcher import load_model, check_candidate_application
+import asyncio
+from ai_resume_matcher import load_model
+from async_matcher import AsyncMatcher, MatcherOverloadedError
 
 app = FastAPI()
 model = load_model()
+matcher = AsyncMatcher(model=model)
 
 class ApplicationRequest(BaseModel):
     jd_text: str
@@ -273,18 +290,41 @@ class ApplicationRequest(BaseModel):
 @app.post("/api/candidate/apply")
 async def candidate_apply(request: ApplicationRequest):
     try:
-        # PRIMARY: Evaluate application (for Apply button)
-        result = evaluate_application(
+        # PRIMARY: Evaluate application (for Apply button), off the event loop
+        result = await matcher.evaluate_application(
             request.jd_text,
             request.resume_text,
             request.min_score_threshold,
-            model=model
+            timeout=10.0
         )
         return result
+    except MatcherOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Evaluation timed out")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 """
 
+# FastAPI example for resume PDF upload (no temp file on disk):
+"""
+from fastapi import FastAPI, File, HTTPException, UploadFile
+import asyncio
+from pdf_to_text import extract_resume_text
+
+@app.post("/api/candidate/upload-resume")
+async def upload_resume(file: UploadFile = File(...)):
+    data = await file.read()
+    try:
+        # Request body straight to text; parsing is CPU-bound, keep it off the event loop
+        text = await asyncio.to_thread(extract_resume_text, data, strategy="fast")
+    except ValueError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"resume_text": text}
+"""
+
 # ============================================================================
 # PERFORMANCE TIPS FOR BACKEND
 # ============================================================================
@@ -295,7 +335,8 @@ async def candidate_apply(request: ApplicationRequest):
 3. Batch process multiple resumes together (already implemented)
 4. Handle errors gracefully with try-catch
 5. Validate inputs before calling match_resumes()
-6. Consider async processing for large batches
+6. In async frameworks (FastAPI) use async_matcher.AsyncMatcher, never the
+   blocking functions directly inside `async def` endpoints
 7. Monitor memory usage (model is ~420MB in memory)
 """
 
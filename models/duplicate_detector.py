@@ -0,0 +1,285 @@
+"""
+Duplicate Detector - Near-duplicate / mass-application resume detection
+MinHash signatures + LSH banding over clean_text() output
+
+Comparing every resume with every other is O(N^2). Each resume instead
+gets a MinHash signature of its word shingles; signatures are split into
+bands and hashed into buckets, so near-identical resumes collide in at
+least one bucket with high probability while unrelated ones almost never
+do. Lookups only verify the handful of bucket candidates, so both the
+Apply-path check and the bulk dedup pass are sub-linear per resume.
+
+Usage (Apply path):
+    detector = DuplicateDetector(threshold=0.8)
+    duplicates = detector.check_and_add(application_id, resume_text)
+    if duplicates:
+        flag_for_review(application_id, duplicates)   # [(other_id, similarity), ...]
+
+Usage (bulk, before scoring):
+    groups = find_near_duplicates(resume_texts)       # representative index per resume
+    result = batch_match_for_recruiter(jd_text, resume_texts, dedupe=True)
+"""
+
+import threading
+import zlib
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import clean_text
+except ImportError:
+    from ai_resume_matcher import clean_text
+
+# Mersenne prime 2^31 - 1: a * x (x < 2^32, a < 2^31) stays below 2^63 in uint64
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+DEFAULT_THRESHOLD = 0.80
+
+
+class DuplicateDetector:
+    """
+    MinHash/LSH index of resume texts.
+
+    With the defaults (128 permutations, 16 bands x 8 rows) two resumes with
+    Jaccard similarity 0.8 share a bucket with probability > 0.99, while pairs
+    below ~0.5 almost never do. Candidates are then verified against
+    threshold using the estimated Jaccard similarity.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Args:
+            threshold: Estimated Jaccard similarity counted as a duplicate (default: 0.80)
+            num_perm: Number of MinHash permutations (default: 128)
+            bands: LSH bands; num_perm must be divisible by bands (default: 16)
+            shingle_size: Words per shingle (default: 3)
+            seed: Seed for the permutations; keep it fixed for persisted signatures (default: 1)
+
+        Raises:
+            ValueError: If arguments are invalid
+        """
+        if not isinstance(threshold, (int, float)) or threshold < 0.0 or threshold > 1.0:
+            raise ValueError("threshold must be a float between 0.0 and 1.0")
+
+        if not isinstance(num_perm, int) or num_perm < 1:
+            raise ValueError("num_perm must be a positive integer")
+
+        if not isinstance(bands, int) or bands < 1 or num_perm % bands:
+            raise ValueError("bands must be a positive integer dividing num_perm")
+
+        if not isinstance(shingle_size, int) or shingle_size < 1:
+            raise ValueError("shingle_size must be a positive integer")
+
+        self.threshold = float(threshold)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), num_perm, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+
+        self.queries = 0
+        self.candidates_checked = 0
+        self.duplicates_found = 0
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """32-bit hashes of the word shingles of a text."""
+        words = clean_text(text).lower().split()
+        k = self.shingle_size
+        if len(words) <= k:
+            grams = [" ".join(words)]
+        else:
+            grams = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+        return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        MinHash signature of a text.
+
+        Args:
+            text: Resume text (raw; cleaned internally)
+
+        Returns:
+            uint32 array of shape (num_perm,)
+        """
+        shingles = self._shingles(text)
+        # (num_perm x shingles) universal hashes, minimum per permutation
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(signature_a == signature_b))
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def add(self, doc_id: Hashable, text: str, signature: Optional[np.ndarray] = None) -> None:
+        """
+        Index a resume (replaces an existing entry with the same id).
+
+        Args:
+            doc_id: Application / resume id
+            text: Resume text
+            signature: Precomputed signature (default: computed from text)
+        """
+        signature = self.signature(text) if signature is None else signature
+        with self._lock:
+            if doc_id in self._signatures:
+                self._remove(doc_id)
+            self._signatures[doc_id] = signature
+            for band, key in zip(self._buckets, self._band_keys(signature)):
+                band.setdefault(key, set()).add(doc_id)
+
+    def remove(self, doc_id: Hashable) -> bool:
+        """
+        Remove a resume from the index.
+
+        Returns:
+            True if the id was indexed
+        """
+        with self._lock:
+            if doc_id not in self._signatures:
+                return False
+            self._remove(doc_id)
+            return True
+
+    def _remove(self, doc_id: Hashable) -> None:
+        signature = self._signatures.pop(doc_id)
+        for band, key in zip(self._buckets, self._band_keys(signature)):
+            members = band.get(key)
+            if members is not None:
+                members.discard(doc_id)
+                if not members:
+                    del band[key]
+
+    def query(
+        self,
+        text: str,
+        exclude_id: Optional[Hashable] = None,
+        signature: Optional[np.ndarray] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Indexed resumes near-identical to a text.
+
+        Args:
+            text: Resume text
+            exclude_id: Id to leave out of the results (e.g. the resume itself)
+            signature: Precomputed signature (default: computed from text)
+
+        Returns:
+            List of (doc_id, estimated_similarity) >= threshold, most similar first
+        """
+        signature = self.signature(text) if signature is None else signature
+        with self._lock:
+            candidates = set()
+            for band, key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(band.get(key, ()))
+            candidates.discard(exclude_id)
+
+            matches = []
+            for doc_id in candidates:
+                score = self.similarity(signature, self._signatures[doc_id])
+                if score >= self.threshold:
+                    matches.append((doc_id, round(score, 4)))
+
+            self.queries += 1
+            self.candidates_checked += len(candidates)
+            self.duplicates_found += len(matches)
+
+        matches.sort(key=lambda x: x[1], reverse=True)
+        return matches
+
+    def check_and_add(self, doc_id: Hashable, text: str) -> List[Tuple[Hashable, float]]:
+        """
+        Apply-path helper: report near-duplicates already indexed, then index this resume.
+
+        Args:
+            doc_id: Application / resume id
+            text: Resume text
+
+        Returns:
+            List of (doc_id, estimated_similarity) of earlier near-duplicates
+        """
+        signature = self.signature(text)
+        matches = self.query(text, exclude_id=doc_id, signature=signature)
+        self.add(doc_id, text, signature=signature)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._signatures
+
+    def stats(self) -> Dict:
+        """
+        Get detector counters.
+
+        Returns:
+            Dictionary with indexed, queries, candidates_checked,
+            avg_candidates_per_query and duplicates_found
+        """
+        with self._lock:
+            return {
+                "indexed": len(self._signatures),
+                "queries": self.queries,
+                "candidates_checked": self.candidates_checked,
+                "avg_candidates_per_query": round(self.candidates_checked / self.queries, 2) if self.queries else 0.0,
+                "duplicates_found": self.duplicates_found
+            }
+
+
+def find_near_duplicates(
+    texts: List[str],
+    threshold: float = DEFAULT_THRESHOLD,
+    **kwargs
+) -> np.ndarray:
+    """
+    Bulk dedup pass: map every text to a representative near-duplicate.
+
+    Args:
+        texts: Resume texts
+        threshold: Estimated Jaccard similarity counted as a duplicate (default: 0.80)
+        **kwargs: Other DuplicateDetector arguments (num_perm, bands, shingle_size)
+
+    Returns:
+        int array `representative` of len(texts): representative[i] == i for a
+        representative (first occurrence), otherwise the index of the earlier
+        representative it duplicates
+    """
+    detector = DuplicateDetector(threshold=threshold, **kwargs)
+
+    representative = np.arange(len(texts))
+    for i, text in enumerate(texts):
+        signature = detector.signature(text)
+        matches = detector.query(text, signature=signature)
+        if matches:
+            # Only representatives are indexed, so groups never chain
+            representative[i] = matches[0][0]
+        else:
+            detector.add(i, text, signature=signature)
+    return representative
@@ -0,0 +1,230 @@
+"""
+Embedding Cache - Content-hash keyed store for MPNet embeddings
+Avoids re-encoding resumes and job descriptions that were already seen
+
+Layout:
+- In-memory LRU (float32) in front of
+- Optional on-disk store (one .npy file per text, float32 or float16)
+
+Keys are SHA-256 hashes of the model version tag and the cleaned text, so
+the same resume re-scored against a different threshold (or the same JD hit
+by many applicants) costs a hash lookup instead of a transformer forward
+pass, while vectors from another model or backend are never served.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+SUPPORTED_DISK_DTYPES = ("float32", "float16")
+
+
+def text_hash(text: str) -> str:
+    """
+    Compute the cache key for a (cleaned) text.
+
+    Args:
+        text: Text string, already normalized with clean_text()
+
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-level embedding cache: in-memory LRU backed by an optional disk store.
+
+    Memory entries are evicted least-recently-used once max_entries is
+    exceeded. Evicted entries stay on disk (if disk_dir is set) and are
+    promoted back into memory on the next hit.
+
+    Example:
+        cache = EmbeddingCache(max_entries=50000, disk_dir="/var/cache/embeddings")
+        embeddings = generate_embeddings(model, resumes, cache=cache)
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        disk_dir: Optional[str] = None,
+        disk_dtype: str = "float16",
+        model_version: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: Maximum number of embeddings kept in memory (default: 10000)
+            disk_dir: Directory for the persistent store (default: None, memory only)
+            disk_dtype: Storage dtype on disk, "float16" or "float32" (default: "float16")
+            model_version: Embedding version tag (see get_model_version()). Keys are
+                           namespaced by it, so entries written under another model
+                           are never returned (default: None, untagged)
+
+        Raises:
+            ValueError: If max_entries or disk_dtype is invalid
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        if disk_dtype not in SUPPORTED_DISK_DTYPES:
+            raise ValueError(f"disk_dtype must be one of {SUPPORTED_DISK_DTYPES}")
+
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_dtype = disk_dtype
+        self.model_version = model_version
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _key(self, text: str, model_version: Optional[str] = None) -> str:
+        if model_version is None:
+            model_version = self.model_version
+        if model_version is None:
+            return text_hash(text)
+        return text_hash(f"{model_version}\n{text}")
+
+    def set_model_version(self, model_version: Optional[str]) -> None:
+        """
+        Switch to another embedding version. Memory entries are dropped;
+        disk entries of the old version are kept but no longer read.
+
+        Args:
+            model_version: New version tag (see get_model_version())
+        """
+        with self._lock:
+            if model_version != self.model_version:
+                self.model_version = model_version
+                self._memory.clear()
+
+    def _disk_path(self, key: str) -> str:
+        # Shard by the first two hex chars to keep directories small
+        return os.path.join(self.disk_dir, key[:2], f"{key}.npy")
+
+    def _remember(self, key: str, embedding: np.ndarray) -> None:
+        """Insert into the memory LRU, evicting the oldest entries if needed (lock held)."""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, text: str, model_version: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        Look up the embedding for a cleaned text.
+
+        Args:
+            text: Cleaned text string
+            model_version: Version tag of the model asking (default: None, the
+                           cache's own model_version)
+
+        Returns:
+            float32 embedding of shape (768,), or None on a miss
+        """
+        key = self._key(text, model_version)
+
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                try:
+                    embedding = np.load(path).astype(np.float32)
+                except (OSError, ValueError):
+                    embedding = None  # Corrupt/partial file - treat as a miss
+                if embedding is not None:
+                    with self._lock:
+                        self._remember(key, embedding)
+                        self.hits += 1
+                        self.disk_hits += 1
+                    return embedding
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, text: str, embedding: np.ndarray, model_version: Optional[str] = None) -> None:
+        """
+        Store the embedding for a cleaned text.
+
+        Args:
+            text: Cleaned text string
+            embedding: Embedding of shape (768,)
+            model_version: Version tag of the model that produced it (default:
+                           None, the cache's own model_version)
+        """
+        key = self._key(text, model_version)
+        embedding = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            self._remember(key, embedding)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write to a temp file first so readers never see a partial array
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, embedding.astype(self.disk_dtype))
+                os.replace(tmp_path, path)
+
+    def clear(self, include_disk: bool = False) -> None:
+        """
+        Drop all in-memory entries and reset counters.
+
+        Args:
+            include_disk: If True, also delete the on-disk store (default: False)
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+        if include_disk and self.disk_dir:
+            for root, _, files in os.walk(self.disk_dir):
+                for name in files:
+                    if name.endswith(".npy"):
+                        os.remove(os.path.join(root, name))
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, disk_hits, misses, evictions, hit_rate,
+            memory_entries, max_entries and model_version
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "model_version": self.model_version
+            }
@@ -0,0 +1,264 @@
+"""
+Embedding Worker Pool - Multi-process MPNet encoding for bulk scoring
+Shards resumes across N worker processes, each holding its own model
+
+A single in-process model can only use the intra-op threads of one PyTorch
+instance. The pool runs N spawned workers (each with threads_per_worker
+intra-op threads) and returns embeddings through one shared-memory block,
+so 768-float rows are written in place instead of pickled back.
+
+Drop-in: exposes encode() with the SentenceTransformer signature, so a pool
+can be passed as model= to batch_match_for_recruiter().
+
+Usage:
+    with EmbeddingWorkerPool(num_workers=4) as pool:
+        result = batch_match_for_recruiter(jd_text, resume_texts, model=pool)
+
+    result = bulk_score(jd_text, resume_texts, num_workers=8)
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+EMBEDDING_DIM = 768
+
+# Per-worker model, created once by _worker_init()
+_worker_model = None
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to the parent's block. Spawned workers share the parent's resource
+    tracker, so the block is unlinked exactly once, by the parent.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_init(backend: Optional[str], threads_per_worker: int) -> None:
+    """Load the model once per worker process."""
+    global _worker_model
+
+    try:
+        import torch
+        torch.set_num_threads(threads_per_worker)
+    except ImportError:
+        pass
+
+    try:
+        from .ai_resume_matcher import load_model
+    except ImportError:
+        from ai_resume_matcher import load_model
+    _worker_model = load_model(backend=backend)
+
+
+def _worker_encode(shm_name: str, total: int, start: int, texts: List[str]) -> int:
+    """Encode one shard and write it into rows [start, start + len(texts)) of the shared block."""
+    embeddings = _worker_model.encode(
+        texts,
+        batch_size=32,
+        show_progress_bar=False,
+        normalize_embeddings=True
+    )
+
+    shm = _attach_shared_memory(shm_name)
+    try:
+        out = np.ndarray((total, EMBEDDING_DIM), dtype=np.float32, buffer=shm.buf)
+        out[start:start + len(texts)] = embeddings
+        del out  # Release the buffer export before close()
+    finally:
+        shm.close()
+    return len(texts)
+
+
+class EmbeddingWorkerPool:
+    """
+    Process pool of MPNet encoders with shared-memory result transfer.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        backend: Optional[str] = None,
+        shard_size: int = 256,
+        threads_per_worker: Optional[int] = None
+    ):
+        """
+        Args:
+            num_workers: Number of worker processes (default: CPU count)
+            backend: Inference backend passed to load_model() in each worker (default: "torch")
+            shard_size: Texts per task sent to a worker (default: 256)
+            threads_per_worker: Intra-op threads per worker (default: CPU count // num_workers)
+
+        Raises:
+            ValueError: If num_workers or shard_size is invalid
+        """
+        cpu_count = os.cpu_count() or 1
+        num_workers = num_workers or cpu_count
+
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+
+        if not isinstance(shard_size, int) or shard_size < 1:
+            raise ValueError("shard_size must be a positive integer")
+
+        self.num_workers = num_workers
+        self.backend = backend
+        self.shard_size = shard_size
+        self.threads_per_worker = threads_per_worker or max(1, cpu_count // num_workers)
+
+        # spawn: forking a process that already holds torch/OpenMP state is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_worker_init,
+            initargs=(backend, self.threads_per_worker)
+        )
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.texts_encoded = 0
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        SentenceTransformer-compatible encode, sharded across the workers.
+        batch_size and show_progress_bar are accepted for compatibility and ignored.
+
+        Returns:
+            numpy array of shape (len(sentences), 768)
+
+        Raises:
+            ValueError: If normalize_embeddings is False (workers always normalize)
+            RuntimeError: If a worker fails
+        """
+        if not normalize_embeddings:
+            raise ValueError("EmbeddingWorkerPool only produces normalized embeddings")
+
+        texts = list(sentences)
+        total = len(texts)
+        if total == 0:
+            return np.array([]).reshape(0, EMBEDDING_DIM)
+
+        # Spread small batches across all workers instead of one shard
+        shard = max(1, min(self.shard_size, -(-total // self.num_workers)))
+
+        shm = shared_memory.SharedMemory(create=True, size=total * EMBEDDING_DIM * 4)
+        try:
+            futures = [
+                self._executor.submit(_worker_encode, shm.name, total, start, texts[start:start + shard])
+                for start in range(0, total, shard)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception as e:
+                for future in futures:
+                    future.cancel()
+                raise RuntimeError(f"Embedding worker failed: {str(e)}")
+
+            view = np.ndarray((total, EMBEDDING_DIM), dtype=np.float32, buffer=shm.buf)
+            embeddings = view.copy()
+            del view
+        finally:
+            shm.close()
+            shm.unlink()
+
+        with self._lock:
+            self.calls += 1
+            self.texts_encoded += total
+        return embeddings
+
+    @property
+    def model_version(self) -> str:
+        """Embedding version tag of the worker models (see get_model_version())."""
+        try:
+            from .ai_resume_matcher import MODEL_NAME
+        except ImportError:
+            from ai_resume_matcher import MODEL_NAME
+        return f"{MODEL_NAME}:{self.backend or 'torch'}"
+
+    def warm_up(self) -> None:
+        """Force every worker to load its model (first encode is otherwise slow)."""
+        self.encode(["warm up"] * self.num_workers)
+
+    def stats(self) -> Dict:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with num_workers, threads_per_worker, calls and texts_encoded
+        """
+        with self._lock:
+            return {
+                "num_workers": self.num_workers,
+                "threads_per_worker": self.threads_per_worker,
+                "calls": self.calls,
+                "texts_encoded": self.texts_encoded
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "EmbeddingWorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+def bulk_score(
+    jd_text: str,
+    resume_texts: List[str],
+    min_score_threshold: float = 0.50,
+    num_workers: Optional[int] = None,
+    backend: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Dict:
+    """
+    Standalone bulk-scoring API: batch_match_for_recruiter() on a temporary worker pool.
+
+    For repeated jobs keep a long-lived EmbeddingWorkerPool and pass it as
+    model= instead; starting workers costs one model load per process.
+
+    Args:
+        jd_text: Job description text
+        resume_texts: List of resume texts
+        min_score_threshold: Minimum similarity score required (default: 0.50)
+        num_workers: Number of worker processes (default: CPU count)
+        backend: Inference backend for the workers (default: "torch")
+        limit: Optional page size (default: None, all qualified)
+        offset: Number of top-ranked candidates to skip when paging (default: 0)
+
+    Returns:
+        Same format as batch_match_for_recruiter()
+    """
+    try:
+        from .ai_resume_matcher import batch_match_for_recruiter
+    except ImportError:
+        from ai_resume_matcher import batch_match_for_recruiter
+
+    with EmbeddingWorkerPool(num_workers=num_workers, backend=backend) as pool:
+        return batch_match_for_recruiter(
+            jd_text,
+            resume_texts,
+            min_score_threshold=min_score_threshold,
+            model=pool,
+            limit=limit,
+            offset=offset
+        )
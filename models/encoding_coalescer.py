@@ -0,0 +1,268 @@
+"""
+Encoding Coalescer - Micro-batching in front of the MPNet model
+Merges concurrent small encode requests into one model.encode() call
+
+Under load the web tier calls evaluate_application() from many threads,
+each encoding a batch of one or two texts. The coalescer queues incoming
+texts for a few milliseconds (max_wait_ms) or until max_batch_size texts
+are waiting, encodes them together and fans the rows back out to
+per-request futures.
+
+Drop-in: exposes encode() with the SentenceTransformer signature, so it
+can be passed anywhere a model is accepted. Async callers use encode_async().
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+_STOP = object()
+
+
+class _Request:
+    __slots__ = ("texts", "future")
+
+    def __init__(self, texts: List[str], future: Future):
+        self.texts = texts
+        self.future = future
+
+
+class EmbeddingCoalescer:
+    """
+    Background micro-batcher for a SentenceTransformer model.
+
+    Example:
+        coalescer = EmbeddingCoalescer(load_model(), max_wait_ms=5, max_batch_size=64)
+        result = evaluate_application(jd, resume, 0.6, model=coalescer)
+        embeddings = await coalescer.encode_async([resume])
+        print(coalescer.stats())
+        coalescer.shutdown()
+    """
+
+    def __init__(self, model: Any, max_wait_ms: float = 5.0, max_batch_size: int = 64):
+        """
+        Args:
+            model: Loaded SentenceTransformer model
+            max_wait_ms: Maximum time a request waits for others to join its batch (default: 5.0)
+            max_batch_size: Maximum number of texts per model.encode() call (default: 64)
+
+        Raises:
+            ValueError: If max_wait_ms or max_batch_size is invalid
+        """
+        if not isinstance(max_wait_ms, (int, float)) or max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be a non-negative number")
+
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+
+        self.model = model
+        self.max_wait_ms = float(max_wait_ms)
+        self.max_batch_size = max_batch_size
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending_texts = 0
+        self._closed = False
+
+        self.requests = 0
+        self.batches = 0
+        self.texts_encoded = 0
+        self.max_queue_depth = 0
+        self._batch_histogram: Dict[int, int] = {}
+
+        self._worker = threading.Thread(target=self._run, name="embedding-coalescer", daemon=True)
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, texts: List[str]) -> Future:
+        """
+        Queue texts for encoding.
+
+        Args:
+            texts: List of (cleaned) text strings
+
+        Returns:
+            Future resolving to a numpy array of shape (len(texts), 768)
+
+        Raises:
+            RuntimeError: If the coalescer has been shut down
+        """
+        future: Future = Future()
+        texts = list(texts)
+
+        if not texts:
+            future.set_result(np.array([]).reshape(0, 768))
+            return future
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EmbeddingCoalescer has been shut down")
+            self.requests += 1
+            self._pending_texts += len(texts)
+            self.max_queue_depth = max(self.max_queue_depth, self._pending_texts)
+            self._queue.put(_Request(texts, future))
+
+        return future
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Blocking, SentenceTransformer-compatible encode.
+        batch_size and show_progress_bar are accepted for compatibility and ignored.
+
+        Raises:
+            ValueError: If normalize_embeddings is False (batches are always normalized)
+        """
+        if not normalize_embeddings:
+            raise ValueError("EmbeddingCoalescer only produces normalized embeddings")
+        return self.submit(sentences).result()
+
+    async def encode_async(self, texts: List[str]) -> np.ndarray:
+        """
+        asyncio variant of encode(); does not block the event loop.
+
+        Args:
+            texts: List of (cleaned) text strings
+
+        Returns:
+            numpy array of shape (len(texts), 768)
+        """
+        import asyncio  # Deferred: keeps ai_resume_matcher import light
+
+        return await asyncio.wrap_future(self.submit(texts))
+
+    @property
+    def model_version(self) -> Optional[str]:
+        """Embedding version tag of the wrapped model (see get_model_version())."""
+        return getattr(self.model, "model_version", None)
+
+    def queue_depth(self) -> int:
+        """Number of texts waiting to be encoded."""
+        with self._lock:
+            return self._pending_texts
+
+    def stats(self) -> Dict:
+        """
+        Get coalescer metrics.
+
+        Returns:
+            Dictionary with requests, batches, texts_encoded, avg_batch_size,
+            queue_depth, max_queue_depth and batch_size_histogram
+            (power-of-two buckets, e.g. "<=8": 12)
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "batches": self.batches,
+                "texts_encoded": self.texts_encoded,
+                "avg_batch_size": round(self.texts_encoded / self.batches, 2) if self.batches else 0.0,
+                "queue_depth": self._pending_texts,
+                "max_queue_depth": self.max_queue_depth,
+                "batch_size_histogram": {
+                    f"<={bucket}": count for bucket, count in sorted(self._batch_histogram.items())
+                }
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting requests. Already queued requests are still encoded.
+
+        Args:
+            wait: If True, block until the worker thread exits (default: True)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+
+        if wait:
+            self._worker.join()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _collect_batch(self, first: _Request) -> tuple:
+        """Gather requests until max_batch_size texts or max_wait_ms elapses."""
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.monotonic() + self.max_wait_ms / 1000.0
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            size += len(item.texts)
+
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch, stop = self._collect_batch(item)
+
+            with self._lock:
+                self._pending_texts -= sum(len(r.texts) for r in batch)
+
+            # Skip requests whose caller already cancelled
+            live = [r for r in batch if r.future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+
+            texts = [text for r in live for text in r.texts]
+            try:
+                embeddings = np.asarray(self.model.encode(
+                    texts,
+                    batch_size=32,
+                    show_progress_bar=False,
+                    normalize_embeddings=True
+                ))
+            except Exception as e:
+                for r in live:
+                    r.future.set_exception(e)
+                continue
+
+            with self._lock:
+                self.batches += 1
+                self.texts_encoded += len(texts)
+                bucket = 1 << max(len(texts) - 1, 0).bit_length()
+                self._batch_histogram[bucket] = self._batch_histogram.get(bucket, 0) + 1
+
+            offset = 0
+            for r in live:
+                r.future.set_result(embeddings[offset:offset + len(r.texts)])
+                offset += len(r.texts)
+
+        # Drain anything left so no caller blocks forever
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item.future.set_running_or_notify_cancel():
+                item.future.set_exception(RuntimeError("EmbeddingCoalescer has been shut down"))
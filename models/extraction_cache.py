@@ -0,0 +1,359 @@
+"""
+Extraction Cache - Content-addressed store for PDF → text results
+Avoids re-parsing resume PDFs that were already extracted
+
+Layout:
+- In-memory LRU in front of
+- Optional persistent store: SQLiteExtractionStore (one database file) or
+  DiskExtractionStore (one JSON file per PDF), or any object with the same
+  get/put/delete/clear methods
+
+Keys are the SHA-256 of the PDF bytes plus the extraction strategy, so a
+candidate re-uploading the same resume to many postings (or a reprocessing
+job re-reading the archive) costs a hash instead of a pdfplumber run.
+Entries record the extractor version that produced them; when the version
+changes (pdf_to_text logic, pdfplumber or PyMuPDF upgrade) old entries are
+treated as misses and dropped.
+
+Usage:
+    cache = ExtractionCache(store=SQLiteExtractionStore("/var/cache/resume_text.db"))
+    text = extract_resume_text(upload_bytes, cache=cache)
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def pdf_digest(data: bytes) -> str:
+    """
+    Compute the content hash of a PDF.
+
+    Args:
+        data: PDF file contents
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+# ============================================================================
+# PERSISTENT STORES
+# ============================================================================
+
+class SQLiteExtractionStore:
+    """
+    Extraction entries in a local SQLite database (WAL mode, safe to share
+    between the processes of one host).
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Database file path (created if missing)
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                " key TEXT PRIMARY KEY, entry TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT entry FROM extractions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None   # Corrupt row - treat as a miss
+
+    def put(self, key: str, entry: Dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, entry, created) VALUES (?, ?, ?)",
+                (key, json.dumps(entry), time.time())
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DiskExtractionStore:
+    """Extraction entries as one JSON file per key under a directory."""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Store directory (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # Shard by the first two hex chars to keep directories small
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None   # Corrupt/partial file - treat as a miss
+
+    def put(self, key: str, entry: Dict) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file first so readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    os.remove(os.path.join(root, name))
+
+    def __len__(self) -> int:
+        return sum(
+            name.endswith(".json") for _, _, files in os.walk(self.directory) for name in files
+        )
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class ExtractionCache:
+    """
+    Two-level extraction cache: in-memory LRU backed by an optional store.
+
+    Entry format:
+        {
+            "text": str,
+            "engine": str,              # "pdfplumber" / "pymupdf"
+            "escalated": bool,
+            "strategy": str,
+            "extractor_version": str
+        }
+
+    Example:
+        cache = ExtractionCache(max_entries=5000, store=DiskExtractionStore("/var/cache/resume_text"))
+        texts = extract_resume_texts(pdf_paths, cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        store=None,
+        extractor_version: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept in memory (default: 1024)
+            store: Optional persistent store, e.g. SQLiteExtractionStore or
+                   DiskExtractionStore (default: None, memory only)
+            extractor_version: Version tag written with each entry; entries with
+                               another tag are misses (default: None, the current
+                               pdf_to_text.get_extractor_version())
+
+        Raises:
+            ValueError: If max_entries is invalid
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        if extractor_version is None:
+            try:
+                from .pdf_to_text import get_extractor_version
+            except ImportError:
+                from pdf_to_text import get_extractor_version
+            extractor_version = get_extractor_version()
+
+        self.max_entries = max_entries
+        self.store = store
+        self.extractor_version = extractor_version
+
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(digest: str, strategy: str) -> str:
+        return f"{digest}:{strategy}"
+
+    def set_extractor_version(self, extractor_version: str) -> None:
+        """
+        Switch to another extractor version. Memory entries are dropped;
+        stored entries of the old version are removed as they are looked up.
+
+        Args:
+            extractor_version: New version tag
+        """
+        with self._lock:
+            if extractor_version != self.extractor_version:
+                self.extractor_version = extractor_version
+                self._memory.clear()
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        """Insert into the memory LRU, evicting the oldest entries if needed (lock held)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, digest: str, strategy: str) -> Optional[Dict]:
+        """
+        Look up the extraction result for a PDF.
+
+        Args:
+            digest: pdf_digest() of the PDF bytes
+            strategy: Extraction strategy the result must come from
+
+        Returns:
+            Entry dict (see class docstring), or None on a miss
+        """
+        key = self._key(digest, strategy)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        if self.store is not None:
+            entry = self.store.get(key)
+            if entry is not None:
+                if entry.get("extractor_version") != self.extractor_version:
+                    self.store.delete(key)
+                    with self._lock:
+                        self.invalidations += 1
+                        self.misses += 1
+                    return None
+                with self._lock:
+                    self._remember(key, entry)
+                    self.hits += 1
+                    self.store_hits += 1
+                return entry
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, digest: str, strategy: str, text: str, engine: str, escalated: bool = False) -> Dict:
+        """
+        Store the extraction result for a PDF.
+
+        Args:
+            digest: pdf_digest() of the PDF bytes
+            strategy: Extraction strategy that produced the text
+            text: Extracted text
+            engine: Engine whose text was kept
+            escalated: Whether the "fast" strategy fell back to pdfplumber (default: False)
+
+        Returns:
+            The stored entry
+        """
+        key = self._key(digest, strategy)
+        entry = {
+            "text": text,
+            "engine": engine,
+            "escalated": bool(escalated),
+            "strategy": strategy,
+            "extractor_version": self.extractor_version
+        }
+
+        with self._lock:
+            self._remember(key, entry)
+
+        if self.store is not None:
+            self.store.put(key, entry)
+        return entry
+
+    def clear(self, include_store: bool = False) -> None:
+        """
+        Drop all in-memory entries and reset counters.
+
+        Args:
+            include_store: If True, also clear the persistent store (default: False)
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.store_hits = self.misses = self.invalidations = self.evictions = 0
+
+        if include_store and self.store is not None:
+            self.store.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, store_hits, misses, invalidations, evictions,
+            hit_rate, memory_entries, max_entries and extractor_version
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "extractor_version": self.extractor_version
+            }
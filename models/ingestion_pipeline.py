@@ -0,0 +1,589 @@
+"""
+Ingestion Pipeline - Streaming bulk import of resume PDFs into an EmbeddingIndex
+PDF → text → clean → embed → index, with overlapping stages and checkpoints
+
+Gluing extract_resume_texts(), clean_text(), generate_embeddings() and
+index_resumes() by hand materializes every stage's full output list, and
+the model sits idle while PDFs are parsed (and the parser while the model
+encodes). IngestionPipeline streams documents through four stages, each on
+its own thread, connected by bounded queues:
+
+    extract  PDFExtractionPool.imap() - worker processes, per-file timeouts
+    clean    clean_text(), drops empty documents, groups batches of batch_size
+    encode   generate_embeddings() on a single model
+    index    EmbeddingIndex.add() and checkpointing (the calling thread)
+
+Each queue holds at most max_queued_batches batches, so memory is bounded
+by the batch size rather than the import size, and a slow encoder holds
+back PDF reading instead of piling up text. progress() reports per-stage
+throughput and names the bottleneck stage.
+
+Checkpoints: with checkpoint_dir set, indexed vectors and per-file failures
+are written every checkpoint_every documents as an immutable segment file
+(atomic rename, so a crash never leaves a partial one). Re-running the same
+import replays the segments into the index and skips their documents; at
+most checkpoint_every documents are processed twice after a crash.
+
+Usage:
+    pipeline = IngestionPipeline(index, model=model, num_workers=8, checkpoint_dir="import.ckpt")
+    report = pipeline.run("/data/resumes")   # directory, or iterable of paths / (id, pdf) pairs
+    print(report["bottleneck"], report["stages"]["encode"]["docs_per_second"])
+    index.train()
+    index.save("talent_pool.npz")
+    pipeline.clear_checkpoint()
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import clean_text, generate_embeddings, get_model_version, load_model
+    from .embedding_cache import EmbeddingCache
+    from .pdf_extraction_pool import DEFAULT_TIMEOUT, PDFExtractionPool
+    from .pdf_to_text import STRATEGIES, STRATEGY_FAST, PDFSource
+    from .vector_index import EmbeddingIndex
+except ImportError:
+    from ai_resume_matcher import clean_text, generate_embeddings, get_model_version, load_model
+    from embedding_cache import EmbeddingCache
+    from pdf_extraction_pool import DEFAULT_TIMEOUT, PDFExtractionPool
+    from pdf_to_text import STRATEGIES, STRATEGY_FAST, PDFSource
+    from vector_index import EmbeddingIndex
+
+STAGES = ("extract", "clean", "encode", "index")
+
+# A directory of PDFs, or an iterable of paths / (id, pdf) pairs
+IngestionSource = Union[str, os.PathLike, Iterable[Union[str, os.PathLike, Tuple[Hashable, PDFSource]]]]
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".npz"
+
+# How often blocked queue operations re-check for cancellation / failures
+_POLL_SECONDS = 0.1
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when the pipeline is cancelled or another stage failed."""
+
+
+def iter_pdf_directory(directory: str) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory tree for PDFs in a stable (sorted) order.
+
+    Args:
+        directory: Root directory
+
+    Yields:
+        (id, path) where id is the path relative to directory, "/"-separated
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                path = os.path.join(root, name)
+                yield os.path.relpath(path, directory).replace(os.sep, "/"), path
+
+
+def _iter_documents(sources: IngestionSource) -> Iterator[Tuple[Hashable, PDFSource]]:
+    if isinstance(sources, (str, os.PathLike)):
+        yield from iter_pdf_directory(os.fspath(sources))
+        return
+    for item in sources:
+        if isinstance(item, tuple) and len(item) == 2:
+            yield item
+        elif isinstance(item, (str, os.PathLike)):
+            yield os.fspath(item), item
+        else:
+            raise ValueError("in-memory PDFs need an id: pass (id, pdf) pairs")
+
+
+class IngestionPipeline:
+    """
+    Streaming PDF → index import with bounded queues between stages.
+
+    States: "pending" -> "running" -> "completed" | "cancelled" | "failed"
+    """
+
+    def __init__(
+        self,
+        index: Optional[EmbeddingIndex] = None,
+        model=None,
+        model_version: Optional[str] = None,
+        num_workers: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        strategy: str = STRATEGY_FAST,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        batch_size: int = 64,
+        max_queued_batches: int = 2,
+        cache: Optional[EmbeddingCache] = None,
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: int = 1000,
+        retry_failed: bool = False
+    ):
+        """
+        Args:
+            index: Target EmbeddingIndex (default: None, a new empty index)
+            model: Encoder for the embeddings (default: the cached model, not the
+                   coalescer, so bulk batches do not queue ahead of live requests)
+            model_version: Version tag of the embeddings (default: get_model_version(model))
+            num_workers: PDF extraction processes (default: CPU count)
+            timeout: Seconds allowed per PDF before its worker is killed (default: 60.0)
+            strategy: Extraction strategy (default: "fast", PyMuPDF with pdfplumber escalation)
+            max_pages: Per-file page budget (default: None)
+            max_chars: Per-file character budget (default: None)
+            batch_size: Documents per encode call (default: 64)
+            max_queued_batches: Capacity of each inter-stage queue, in batches (default: 2)
+            cache: Optional EmbeddingCache consulted before encoding (default: None)
+            checkpoint_dir: Directory for resumable checkpoints; document ids must be
+                            JSON-serializable (default: None, no checkpoints)
+            checkpoint_every: Documents per checkpoint segment (default: 1000)
+            retry_failed: If True, documents that failed in a previous run are
+                          extracted again on resume (default: False)
+
+        Raises:
+            ValueError: If arguments are invalid
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if not isinstance(max_queued_batches, int) or max_queued_batches < 1:
+            raise ValueError("max_queued_batches must be a positive integer")
+
+        if not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be a positive integer")
+
+        if model is not None and not callable(getattr(model, "encode", None)):
+            raise ValueError("model must be a SentenceTransformer instance or an encoder exposing encode()")
+
+        self.index = index if index is not None else EmbeddingIndex()
+        self.model = model
+        self.model_version = model_version
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.strategy = strategy
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.batch_size = batch_size
+        self.max_queued_batches = max_queued_batches
+        self.cache = cache
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        self.retry_failed = retry_failed
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._queues: Dict[str, queue.Queue] = {}
+
+        self.state = "pending"
+        self.seen = 0
+        self.resumed = 0
+        self.duplicates = 0
+        self.indexed = 0
+        self.failed = 0
+        self.checkpoints = 0
+        self.failures: List[Dict] = []
+        self.extraction_stats: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+        self._stages = {
+            name: {"docs": 0, "busy_seconds": 0.0, "idle_seconds": 0.0, "blocked_seconds": 0.0}
+            for name in STAGES
+        }
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+        self._completed: set = set()      # Ids indexed or failed in a checkpointed run
+        self._next_segment = 0
+        self._pending_ids: List[Hashable] = []
+        self._pending_vectors: List[np.ndarray] = []
+        self._pending_failed: List[List] = []
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def run(self, sources: IngestionSource) -> Dict:
+        """
+        Import PDFs (blocking). Stages run on background threads; indexing
+        and checkpointing run in the calling thread.
+
+        Args:
+            sources: Directory of PDFs (searched recursively; ids are relative
+                     paths), or an iterable of paths (id = path) and/or
+                     (id, pdf) pairs where pdf is a path or in-memory PDF
+
+        Returns:
+            Final progress()
+
+        Raises:
+            ValueError: If sources is a path but not a directory
+            RuntimeError: If the pipeline already ran, or a stage failed
+                          (completed documents are checkpointed first)
+        """
+        if isinstance(sources, (str, os.PathLike)) and not os.path.isdir(sources):
+            raise ValueError(f"Not a directory: {os.fspath(sources)}")
+
+        with self._lock:
+            if self.state != "pending":
+                raise RuntimeError("IngestionPipeline can only run once")
+            self.state = "running"
+            self._started_at = time.perf_counter()
+
+        try:
+            if self.model is None:
+                self.model = load_model()
+            if self.model_version is None:
+                self.model_version = get_model_version(self.model)
+            self._load_checkpoint()
+        except Exception as e:
+            with self._lock:
+                self.state = "failed"
+                self.last_error = str(e)
+                self._finished_at = time.perf_counter()
+            raise RuntimeError(f"Ingestion pipeline failed to start: {str(e)}")
+
+        capacity = self.batch_size * self.max_queued_batches
+        self._queues = {
+            "texts": queue.Queue(maxsize=capacity),
+            "batches": queue.Queue(maxsize=self.max_queued_batches),
+            "embeddings": queue.Queue(maxsize=self.max_queued_batches)
+        }
+        threads = [
+            threading.Thread(target=self._run_stage, args=("extract", self._extract, sources),
+                             name="ingest-extract", daemon=True),
+            threading.Thread(target=self._run_stage, args=("clean", self._clean),
+                             name="ingest-clean", daemon=True),
+            threading.Thread(target=self._run_stage, args=("encode", self._encode),
+                             name="ingest-encode", daemon=True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        self._run_stage("index", self._index)
+
+        for thread in threads:
+            thread.join()
+
+        try:
+            self._write_segment()
+        except Exception as e:
+            self._fail("index", e)
+
+        with self._lock:
+            if self.state == "running":
+                self.state = "cancelled" if self._stop.is_set() else "completed"
+            self._finished_at = time.perf_counter()
+
+        if self.state == "failed":
+            raise RuntimeError(f"Ingestion pipeline failed: {self.last_error}")
+        return self.progress()
+
+    def cancel(self) -> None:
+        """Stop reading new PDFs. Documents already indexed are checkpointed; run() returns."""
+        self._stop.set()
+
+    def clear_checkpoint(self) -> int:
+        """
+        Delete the checkpoint segments (after the index has been saved).
+
+        Returns:
+            Number of segment files removed
+        """
+        removed = 0
+        for path in self._segment_paths():
+            os.remove(path)
+            removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def progress(self) -> Dict:
+        """
+        Get progress and per-stage throughput.
+
+        Returns:
+            Dictionary with state, model_version, seen, resumed (skipped: already
+            in a checkpoint), duplicates, indexed, failed, elapsed_seconds,
+            docs_per_second, stages ({stage: {docs, busy_seconds, idle_seconds,
+            blocked_seconds, docs_per_second (while busy), utilization}}),
+            bottleneck (stage busy the largest share of the time), queue_depths,
+            checkpoints (segments written by this run), extraction
+            (PDFExtractionPool.stats() once extraction finished), failures
+            ([{id, error_type, error}]) and last_error
+        """
+        with self._lock:
+            now = self._finished_at or time.perf_counter()
+            elapsed = (now - self._started_at) if self._started_at else 0.0
+
+            stages = {}
+            for name, stage in self._stages.items():
+                busy = stage["busy_seconds"]
+                stages[name] = {
+                    "docs": stage["docs"],
+                    "busy_seconds": round(busy, 3),
+                    "idle_seconds": round(stage["idle_seconds"], 3),
+                    "blocked_seconds": round(stage["blocked_seconds"], 3),
+                    "docs_per_second": round(stage["docs"] / busy, 2) if busy > 0 else 0.0,
+                    "utilization": round(busy / elapsed, 3) if elapsed > 0 else 0.0
+                }
+            bottleneck = max(stages, key=lambda name: stages[name]["busy_seconds"])
+
+            processed = self.indexed + self.failed
+            return {
+                "state": self.state,
+                "model_version": self.model_version,
+                "seen": self.seen,
+                "resumed": self.resumed,
+                "duplicates": self.duplicates,
+                "indexed": self.indexed,
+                "failed": self.failed,
+                "elapsed_seconds": round(elapsed, 3),
+                "docs_per_second": round(processed / elapsed, 2) if elapsed > 0 else 0.0,
+                "stages": stages,
+                "bottleneck": bottleneck if stages[bottleneck]["busy_seconds"] > 0 else None,
+                "queue_depths": {name: q.qsize() for name, q in self._queues.items()},
+                "checkpoints": self.checkpoints,
+                "extraction": self.extraction_stats,
+                "failures": list(self.failures),
+                "last_error": self.last_error
+            }
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _run_stage(self, name: str, target, *args) -> None:
+        try:
+            target(*args)
+        except _Stopped:
+            pass
+        except Exception as e:
+            self._fail(name, e)
+
+    def _fail(self, stage: str, error: Exception) -> None:
+        with self._lock:
+            if self.state != "failed":
+                self.state = "failed"
+                self.last_error = f"{stage} stage: {str(error)}"
+        self._stop.set()
+
+    def _timed(self, stage: str, key: str, start: float) -> None:
+        with self._lock:
+            self._stages[stage][key] += time.perf_counter() - start
+
+    def _put(self, stage: str, name: str, item) -> None:
+        start = time.perf_counter()
+        while True:
+            if self._stop.is_set() and item is not _DONE:
+                raise _Stopped()
+            try:
+                self._queues[name].put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                if self._stop.is_set():
+                    raise _Stopped()
+        self._timed(stage, "blocked_seconds", start)
+
+    def _get(self, stage: str, name: str):
+        start = time.perf_counter()
+        while True:
+            try:
+                item = self._queues[name].get(timeout=_POLL_SECONDS)
+                break
+            except queue.Empty:
+                if self._stop.is_set():
+                    raise _Stopped()
+        self._timed(stage, "idle_seconds", start)
+        return item
+
+    def _extract(self, sources: IngestionSource) -> None:
+        ids: deque = deque()
+        seen_ids: set = set()
+
+        def feed() -> Iterator[PDFSource]:
+            for id_, source in _iter_documents(sources):
+                if self._stop.is_set():
+                    return
+                with self._lock:
+                    self.seen += 1
+                    if id_ in self._completed:
+                        self.resumed += 1
+                        continue
+                    if id_ in seen_ids:
+                        self.duplicates += 1
+                        continue
+                seen_ids.add(id_)
+                ids.append(id_)
+                yield source
+
+        with PDFExtractionPool(
+            num_workers=self.num_workers, timeout=self.timeout, strategy=self.strategy,
+            max_pages=self.max_pages, max_chars=self.max_chars
+        ) as pool:
+            results = pool.imap(feed())
+            try:
+                while True:
+                    start = time.perf_counter()
+                    result = next(results, None)
+                    if result is None:
+                        break
+                    with self._lock:
+                        self._stages["extract"]["docs"] += 1
+                    self._timed("extract", "busy_seconds", start)
+                    self._put("extract", "texts", (ids.popleft(), result))
+            finally:
+                results.close()   # Kills workers still busy if we stopped early
+                self.extraction_stats = pool.stats()
+
+        self._put("extract", "texts", _DONE)
+
+    def _clean(self) -> None:
+        batch = {"ids": [], "texts": [], "failed": []}
+        while True:
+            item = self._get("clean", "texts")
+            if item is _DONE:
+                break
+
+            start = time.perf_counter()
+            id_, result = item
+            text = clean_text(result["text"]) if result["ok"] else ""
+            if text:
+                batch["ids"].append(id_)
+                batch["texts"].append(text)
+            elif result["ok"]:
+                batch["failed"].append([id_, "EmptyText", "No text extracted"])
+            else:
+                batch["failed"].append([id_, result["error_type"], result["error"]])
+            with self._lock:
+                self._stages["clean"]["docs"] += 1
+            self._timed("clean", "busy_seconds", start)
+
+            if len(batch["ids"]) >= self.batch_size or len(batch["failed"]) >= self.batch_size:
+                self._put("clean", "batches", batch)
+                batch = {"ids": [], "texts": [], "failed": []}
+
+        if batch["ids"] or batch["failed"]:
+            self._put("clean", "batches", batch)
+        self._put("clean", "batches", _DONE)
+
+    def _encode(self) -> None:
+        while True:
+            batch = self._get("encode", "batches")
+            if batch is _DONE:
+                break
+
+            start = time.perf_counter()
+            texts = batch.pop("texts")
+            batch["embeddings"] = generate_embeddings(self.model, texts, cache=self.cache) if texts else None
+            with self._lock:
+                self._stages["encode"]["docs"] += len(texts)
+            self._timed("encode", "busy_seconds", start)
+
+            self._put("encode", "embeddings", batch)
+        self._put("encode", "embeddings", _DONE)
+
+    def _index(self) -> None:
+        while True:
+            batch = self._get("index", "embeddings")
+            if batch is _DONE:
+                break
+
+            start = time.perf_counter()
+            if batch["ids"]:
+                self.index.add(batch["ids"], batch["embeddings"], model_version=self.model_version)
+            with self._lock:
+                self._stages["index"]["docs"] += len(batch["ids"])
+                self.indexed += len(batch["ids"])
+                self.failed += len(batch["failed"])
+                self.failures.extend(
+                    {"id": id_, "error_type": error_type, "error": error}
+                    for id_, error_type, error in batch["failed"]
+                )
+
+            if self.checkpoint_dir is not None:
+                self._pending_ids.extend(batch["ids"])
+                if batch["ids"]:
+                    self._pending_vectors.append(batch["embeddings"])
+                self._pending_failed.extend(batch["failed"])
+                if len(self._pending_ids) + len(self._pending_failed) >= self.checkpoint_every:
+                    self._write_segment()
+            self._timed("index", "busy_seconds", start)
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def _segment_paths(self) -> List[str]:
+        if self.checkpoint_dir is None or not os.path.isdir(self.checkpoint_dir):
+            return []
+        return [
+            os.path.join(self.checkpoint_dir, name)
+            for name in sorted(os.listdir(self.checkpoint_dir))
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)
+        ]
+
+    def _load_checkpoint(self) -> None:
+        """Replay segments of a previous run into the index (same model version only)."""
+        if self.checkpoint_dir is None:
+            return
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+        for path in self._segment_paths():
+            number = int(os.path.basename(path)[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+            self._next_segment = max(self._next_segment, number + 1)
+
+            with np.load(path) as data:
+                header = json.loads(data["header"].tobytes().decode("utf-8"))
+                vectors = data["vectors"].astype(np.float32)
+            if header["model_version"] != self.model_version:
+                continue   # Embedded by another model: re-ingest those documents
+
+            ids = [tuple(i) if isinstance(i, list) else i for i in header["ids"]]
+            if ids:
+                self.index.add(ids, vectors, model_version=self.model_version)
+            self._completed.update(ids)
+            if not self.retry_failed:
+                self._completed.update(
+                    tuple(id_) if isinstance(id_, list) else id_ for id_, _, _ in header["failed"]
+                )
+
+    def _write_segment(self) -> None:
+        """Persist documents processed since the last checkpoint as a new segment."""
+        if self.checkpoint_dir is None or not (self._pending_ids or self._pending_failed):
+            return
+
+        header = {
+            "model_version": self.model_version,
+            "ids": self._pending_ids,
+            "failed": self._pending_failed
+        }
+        vectors = (
+            np.vstack(self._pending_vectors).astype(np.float32, copy=False)
+            if self._pending_vectors else np.zeros((0, self.index.dim), dtype=np.float32)
+        )
+        path = os.path.join(self.checkpoint_dir, f"{_SEGMENT_PREFIX}{self._next_segment:06d}{_SEGMENT_SUFFIX}")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, vectors=vectors, header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8))
+        os.replace(tmp_path, path)
+
+        self._next_segment += 1
+        self._pending_ids = []
+        self._pending_vectors = []
+        self._pending_failed = []
+        with self._lock:
+            self.checkpoints += 1
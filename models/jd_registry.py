@@ -0,0 +1,166 @@
+"""
+JD Embedding Registry - Per-process memoization of job description embeddings
+Used by the candidate Apply hot path so a popular posting is encoded once
+
+Entries are keyed by an explicit job id (preferred) or by the JD text hash.
+- Entries expire after a TTL
+- A job id whose JD text changed (recruiter edited the posting) is invalidated
+- Entries produced by a different model instance are never returned
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from .embedding_cache import text_hash
+except ImportError:
+    from embedding_cache import text_hash
+
+
+class JDEmbeddingRegistry:
+    """
+    Thread-safe registry of JD embeddings with TTL and edit invalidation.
+
+    Example:
+        registry = JDEmbeddingRegistry(ttl_seconds=900)
+        embedding = registry.get(jd_text, model, job_id="job-42")
+        if embedding is None:
+            embedding = encode(jd_text)
+            registry.put(jd_text, embedding, model, job_id="job-42")
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_entries: int = 1000):
+        """
+        Args:
+            ttl_seconds: Lifetime of an entry in seconds (default: 3600)
+            max_entries: Maximum number of JDs kept, oldest evicted first (default: 1000)
+
+        Raises:
+            ValueError: If ttl_seconds or max_entries is invalid
+        """
+        if not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be a positive number")
+
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max_entries
+
+        # key -> (jd_hash, model, embedding, expires_at)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(jd_hash: str, job_id: Optional[str]) -> str:
+        return f"job:{job_id}" if job_id is not None else f"jd:{jd_hash}"
+
+    def get(self, jd_text: str, model: Any, job_id: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        Look up a JD embedding.
+
+        Args:
+            jd_text: Cleaned job description text
+            model: Model instance the embedding must have been produced by
+            job_id: Optional explicit job id (default: None, key by text hash)
+
+        Returns:
+            Embedding of shape (768,), or None if missing, expired, edited
+            or produced by another model
+        """
+        jd_hash = text_hash(jd_text)
+        key = self._key(jd_hash, job_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_hash, stored_model, embedding, expires_at = entry
+                if stored_hash != jd_hash or stored_model is not model or time.monotonic() >= expires_at:
+                    # JD edited, model swapped or TTL elapsed
+                    del self._entries[key]
+                    self.invalidations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return embedding
+
+            self.misses += 1
+            return None
+
+    def put(self, jd_text: str, embedding: np.ndarray, model: Any, job_id: Optional[str] = None) -> None:
+        """
+        Register a JD embedding.
+
+        Args:
+            jd_text: Cleaned job description text
+            embedding: Embedding of shape (768,)
+            model: Model instance that produced the embedding
+            job_id: Optional explicit job id (default: None, key by text hash)
+        """
+        jd_hash = text_hash(jd_text)
+        key = self._key(jd_hash, job_id)
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (jd_hash, model, np.asarray(embedding, dtype=np.float32), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, job_id: Optional[str] = None, jd_text: Optional[str] = None) -> bool:
+        """
+        Drop a JD explicitly, e.g. when the posting is edited or closed.
+
+        Args:
+            job_id: Job id the JD was registered under
+            jd_text: JD text the JD was registered under (when no job id was used)
+
+        Returns:
+            True if an entry was removed
+
+        Raises:
+            ValueError: If neither job_id nor jd_text is given
+        """
+        if job_id is None and jd_text is None:
+            raise ValueError("Either job_id or jd_text must be provided")
+
+        key = self._key(text_hash(jd_text) if jd_text is not None else "", job_id)
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+                return True
+            return False
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after the model is reloaded)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """
+        Get registry counters.
+
+        Returns:
+            Dictionary with hits, misses, invalidations, hit_rate and entries
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries)
+            }
@@ -0,0 +1,191 @@
+"""
+Job Matcher - Reverse matching: one resume against all open job descriptions
+Recommends which open JDs a candidate fits when they upload a resume
+
+JD embeddings live in a persisted EmbeddingIndex (one row per job id) that
+is updated incrementally: upsert_jobs() re-encodes only JDs that are new,
+whose text changed (tracked by a text hash in the row metadata) or whose
+vector was produced by a different model version.
+Matching encodes the resume once and scores it against every JD with a
+single score_matrix() multiply, then applies the usual threshold, ranking,
+clipping and generate_reason() semantics.
+
+Usage:
+    jobs = EmbeddingIndex.load("open_jobs.npz")       # or EmbeddingIndex()
+    upsert_jobs(jobs, ["job-1", "job-2"], [jd_1, jd_2])
+    remove_jobs(jobs, ["job-closed"])
+    jobs.save("open_jobs.npz")
+
+    result = match_jobs_for_resume(resume_text, jobs, min_score_threshold=0.60, limit=20)
+"""
+
+from typing import Dict, Hashable, List, Optional, Sequence
+
+try:
+    from .ai_resume_matcher import (
+        _resolve_model, clean_text, generate_embeddings, generate_reason,
+        get_model_version, rank_qualified_candidates, score_matrix
+    )
+    from .embedding_cache import EmbeddingCache, text_hash
+    from .vector_index import EmbeddingIndex
+except ImportError:
+    from ai_resume_matcher import (
+        _resolve_model, clean_text, generate_embeddings, generate_reason,
+        get_model_version, rank_qualified_candidates, score_matrix
+    )
+    from embedding_cache import EmbeddingCache, text_hash
+    from vector_index import EmbeddingIndex
+
+
+def upsert_jobs(
+    job_index: EmbeddingIndex,
+    job_ids: Sequence[Hashable],
+    jd_texts: List[str],
+    model=None,
+    cache: Optional[EmbeddingCache] = None
+) -> int:
+    """
+    Add new job descriptions and refresh edited ones.
+
+    Unchanged JDs (same text hash and model version as stored) are skipped;
+    all others are encoded in a single batch.
+
+    Args:
+        job_index: EmbeddingIndex holding JD embeddings
+        job_ids: Job ids, one per JD
+        jd_texts: Job description texts
+        model: Optional pre-loaded model instance (for backend efficiency)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+
+    Returns:
+        Number of JDs (re-)encoded
+
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    if len(job_ids) != len(jd_texts):
+        raise ValueError("job_ids and jd_texts must have the same length")
+
+    if not all(isinstance(t, str) and t.strip() for t in jd_texts):
+        raise ValueError("All jd_texts must be non-empty strings")
+
+    model = _resolve_model(model)
+    model_version = get_model_version(model)
+
+    changed_ids, changed_texts, changed_meta = [], [], []
+    for job_id, jd_text in zip(job_ids, jd_texts):
+        jd_hash = text_hash(clean_text(jd_text))
+        if (
+            job_id in job_index
+            and job_index.get_metadata(job_id).get("jd_hash") == jd_hash
+            and job_index.get_model_version(job_id) == model_version
+        ):
+            continue
+        changed_ids.append(job_id)
+        changed_texts.append(jd_text)
+        changed_meta.append({"jd_hash": jd_hash})
+
+    if changed_ids:
+        job_index.add(
+            changed_ids,
+            generate_embeddings(model, changed_texts, cache=cache),
+            metadata=changed_meta,
+            model_version=model_version
+        )
+
+    return len(changed_ids)
+
+
+def remove_jobs(job_index: EmbeddingIndex, job_ids: Sequence[Hashable]) -> int:
+    """
+    Remove closed or deleted jobs.
+
+    Args:
+        job_index: EmbeddingIndex holding JD embeddings
+        job_ids: Job ids to remove
+
+    Returns:
+        Number of jobs removed
+    """
+    return job_index.remove(job_ids)
+
+
+def match_jobs_for_resume(
+    resume_text: str,
+    job_index: EmbeddingIndex,
+    min_score_threshold: float = 0.50,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    model=None,
+    cache: Optional[EmbeddingCache] = None
+) -> Dict:
+    """
+    Score one resume against every open JD and return the jobs it fits.
+
+    Args:
+        resume_text: Candidate resume text
+        job_index: EmbeddingIndex holding JD embeddings (see upsert_jobs())
+        min_score_threshold: Minimum similarity score required (default: 0.50)
+        limit: Maximum number of jobs returned (default: None, all matching)
+        offset: Number of top-ranked jobs to skip when paging (default: 0)
+        model: Optional pre-loaded model instance (for backend efficiency)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+
+    Returns:
+        {
+            "total_jobs": int,
+            "matched": int,          # All jobs meeting threshold
+            "results": [
+                {"job_id": ..., "score": float, "rank": int, "reason": str}
+            ]
+        }
+
+    Raises:
+        ValueError: If inputs are invalid
+        RuntimeError: If encoding fails
+    """
+    if not resume_text or not isinstance(resume_text, str):
+        raise ValueError("resume_text must be a non-empty string")
+
+    if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
+        raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
+
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError("limit must be a non-negative integer")
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("offset must be a non-negative integer")
+
+    model = _resolve_model(model)
+
+    # JDs embedded by a different model version are skipped until re-upserted
+    job_ids, jd_matrix = job_index.vectors(model_version=get_model_version(model))
+    if not job_ids:
+        return {"total_jobs": 0, "matched": 0, "results": []}
+
+    try:
+        resume_embedding = generate_embeddings(model, [resume_text], cache=cache)[0]
+
+        # One (1 x M) multiply against all JDs, clipped to [0, 1]
+        scores = score_matrix(resume_embedding, jd_matrix)[0]
+        matched = int((scores.astype("float64") >= min_score_threshold).sum())
+        rows, ranked_scores = rank_qualified_candidates(scores, min_score_threshold, limit, offset)
+
+        results = [
+            {
+                "job_id": job_ids[row],
+                "score": round(score, 4),
+                "rank": rank,
+                "reason": generate_reason(score)
+            }
+            for rank, (row, score) in enumerate(zip(rows.tolist(), ranked_scores.tolist()), start=offset + 1)
+        ]
+
+        return {
+            "total_jobs": len(job_ids),
+            "matched": matched,
+            "results": results
+        }
+
+    except Exception as e:
+        raise RuntimeError(f"Error during job matching: {str(e)}")
@@ -0,0 +1,444 @@
+"""
+PDF Extraction Pool - Parallel resume PDF → text for bulk imports
+Runs extract_resume_text() in N worker processes with per-file timeouts
+
+pdfplumber is CPU-bound pure Python, so one process extracts one PDF at a
+time. The pool keeps one task in flight per worker, each over its own pipe,
+which lets the parent know exactly which file a worker is stuck on: a
+worker that exceeds the per-file timeout (malformed PDFs can make
+pdfplumber spin forever) is killed and replaced, and that file is reported
+as a timeout. Results come back in input order as structured dicts instead
+of printed warnings and empty strings.
+
+Inputs may mix paths and in-memory PDFs (bytes, memoryview, binary
+file-like objects); buffers are read in the parent and sent to the workers
+as bytes, so uploads never touch the disk.
+
+Usage:
+    with PDFExtractionPool(num_workers=8, timeout=30.0) as pool:
+        for result in pool.extract(pdf_paths):
+            if result["ok"]:
+                texts.append(result["text"])
+            else:
+                log_failure(result["path"], result["error_type"], result["error"])
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    from .pdf_to_text import PDFSource, describe_source, read_pdf_source
+except ImportError:
+    from pdf_to_text import PDFSource, describe_source, read_pdf_source
+
+DEFAULT_TIMEOUT = 60.0
+
+# Grace period for a worker to exit on shutdown before it is killed
+_SHUTDOWN_GRACE_SECONDS = 2.0
+
+
+def _default_extractor(
+    path,
+    prefer_pdfplumber: bool = True,
+    strategy: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> Dict:
+    try:
+        from .pdf_to_text import extract_resume_text_detailed
+    except ImportError:
+        from pdf_to_text import extract_resume_text_detailed
+    if strategy is None:
+        strategy = "pdfplumber" if prefer_pdfplumber else "pymupdf"
+    return extract_resume_text_detailed(path, strategy=strategy, max_pages=max_pages, max_chars=max_chars)
+
+
+def _extraction_worker(conn, extractor: Callable, extractor_kwargs: Dict) -> None:
+    """
+    Worker loop: receive (index, path or bytes), reply ("started", index) then
+    ("done", index, result). None stops the worker.
+
+    The extractor returns either the text or an extract_resume_text_detailed()
+    dict, whose engine/escalated fields are passed through.
+    """
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        index, path = task
+        conn.send(("started", index))   # Timeout clock starts here, not at process spawn
+        start = time.perf_counter()
+        try:
+            output = extractor(path, **extractor_kwargs)
+            if isinstance(output, dict):
+                result = {"ok": True, "text": output["text"], "error": None, "error_type": None,
+                          "engine": output.get("engine"), "escalated": bool(output.get("escalated"))}
+            else:
+                result = {"ok": True, "text": output, "error": None, "error_type": None,
+                          "engine": None, "escalated": False}
+        except Exception as e:
+            result = {"ok": False, "text": "", "error": str(e), "error_type": type(e).__name__,
+                      "engine": None, "escalated": False}
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        conn.send(("done", index, result))
+    conn.close()
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "index", "path", "started")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.index: Optional[int] = None
+        self.path = None
+        self.started: Optional[float] = None
+
+
+class PDFExtractionPool:
+    """
+    Process pool for resume PDF extraction with per-file timeouts.
+
+    Result format (one per input path, in input order):
+        {
+            "path": str,             # describe_source(): the path, or "<in-memory PDF, N bytes>"
+            "ok": bool,
+            "text": str,             # "" on failure
+            "error": str | None,
+            "error_type": str | None,   # e.g. "FileNotFoundError", "RuntimeError", "Timeout"
+            "seconds": float,
+            "engine": str | None,       # "pdfplumber" / "pymupdf" (default extractor only)
+            "escalated": bool           # "fast" strategy fell back to pdfplumber
+        }
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        prefer_pdfplumber: bool = True,
+        extractor: Optional[Callable] = None,
+        strategy: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        **extractor_kwargs
+    ):
+        """
+        Args:
+            num_workers: Number of worker processes (default: CPU count)
+            timeout: Seconds allowed per file before its worker is killed
+                     (default: 60.0, None to wait forever)
+            prefer_pdfplumber: Passed to extract_resume_text() (default: True)
+            extractor: Module-level function(path_or_bytes, **kwargs) -> str run
+                       in the workers (default: extract_resume_text_detailed)
+            strategy: Extraction strategy for the default extractor, e.g.
+                      "fast" (default: None, see extract_resume_text)
+            max_pages: Per-file page budget for the default extractor (default: None)
+            max_chars: Per-file character budget for the default extractor (default: None)
+            **extractor_kwargs: Extra keyword arguments for a custom extractor
+
+        Raises:
+            ValueError: If num_workers or timeout is invalid
+        """
+        num_workers = num_workers or os.cpu_count() or 1
+
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise ValueError("timeout must be a positive number or None")
+
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.extractor = extractor or _default_extractor
+        self.extractor_kwargs = extractor_kwargs if extractor else {
+            "prefer_pdfplumber": prefer_pdfplumber, "strategy": strategy,
+            "max_pages": max_pages, "max_chars": max_chars
+        }
+
+        # spawn: the parent may hold torch/OpenMP state, which is unsafe to fork
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._closed = False
+
+        self.files = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.respawns = 0
+        self.busy_seconds = 0.0
+        self.escalations = 0
+        self.engines: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_extraction_worker,
+            args=(child_conn, self.extractor, self.extractor_kwargs),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _ensure_workers(self, count: int) -> None:
+        while len(self._workers) < min(count, self.num_workers):
+            self._workers.append(self._spawn())
+
+    def _kill(self, worker: _Worker) -> None:
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def imap(self, pdf_paths: Iterable[PDFSource]) -> Iterator[Dict]:
+        """
+        Extract PDFs in parallel, yielding results in input order.
+
+        The input is consumed lazily, one item per free worker, so a generator
+        over a very large import is never materialized and a slow consumer
+        holds back reading (at most num_workers files are in flight).
+
+        Args:
+            pdf_paths: PDF file paths and/or in-memory PDFs (bytes, memoryview,
+                       binary file-like objects); unreadable inputs get a
+                       failed result rather than aborting the batch
+
+        Yields:
+            Result dicts (see class docstring)
+
+        Raises:
+            RuntimeError: If the pool has been shut down
+        """
+        if self._closed:
+            raise RuntimeError("PDFExtractionPool has been shut down")
+
+        names: Dict[int, str] = {}
+        finished: Dict[int, Dict] = {}
+
+        def read_tasks() -> Iterator:
+            for index, source in enumerate(pdf_paths):
+                names[index] = describe_source(source)
+                try:
+                    data = read_pdf_source(source)
+                except Exception as e:
+                    finished[index] = self._record({
+                        "path": names[index], "ok": False, "text": "", "error": str(e),
+                        "error_type": type(e).__name__, "seconds": 0.0, "engine": None, "escalated": False
+                    })
+                    continue
+                yield index, data
+
+        pending = read_tasks()
+        in_flight = 0
+        next_to_yield = 0
+
+        def dispatch(worker: _Worker) -> bool:
+            task = next(pending, None)
+            if task is None:
+                worker.index = None
+                return False
+            worker.index, worker.path = task
+            worker.started = None
+            worker.conn.send(task)
+            return True
+
+        try:
+            # Workers are started on demand: a 3-file batch never spawns 8
+            for slot in range(self.num_workers):
+                task = next(pending, None)
+                if task is None:
+                    break
+                self._ensure_workers(slot + 1)
+                worker = self._workers[slot]
+                worker.index, worker.path = task
+                worker.started = None
+                worker.conn.send(task)
+                in_flight += 1
+            for worker in self._workers[in_flight:]:
+                worker.index = None
+
+            while in_flight:
+                busy = [(slot, w) for slot, w in enumerate(self._workers) if w.index is not None]
+                timed = [w.started for _, w in busy if w.started is not None]
+                wait_timeout = None
+                if self.timeout is not None and timed:
+                    wait_timeout = max(0.0, min(timed) + self.timeout - time.monotonic())
+
+                ready = wait([w.conn for _, w in busy], timeout=wait_timeout)
+                now = time.monotonic()
+
+                for slot, worker in busy:
+                    index = worker.index
+                    if worker.conn in ready:
+                        try:
+                            message = worker.conn.recv()
+                        except (EOFError, OSError):
+                            # Worker died mid-file (e.g. segfault in a native parser)
+                            message = ("crashed", index, {
+                                "ok": False, "text": "", "error": "Extraction worker crashed",
+                                "error_type": "WorkerCrash", "engine": None, "escalated": False,
+                                "seconds": round(now - (worker.started or now), 4)
+                            })
+                            worker = self._replace(slot)
+                        if message[0] == "started":
+                            worker.started = time.monotonic()
+                            continue
+                        result = message[2]
+                    elif (
+                        self.timeout is not None
+                        and worker.started is not None
+                        and now - worker.started >= self.timeout
+                    ):
+                        result = {
+                            "ok": False, "text": "", "error": f"Extraction exceeded {self.timeout}s timeout",
+                            "error_type": "Timeout", "seconds": round(now - worker.started, 4),
+                            "engine": None, "escalated": False
+                        }
+                        self.timeouts += 1
+                        worker = self._replace(slot)
+                    else:
+                        continue
+
+                    result["path"] = names[index]
+                    finished[index] = self._record(result)
+                    in_flight -= 1
+                    in_flight += dispatch(worker)
+
+                while next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+
+            while next_to_yield in finished:   # Inputs rejected before dispatch
+                yield finished.pop(next_to_yield)
+                next_to_yield += 1
+        finally:
+            # Consumer stopped early: discard results still in flight
+            for slot, worker in enumerate(self._workers):
+                if worker.index is not None:
+                    self._replace(slot)
+
+    def extract(self, pdf_paths: Sequence[PDFSource]) -> List[Dict]:
+        """
+        Extract PDFs in parallel.
+
+        Args:
+            pdf_paths: PDF file paths and/or in-memory PDFs
+
+        Returns:
+            List of result dicts, same order as pdf_paths
+        """
+        return list(self.imap(pdf_paths))
+
+    def stats(self) -> Dict:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with num_workers, files, succeeded, failed, timeouts,
+            respawns, avg_seconds_per_file (worker time), engines
+            ({engine: files}), escalations and escalation_rate
+        """
+        return {
+            "num_workers": self.num_workers,
+            "files": self.files,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "respawns": self.respawns,
+            "avg_seconds_per_file": round(self.busy_seconds / self.files, 4) if self.files else 0.0,
+            "engines": dict(self.engines),
+            "escalations": self.escalations,
+            "escalation_rate": round(self.escalations / self.files, 4) if self.files else 0.0
+        }
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        self._closed = True
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+        deadline = time.monotonic() + _SHUTDOWN_GRACE_SECONDS
+        for worker in self._workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
+        self._workers = []
+
+    def __enter__(self) -> "PDFExtractionPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _replace(self, slot: int) -> _Worker:
+        """Kill a hung/crashed worker and start a fresh one in its slot."""
+        self._kill(self._workers[slot])
+        self._workers[slot] = self._spawn()
+        self.respawns += 1
+        return self._workers[slot]
+
+    def _record(self, result: Dict) -> Dict:
+        self.files += 1
+        self.busy_seconds += result["seconds"]
+        if result["ok"]:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if result["engine"] is not None:
+            self.engines[result["engine"]] = self.engines.get(result["engine"], 0) + 1
+        self.escalations += result["escalated"]
+        return result
+
+
+def extract_pdfs_parallel(
+    pdf_paths: Sequence[PDFSource],
+    num_workers: Optional[int] = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    prefer_pdfplumber: bool = True,
+    strategy: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> List[Dict]:
+    """
+    One-shot parallel extraction (starts and stops a PDFExtractionPool).
+
+    Args:
+        pdf_paths: PDF file paths and/or in-memory PDFs
+        num_workers: Number of worker processes (default: CPU count)
+        timeout: Seconds allowed per file (default: 60.0)
+        prefer_pdfplumber: Passed to extract_resume_text() (default: True)
+        strategy: Extraction strategy, e.g. "fast" (default: None)
+        max_pages: Per-file page budget (default: None)
+        max_chars: Per-file character budget (default: None)
+
+    Returns:
+        List of result dicts (see PDFExtractionPool), same order as pdf_paths
+    """
+    with PDFExtractionPool(
+        num_workers=num_workers, timeout=timeout, prefer_pdfplumber=prefer_pdfplumber,
+        strategy=strategy, max_pages=max_pages, max_chars=max_chars
+    ) as pool:
+        return pool.extract(pdf_paths)
@@ -5,144 +5,943 @@ Extracts text from PDF resumes for AI matching
 Supports:
 - pdfplumber (primary, best for resumes)
 - PyMuPDF (fallback, faster)
+
+Strategies (extract_resume_text(strategy=...)):
+- "pdfplumber": pdfplumber first, PyMuPDF on failure (default)
+- "pymupdf": PyMuPDF only
+- "fast": PyMuPDF first, escalating to pdfplumber only when a cheap quality
+  check on the PyMuPDF text fails (garbled glyphs, interleaved columns,
+  too few words per page). Per-engine timings and the escalation rate are
+  available from get_extraction_stats().
+
+Inputs may be file paths or in-memory PDFs (bytes, bytearray, memoryview or
+binary file-like objects such as an upload's stream), so uploads can be
+parsed without writing a temp file.
+
+Pass cache=ExtractionCache(...) (see extraction_cache.py) to skip PDFs whose
+bytes were already extracted by the same extractor version.
+
+iter_pdf_pages() streams page text lazily; max_pages / max_chars budgets
+(also accepted by extract_resume_text) stop parsing early, so a 300-page
+portfolio costs no more than the pages the matcher actually uses.
 """
 
+import io
 import os
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .extraction_cache import ExtractionCache, pdf_digest
+except ImportError:
+    from extraction_cache import ExtractionCache, pdf_digest
+
+# Bump when a change here alters extracted text, so cached results are
+# re-extracted (engine library versions are part of get_extractor_version())
+EXTRACTOR_VERSION = "3"
+
+STRATEGY_PDFPLUMBER = "pdfplumber"
+STRATEGY_PYMUPDF = "pymupdf"
+STRATEGY_FAST = "fast"
+STRATEGIES = (STRATEGY_PDFPLUMBER, STRATEGY_PYMUPDF, STRATEGY_FAST)
+
+ENGINE_PYMUPDF = "pymupdf"
+ENGINE_PDFPLUMBER = "pdfplumber"
+ENGINES = (ENGINE_PYMUPDF, ENGINE_PDFPLUMBER)
+
+# Hard limits against pathological PDFs (None disables a limit): larger
+# files / documents raise PDFLimitError, image-heavy pages are skipped
+MAX_PDF_BYTES = 50 * 1024 * 1024
+MAX_DOCUMENT_PAGES = 1000
+MAX_IMAGES_PER_PAGE = 100
+
+# Quality thresholds for the "fast" strategy; PyMuPDF text failing any of
+# these is re-extracted with pdfplumber
+MIN_TEXT_LENGTH = 50
+FAST_MIN_WORDS_PER_PAGE = 20
+FAST_MAX_GARBLED_RATIO = 0.02
+# Calibrated on benchmark_pdf_extraction.py --quick: kinds both engines read
+# alike (single_column, multi_column, long, tables, unicode) score 0.0, the
+# bottom_up kind (PyMuPDF word order 0.18 vs 1.0 for pdfplumber) scores 1.0,
+# and right-column-first rows score ~0.47. A single late header or sidebar
+# (one backward jump per page) stays far below.
+FAST_MAX_INTERLEAVE_RATIO = 0.25
+
+# A path, or the PDF itself in memory
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# PDF readers accept up to 1 KB of junk before the %PDF- header
+_HEADER_SEARCH_BYTES = 1024
+
+
+def describe_source(source: PDFSource) -> str:
+    """Printable name for a PDF source: the path, the stream's name, or its size."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return name
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return f"<in-memory PDF, {memoryview(source).nbytes} bytes>"
+    return "<PDF stream>"
 
 
-def extract_text_with_pdfplumber(pdf_path: str) -> str:
+def read_pdf_source(source: PDFSource) -> Union[str, bytes]:
     """
-    Extract text using pdfplumber (primary method).
-    Best for resumes with good layout handling.
+    Normalize a PDF source to a path string or bytes.
+    
+    File-like objects are read from their current position; bytearray and
+    memoryview are copied to bytes (both engines need an immutable buffer
+    they can re-read when escalating).
     
     Args:
-        pdf_path: Path to PDF file
+        source: Path, bytes, bytearray, memoryview or binary file-like object
         
     Returns:
-        Extracted text as string
+        Path string or PDF bytes
         
     Raises:
-        FileNotFoundError: If PDF file doesn't exist
-        Exception: If pdfplumber extraction fails
+        ValueError: If source is not a supported type or the stream is not binary
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        data = source.read()
+        if not isinstance(data, (bytes, bytearray)):
+            raise ValueError("PDF stream must be opened in binary mode")
+        return bytes(data)
+    raise ValueError(
+        f"PDF source must be a path, bytes, memoryview or binary file-like object, got {type(source).__name__}"
+    )
+
+
+def get_extractor_version() -> str:
     """
+    Version tag for extraction results: this module's EXTRACTOR_VERSION plus
+    the installed pdfplumber and PyMuPDF versions.
+    
+    Returns:
+        e.g. "pdf_to_text-1/pdfplumber-0.11.4/pymupdf-1.24.9"
+    """
+    global _extractor_version
+    if _extractor_version is None:
+        parts = [f"pdf_to_text-{EXTRACTOR_VERSION}"]
+        try:
+            import pdfplumber
+            parts.append(f"pdfplumber-{pdfplumber.__version__}")
+        except ImportError:
+            parts.append("pdfplumber-none")
+        try:
+            import fitz  # PyMuPDF
+            parts.append(f"pymupdf-{fitz.VersionBind}")
+        except ImportError:
+            parts.append("pymupdf-none")
+        _extractor_version = "/".join(parts)
+    return _extractor_version
+
+
+_extractor_version: Optional[str] = None
+
+
+def _validate_source(source: Union[str, bytes]) -> None:
+    """Path: must exist and end in .pdf. Bytes: must carry a %PDF- header."""
+    if isinstance(source, bytes):
+        if b"%PDF-" not in source[:_HEADER_SEARCH_BYTES]:
+            raise ValueError(f"Data is not a PDF (no %PDF- header): {describe_source(source)}")
+        _check_size(source, MAX_PDF_BYTES)
+        return
+    
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"PDF file not found: {source}")
+    
+    if not source.lower().endswith('.pdf'):
+        raise ValueError(f"File is not a PDF: {source}")
+    
+    _check_size(source, MAX_PDF_BYTES)
+
+
+def _load_pdf_bytes(source: PDFSource) -> bytes:
+    """Validated PDF bytes for hashing (paths are read once, then parsed from memory)."""
+    source = read_pdf_source(source)
+    _validate_source(source)
+    if isinstance(source, bytes):
+        return source
+    with open(source, "rb") as f:
+        return f.read()
+
+
+class PDFLimitError(ValueError):
+    """Raised when a PDF exceeds a hard safety limit (file size or page count)."""
+
+
+def _check_budget(name: str, value: Optional[int]) -> None:
+    if value is not None and (not isinstance(value, int) or value < 0):
+        raise ValueError(f"{name} must be a non-negative integer or None")
+
+
+def _check_size(source: Union[str, bytes], max_bytes: Optional[int]) -> None:
+    if max_bytes is None:
+        return
+    size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+    if size > max_bytes:
+        raise PDFLimitError(f"PDF is {size} bytes, limit is {max_bytes}: {describe_source(source)}")
+
+
+def _check_page_count(count: int, max_document_pages: Optional[int], source: Union[str, bytes]) -> None:
+    if max_document_pages is not None and count > max_document_pages:
+        raise PDFLimitError(
+            f"PDF has {count} pages, limit is {max_document_pages}: {describe_source(source)}"
+        )
+
+
+def _pymupdf_page_objects(
+    source: Union[str, bytes],
+    max_pages: Optional[int],
+    max_bytes: Optional[int],
+    max_document_pages: Optional[int],
+    max_images_per_page: Optional[int]
+) -> Iterator:
+    """Yield PyMuPDF pages lazily (None for image-heavy pages); closes the document when done."""
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        raise ImportError("PyMuPDF not installed. Run: pip install pymupdf")
+    
+    if isinstance(source, str) and not os.path.exists(source):
+        raise FileNotFoundError(f"PDF file not found: {source}")
+    _check_size(source, max_bytes)
+    
+    doc = _open_pymupdf(fitz, source)
+    try:
+        _check_page_count(doc.page_count, max_document_pages, source)
+        count = doc.page_count if max_pages is None else min(max_pages, doc.page_count)
+        for number in range(count):
+            page = doc[number]
+            if max_images_per_page is not None and len(page.get_images()) > max_images_per_page:
+                yield None
+            else:
+                yield page
+    finally:
+        doc.close()
+
+
+def _pymupdf_page_texts(
+    source: Union[str, bytes],
+    max_pages: Optional[int],
+    max_bytes: Optional[int],
+    max_document_pages: Optional[int],
+    max_images_per_page: Optional[int]
+) -> Iterator[str]:
+    page_objects = _pymupdf_page_objects(source, max_pages, max_bytes, max_document_pages, max_images_per_page)
+    try:
+        for page in page_objects:
+            yield "" if page is None else page.get_text().strip()
+    finally:
+        page_objects.close()
+
+
+def _pdfplumber_page_texts(
+    source: Union[str, bytes],
+    max_pages: Optional[int],
+    max_bytes: Optional[int],
+    max_document_pages: Optional[int],
+    max_images_per_page: Optional[int]
+) -> Iterator[str]:
+    """Yield pdfplumber page text lazily, releasing each page's parsed objects after use."""
     try:
         import pdfplumber
+        from pdfminer.pdftypes import resolve1
     except ImportError:
         raise ImportError("pdfplumber not installed. Run: pip install pdfplumber")
     
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    if isinstance(source, str) and not os.path.exists(source):
+        raise FileNotFoundError(f"PDF file not found: {source}")
+    _check_size(source, max_bytes)
+    
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        _check_page_count(len(pdf.pages), max_document_pages, source)
+        for page in pdf.pages[:max_pages]:
+            if max_images_per_page is not None:
+                xobjects = resolve1((page.page_obj.resources or {}).get("XObject")) or {}
+                if len(xobjects) > max_images_per_page:
+                    yield ""
+                    continue
+            yield (page.extract_text() or "").strip()
+            page.close()
+
+
+def iter_pdf_pages(
+    pdf_path: PDFSource,
+    engine: str = ENGINE_PYMUPDF,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    max_bytes: Optional[int] = MAX_PDF_BYTES,
+    max_document_pages: Optional[int] = MAX_DOCUMENT_PAGES,
+    max_images_per_page: Optional[int] = MAX_IMAGES_PER_PAGE
+) -> Iterator[str]:
+    """
+    Stream page text one page at a time.
+    
+    Pages are parsed only as they are consumed, so stopping early (or a
+    max_pages / max_chars budget) skips the rest of the document. The
+    document is closed when the generator is exhausted or closed.
+    
+    Args:
+        pdf_path: Path to PDF file, or the PDF as bytes / file-like object
+        engine: "pymupdf" or "pdfplumber" (default: "pymupdf")
+        max_pages: Stop after this many pages (default: None, all pages)
+        max_chars: Stop once this many characters were yielded; the last page
+                   is cut to fit (default: None, no limit)
+        max_bytes: Reject larger files with PDFLimitError (default: 50 MB)
+        max_document_pages: Reject documents with more pages with
+                            PDFLimitError (default: 1000)
+        max_images_per_page: Skip pages with more image/form XObjects,
+                             yielding "" (default: 100)
+        
+    Yields:
+        Stripped text of each page ("" for empty or skipped pages)
+        
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        ValueError: If engine or a budget is invalid
+        PDFLimitError: If the PDF exceeds max_bytes or max_document_pages
+        
+    Example:
+        for page_text in iter_pdf_pages("portfolio.pdf", max_chars=4000):
+            chunks.append(page_text)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}")
+    for name, value in (("max_pages", max_pages), ("max_chars", max_chars)):
+        _check_budget(name, value)
+    
+    source = read_pdf_source(pdf_path)
+    if max_chars == 0 or max_pages == 0:
+        return
     
-    text_parts = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text.strip())
+    page_texts = _pymupdf_page_texts if engine == ENGINE_PYMUPDF else _pdfplumber_page_texts
+    pages = page_texts(source, max_pages, max_bytes, max_document_pages, max_images_per_page)
     
-    return "\n".join(text_parts)
+    remaining = max_chars
+    try:
+        for text in pages:
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            yield text
+            if remaining is not None and remaining <= 0:
+                break
+    finally:
+        pages.close()
 
 
-def extract_text_with_pymupdf(pdf_path: str) -> str:
+def extract_text_with_pdfplumber(
+    pdf_path: PDFSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> str:
+    """
+    Extract text using pdfplumber (primary method).
+    Best for resumes with good layout handling.
+    
+    Args:
+        pdf_path: Path to PDF file, or the PDF as bytes / file-like object
+        max_pages: Only read the first max_pages pages (default: None, all)
+        max_chars: Stop after max_chars characters of page text (default: None)
+        
+    Returns:
+        Extracted text as string
+        
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        PDFLimitError: If the PDF exceeds the size or page-count limits
+        Exception: If pdfplumber extraction fails
+    """
+    pages = iter_pdf_pages(pdf_path, ENGINE_PDFPLUMBER, max_pages=max_pages, max_chars=max_chars)
+    return "\n".join(text for text in pages if text)
+
+
+def extract_text_with_pymupdf(
+    pdf_path: PDFSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> str:
     """
     Fallback extraction using PyMuPDF (fitz).
     Faster alternative when pdfplumber fails.
     
     Args:
-        pdf_path: Path to PDF file
+        pdf_path: Path to PDF file, or the PDF as bytes / file-like object
+        max_pages: Only read the first max_pages pages (default: None, all)
+        max_chars: Stop after max_chars characters of page text (default: None)
         
     Returns:
         Extracted text as string
         
     Raises:
         FileNotFoundError: If PDF file doesn't exist
+        PDFLimitError: If the PDF exceeds the size or page-count limits
         Exception: If PyMuPDF extraction fails
     """
+    pages = iter_pdf_pages(pdf_path, ENGINE_PYMUPDF, max_pages=max_pages, max_chars=max_chars)
+    return "\n".join(text for text in pages if text)
+
+
+def _open_pymupdf(fitz, pdf_path: Union[str, bytes]):
+    if isinstance(pdf_path, bytes):
+        return fitz.open(stream=pdf_path, filetype="pdf")
+    return fitz.open(pdf_path)
+
+
+def _pymupdf_pages_with_layout(
+    pdf_path: Union[str, bytes],
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> Tuple[List[str], float]:
+    """
+    PyMuPDF text per page plus a column-interleaving signal.
+    
+    The signal is the fraction of consecutive output lines that jump
+    backwards in reading order: up the page, or right to left on the same
+    visual row. pdfplumber re-sorts lines by position, so only backward
+    jumps are order it would fix. Top-to-bottom text, tables and
+    side-by-side columns drawn row by row only move right or down (ratio 0;
+    pdfplumber reads them the same way). A content stream drawn bottom-up
+    or right column first jumps back on most lines (ratio near 0.5 or above).
+    
+    Returns:
+        (stripped page texts within the budgets, interleave ratio)
+    """
+    _check_budget("max_pages", max_pages)
+    _check_budget("max_chars", max_chars)
+    
+    pages = []
+    transitions = 0
+    out_of_order = 0
+    remaining = max_chars
+    page_objects = _pymupdf_page_objects(
+        pdf_path, max_pages, MAX_PDF_BYTES, MAX_DOCUMENT_PAGES, MAX_IMAGES_PER_PAGE
+    )
     try:
-        import fitz  # PyMuPDF
-    except ImportError:
-        raise ImportError("PyMuPDF not installed. Run: pip install pymupdf")
+        for page in page_objects:
+            if remaining is not None and remaining <= 0:
+                break
+            if page is None:
+                pages.append("")
+                continue
+            textpage = page.get_textpage()
+            text = page.get_text(textpage=textpage).strip()
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            pages.append(text)
+            
+            previous = None
+            for block in page.get_text("dict", textpage=textpage)["blocks"]:
+                for line in block.get("lines", ()):
+                    x0, y0, x1, y1 = line["bbox"]
+                    if previous is not None:
+                        px0, py0, px1, py1 = previous
+                        height = max(py1 - py0, 1.0)
+                        transitions += 1
+                        same_row = abs(y1 - py1) < 0.5 * height
+                        moved_left = same_row and x1 <= px0
+                        moved_up = y1 < py1 - 0.5 * height
+                        out_of_order += moved_left or moved_up
+                    previous = (x0, y0, x1, y1)
+    finally:
+        page_objects.close()
     
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    return pages, (out_of_order / transitions if transitions else 0.0)
+
+
+def assess_text_quality(text: str, page_count: int = 1, interleave_ratio: float = 0.0) -> Dict:
+    """
+    Cheap quality signals for extracted resume text.
     
-    text_parts = []
-    doc = fitz.open(pdf_path)
-    for page in doc:
-        page_text = page.get_text()
-        if page_text:
-            text_parts.append(page_text.strip())
-    doc.close()
+    Args:
+        text: Extracted text
+        page_count: Number of pages the text came from (default: 1)
+        interleave_ratio: Column-interleaving signal from the extractor (default: 0.0)
+        
+    Returns:
+        Dictionary with chars, words, words_per_page, garbled_ratio
+        (replacement / private-use / control characters over non-space
+        characters) and interleave_ratio
+    """
+    stripped = text.strip()
+    words = len(stripped.split())
+    visible = garbled = 0
+    for char in stripped:
+        if char.isspace():
+            continue
+        visible += 1
+        code = ord(char)
+        if code == 0xFFFD or 0xE000 <= code <= 0xF8FF or code < 0x20:
+            garbled += 1
+    garbled += 5 * stripped.count("(cid:")   # pdfminer's marker for unmapped glyphs
     
-    return "\n".join(text_parts)
+    return {
+        "chars": len(stripped),
+        "words": words,
+        "words_per_page": round(words / max(page_count, 1), 1),
+        "garbled_ratio": round(garbled / visible, 4) if visible else 0.0,
+        "interleave_ratio": round(interleave_ratio, 4)
+    }
 
 
-def extract_resume_text(pdf_path: str, prefer_pdfplumber: bool = True) -> str:
+def escalation_reason(quality: Dict) -> Optional[str]:
     """
-    Main PDF → text extraction function.
+    Decide whether fast-path text needs re-extraction with pdfplumber.
     
-    Tries pdfplumber first (best for resumes), falls back to PyMuPDF if needed.
-    Ensures minimum text length for valid resume extraction.
+    Args:
+        quality: Output of assess_text_quality()
+        
+    Returns:
+        None if the text is good enough, otherwise one of "too_short",
+        "garbled", "interleaved", "sparse"
+    """
+    if quality["chars"] <= MIN_TEXT_LENGTH:
+        return "too_short"
+    if quality["garbled_ratio"] > FAST_MAX_GARBLED_RATIO:
+        return "garbled"
+    if quality["interleave_ratio"] > FAST_MAX_INTERLEAVE_RATIO:
+        return "interleaved"
+    if quality["words_per_page"] < FAST_MIN_WORDS_PER_PAGE:
+        return "sparse"
+    return None
+
+
+# ============================================================================
+# EXTRACTION STATS
+# ============================================================================
+
+class ExtractionStats:
+    """
+    Thread-safe per-engine timing and escalation counters.
+    
+    Counters are per process: PDFExtractionPool workers keep their own, and
+    the pool reports engine/escalation totals in its stats() instead.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.files = 0
+            self.escalations = 0
+            self.reasons: Dict[str, int] = {}
+            self.engines: Dict[str, Dict] = {}
+    
+    def record_engine(self, engine: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            entry = self.engines.setdefault(engine, {"calls": 0, "failures": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["failures"] += not ok
+            entry["seconds"] += seconds
+    
+    def record_file(self, reason: Optional[str]) -> None:
+        with self._lock:
+            self.files += 1
+            if reason is not None:
+                self.escalations += 1
+                self.reasons[reason] = self.reasons.get(reason, 0) + 1
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "files": self.files,
+                "escalations": self.escalations,
+                "escalation_rate": round(self.escalations / self.files, 4) if self.files else 0.0,
+                "escalation_reasons": dict(self.reasons),
+                "engines": {
+                    engine: {
+                        "calls": entry["calls"],
+                        "failures": entry["failures"],
+                        "total_seconds": round(entry["seconds"], 4),
+                        "avg_ms": round(1000 * entry["seconds"] / entry["calls"], 3)
+                    }
+                    for engine, entry in self.engines.items()
+                }
+            }
+
+
+_stats = ExtractionStats()
+
+
+def get_extraction_stats() -> Dict:
+    """
+    Get per-engine timings and the "fast" strategy escalation rate.
+    
+    Returns:
+        Dictionary with files, escalations, escalation_rate,
+        escalation_reasons ({reason: count}) and engines
+        ({engine: {calls, failures, total_seconds, avg_ms}})
+    """
+    return _stats.snapshot()
+
+
+def reset_extraction_stats() -> None:
+    """Reset the counters reported by get_extraction_stats()."""
+    _stats.reset()
+
+
+def _timed(engine: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    ok = False
+    try:
+        result = func(*args, **kwargs)
+        ok = True
+        return result
+    finally:
+        _stats.record_engine(engine, time.perf_counter() - start, ok)
+
+
+def _cache_variant(strategy: str, max_pages: Optional[int], max_chars: Optional[int]) -> str:
+    """Cache key component: budgeted extractions are stored apart from full ones."""
+    if max_pages is None and max_chars is None:
+        return strategy
+    return f"{strategy}:pages={max_pages}:chars={max_chars}"
+
+
+def extract_resume_text_detailed(
+    pdf_path: PDFSource,
+    strategy: str = STRATEGY_FAST,
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> Dict:
+    """
+    PDF → text extraction with engine and quality details.
     
     Args:
-        pdf_path: Path to PDF resume file
-        prefer_pdfplumber: If True, try pdfplumber first (default: True)
+        pdf_path: Path to PDF resume file, or the PDF as bytes / memoryview /
+                  binary file-like object
+        strategy: "fast", "pdfplumber" or "pymupdf" (default: "fast")
+        cache: Optional ExtractionCache keyed by the PDF's SHA-256 (default: None)
+        max_pages: Only read the first max_pages pages (default: None, all)
+        max_chars: Stop reading once max_chars characters were extracted
+                   (default: None, no limit)
         
     Returns:
-        Extracted text as string
+        Dictionary:
+        {
+            "text": str,
+            "engine": str,              # engine whose text was returned
+            "escalated": bool,          # "fast" fell back to pdfplumber
+            "reason": str | None,       # why it escalated (None on cache hits)
+            "quality": dict | None,     # assess_text_quality() of the fast-path text
+            "cached": bool              # served from the cache
+        }
         
     Raises:
         FileNotFoundError: If PDF file doesn't exist
-        ValueError: If extracted text is too short (< 50 chars)
-        RuntimeError: If both extraction methods fail
-        
-    Example:
-        text = extract_resume_text("resume.pdf")
-        # Returns: "John Doe\nSoftware Engineer\n..."
+        ValueError: If the input is not a PDF, strategy is unknown or a budget is invalid
+        PDFLimitError: If the PDF exceeds the size or page-count limits
+        RuntimeError: If no engine extracts sufficient text
     """
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}")
+    _check_budget("max_pages", max_pages)
+    _check_budget("max_chars", max_chars)
+    budget = {"max_pages": max_pages, "max_chars": max_chars}
+    
+    name = describe_source(pdf_path)
+    if cache is None:
+        pdf_path = read_pdf_source(pdf_path)
+        _validate_source(pdf_path)
+        result = _extract_detailed(pdf_path, name, strategy, budget)
+        result["cached"] = False
+        return result
     
-    if not pdf_path.lower().endswith('.pdf'):
-        raise ValueError(f"File is not a PDF: {pdf_path}")
+    data = _load_pdf_bytes(pdf_path)
+    digest = pdf_digest(data)
+    variant = _cache_variant(strategy, max_pages, max_chars)
+    entry = cache.get(digest, variant)
+    if entry is not None:
+        return {
+            "text": entry["text"], "engine": entry["engine"], "escalated": entry["escalated"],
+            "reason": None, "quality": None, "cached": True
+        }
     
+    result = _extract_detailed(data, name, strategy, budget)
+    cache.put(digest, variant, result["text"], result["engine"], result["escalated"])
+    result["cached"] = False
+    return result
+
+
+def _extract_detailed(pdf_path: Union[str, bytes], name: str, strategy: str, budget: Dict) -> Dict:
+    """Run one extraction strategy on a validated path or PDF bytes."""
+    if strategy != STRATEGY_FAST:
+        text, engine = _extract_ordered(
+            pdf_path, name, prefer_pdfplumber=(strategy == STRATEGY_PDFPLUMBER), budget=budget
+        )
+        return {"text": text, "engine": engine, "escalated": False, "reason": None, "quality": None}
+    
+    fast_text = ""
+    quality = None
+    last_error = None
+    try:
+        pages, interleave_ratio = _timed("pymupdf", _pymupdf_pages_with_layout, pdf_path, **budget)
+        fast_text = "\n".join(page for page in pages if page)
+        quality = assess_text_quality(fast_text, len(pages), interleave_ratio)
+        reason = escalation_reason(quality)
+    except PDFLimitError:
+        raise   # pdfplumber would hit the same limit
+    except Exception as e:
+        last_error = e
+        reason = "error"
+    
+    if reason is None:
+        _stats.record_file(None)
+        return {"text": fast_text, "engine": "pymupdf", "escalated": False, "reason": None, "quality": quality}
+    
+    _stats.record_file(reason)
+    try:
+        text = _timed("pdfplumber", extract_text_with_pdfplumber, pdf_path, **budget).strip()
+        if len(text) > MIN_TEXT_LENGTH:
+            return {"text": text, "engine": "pdfplumber", "escalated": True, "reason": reason, "quality": quality}
+    except Exception as e:
+        last_error = e
+    
+    # pdfplumber did no better: keep usable fast-path text
+    if len(fast_text) > MIN_TEXT_LENGTH:
+        return {"text": fast_text, "engine": "pymupdf", "escalated": True, "reason": reason, "quality": quality}
+    
+    error_msg = f"Failed to extract sufficient text from PDF: {name}"
+    if last_error:
+        error_msg += f" (Last error: {str(last_error)})"
+    raise RuntimeError(error_msg)
+
+
+def _extract_ordered(
+    pdf_path: Union[str, bytes],
+    name: str,
+    prefer_pdfplumber: bool,
+    budget: Dict
+) -> Tuple[str, str]:
+    """pdfplumber → PyMuPDF fallback chain; returns (text, engine)."""
     text = None
     last_error = None
     
     # Try primary method (pdfplumber)
     if prefer_pdfplumber:
         try:
-            text = extract_text_with_pdfplumber(pdf_path)
+            text = _timed("pdfplumber", extract_text_with_pdfplumber, pdf_path, **budget)
             if text and len(text.strip()) > 50:  # Minimum valid text length
-                return text.strip()
+                return text.strip(), "pdfplumber"
+        except PDFLimitError:
+            raise
         except Exception as e:
             last_error = e
     
     # Fallback to PyMuPDF
     try:
-        text = extract_text_with_pymupdf(pdf_path)
+        text = _timed("pymupdf", extract_text_with_pymupdf, pdf_path, **budget)
         if text and len(text.strip()) > 50:
-            return text.strip()
+            return text.strip(), "pymupdf"
+    except PDFLimitError:
+        raise
     except Exception as e:
         last_error = e
     
     # If both methods failed or text too short
     if not text or len(text.strip()) < 50:
-        error_msg = f"Failed to extract sufficient text from PDF: {pdf_path}"
+        error_msg = f"Failed to extract sufficient text from PDF: {name}"
         if last_error:
             error_msg += f" (Last error: {str(last_error)})"
         raise RuntimeError(error_msg)
     
-    return text.strip()
+    return text.strip(), "pymupdf"
+
+
+def extract_resume_text(
+    pdf_path: PDFSource,
+    prefer_pdfplumber: bool = True,
+    strategy: Optional[str] = None,
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> str:
+    """
+    Main PDF → text extraction function.
+    
+    Tries pdfplumber first (best for resumes), falls back to PyMuPDF if needed.
+    Ensures minimum text length for valid resume extraction.
+    
+    Args:
+        pdf_path: Path to PDF resume file, or the PDF as bytes / memoryview /
+                  binary file-like object (e.g. an upload stream)
+        prefer_pdfplumber: If True, try pdfplumber first (default: True)
+        strategy: "fast" tries PyMuPDF first and escalates to pdfplumber only
+                  when the text fails a quality check; overrides
+                  prefer_pdfplumber (default: None)
+        cache: Optional ExtractionCache; PDFs whose bytes were already
+               extracted (same strategy and extractor version) skip
+               parsing (default: None)
+        max_pages: Only read the first max_pages pages (default: None, all)
+        max_chars: Stop reading once max_chars characters were extracted,
+                   e.g. what the matcher's token window can use (default: None)
+        
+    Returns:
+        Extracted text as string
+        
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        ValueError: If the file is not a PDF, strategy is unknown or a budget is invalid
+        PDFLimitError: If the PDF exceeds MAX_PDF_BYTES or MAX_DOCUMENT_PAGES
+        RuntimeError: If both extraction methods fail
+        
+    Example:
+        text = extract_resume_text("resume.pdf")
+        # Returns: "John Doe\nSoftware Engineer\n..."
+        
+        text = extract_resume_text("resume.pdf", strategy="fast")
+        
+        # Upload handler: request body straight to text, no temp file
+        text = extract_resume_text(await upload.read())
+        
+        # Re-uploads of the same PDF are served from the cache
+        text = extract_resume_text(upload_bytes, cache=extraction_cache)
+        
+        # Oversized portfolio: stop after the first 5 pages / 8000 chars
+        text = extract_resume_text("portfolio.pdf", max_pages=5, max_chars=8000)
+    """
+    if strategy is None:
+        strategy = STRATEGY_PDFPLUMBER if prefer_pdfplumber else STRATEGY_PYMUPDF
+    
+    return extract_resume_text_detailed(
+        pdf_path, strategy=strategy, cache=cache, max_pages=max_pages, max_chars=max_chars
+    )["text"]
 
 
-def extract_resume_texts(pdf_paths: list) -> list:
+def extract_resume_batch(
+    pdf_paths: list,
+    num_workers: Optional[int] = None,
+    timeout: Optional[float] = 60.0,
+    prefer_pdfplumber: bool = True,
+    strategy: Optional[str] = None,
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> list:
+    """
+    Parallel batch extraction with structured per-file results.
+    
+    Runs extract_resume_text() in a pool of worker processes (see
+    pdf_extraction_pool.PDFExtractionPool). A file taking longer than
+    timeout has its worker killed and is reported as a "Timeout" error.
+    
+    Args:
+        pdf_paths: List of PDF paths and/or in-memory PDFs (bytes, memoryview,
+                   binary file-like objects), mixed freely
+        num_workers: Number of worker processes (default: CPU count)
+        timeout: Seconds allowed per file (default: 60.0, None for no limit)
+        prefer_pdfplumber: If True, try pdfplumber first (default: True)
+        strategy: Extraction strategy, e.g. "fast" (default: None, see extract_resume_text)
+        cache: Optional ExtractionCache; hits are answered in this process and
+               only misses are sent to the pool. Inputs are read and looked up
+               one at a time as workers free up, so a whole-archive reprocess
+               never holds more than the in-flight PDFs in memory (default: None)
+        max_pages: Only read the first max_pages pages of each PDF (default: None)
+        max_chars: Stop reading each PDF after max_chars characters (default: None)
+        
+    Returns:
+        List of dicts (same order as input):
+        {"path", "ok", "text", "error", "error_type", "seconds", "engine", "escalated", "cached"}
+        where "path" is describe_source() of the input
+        
+    Example:
+        results = extract_resume_batch(pdf_paths, num_workers=8, timeout=30)
+        texts = [r["text"] for r in results if r["ok"]]
+    """
+    try:
+        from .pdf_extraction_pool import PDFExtractionPool, extract_pdfs_parallel
+    except ImportError:
+        from pdf_extraction_pool import PDFExtractionPool, extract_pdfs_parallel
+    
+    if cache is None:
+        results = extract_pdfs_parallel(
+            pdf_paths, num_workers=num_workers, timeout=timeout, prefer_pdfplumber=prefer_pdfplumber,
+            strategy=strategy, max_pages=max_pages, max_chars=max_chars
+        )
+        for result in results:
+            result["cached"] = False
+        return results
+    
+    if strategy is None:
+        strategy = STRATEGY_PDFPLUMBER if prefer_pdfplumber else STRATEGY_PYMUPDF
+    variant = _cache_variant(strategy, max_pages, max_chars)
+    
+    results: List[Optional[Dict]] = []
+    misses = deque()   # (index, name, digest) of each PDF sent to the pool, in order
+    
+    def read_misses() -> Iterator[bytes]:
+        # Pulled by the pool one item per free worker: hits and unreadable
+        # inputs are answered here, only miss bytes are ever in flight
+        for index, source in enumerate(pdf_paths):
+            name = describe_source(source)
+            results.append(None)
+            try:
+                data = _load_pdf_bytes(source)
+            except Exception as e:
+                results[index] = {
+                    "path": name, "ok": False, "text": "", "error": str(e), "error_type": type(e).__name__,
+                    "seconds": 0.0, "engine": None, "escalated": False, "cached": False
+                }
+                continue
+            digest = pdf_digest(data)
+            entry = cache.get(digest, variant)
+            if entry is not None:
+                results[index] = {
+                    "path": name, "ok": True, "text": entry["text"], "error": None, "error_type": None,
+                    "seconds": 0.0, "engine": entry["engine"], "escalated": entry["escalated"], "cached": True
+                }
+                continue
+            misses.append((index, name, digest))
+            yield data
+    
+    with PDFExtractionPool(
+        num_workers=num_workers, timeout=timeout, strategy=strategy, max_pages=max_pages, max_chars=max_chars
+    ) as pool:
+        # imap yields in input order, so results line up with the misses queue
+        for result in pool.imap(read_misses()):
+            index, name, digest = misses.popleft()
+            result["path"] = name
+            result["cached"] = False
+            if result["ok"]:
+                cache.put(digest, variant, result["text"], result["engine"], result["escalated"])
+            results[index] = result
+    
+    return results
+
+
+def extract_resume_texts(
+    pdf_paths: list,
+    num_workers: int = 1,
+    strategy: Optional[str] = None,
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> list:
     """
     Batch extract text from multiple PDF resumes.
     
     Args:
-        pdf_paths: List of PDF file paths
+        pdf_paths: List of PDF paths and/or in-memory PDFs
+        num_workers: Worker processes; > 1 uses extract_resume_batch() (default: 1)
+        strategy: Extraction strategy, e.g. "fast" (default: None, see extract_resume_text)
+        cache: Optional ExtractionCache shared across calls (default: None)
+        max_pages: Only read the first max_pages pages of each PDF (default: None)
+        max_chars: Stop reading each PDF after max_chars characters (default: None)
         
     Returns:
         List of extracted text strings (same order as input)
@@ -151,14 +950,27 @@ def extract_resume_texts(pdf_paths: list) -> list:
         texts = extract_resume_texts(["resume1.pdf", "resume2.pdf"])
         # Returns: ["text1", "text2"]
     """
+    if num_workers > 1:
+        results = []
+        for result in extract_resume_batch(
+            pdf_paths, num_workers=num_workers, strategy=strategy, cache=cache,
+            max_pages=max_pages, max_chars=max_chars
+        ):
+            if not result["ok"]:
+                print(f"Warning: Failed to extract {result['path']}: {result['error']}")
+            results.append(result["text"])
+        return results
+    
     results = []
     for pdf_path in pdf_paths:
         try:
-            text = extract_resume_text(pdf_path)
+            text = extract_resume_text(
+                pdf_path, strategy=strategy, cache=cache, max_pages=max_pages, max_chars=max_chars
+            )
             results.append(text)
         except Exception as e:
             # Log error but continue with other PDFs
-            print(f"Warning: Failed to extract {pdf_path}: {str(e)}")
+            print(f"Warning: Failed to extract {describe_source(pdf_path)}: {str(e)}")
             results.append("")  # Empty string for failed extraction
     
     return results
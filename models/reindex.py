@@ -0,0 +1,329 @@
+"""
+Re-index - Background re-embedding after a model change
+Re-encodes stale vectors of an EmbeddingIndex without starving live traffic
+
+After load_model(force_reload=True, ...) switches model or backend, vectors
+already stored in an EmbeddingIndex were produced under another embedding
+version and are no longer comparable. ReindexJob walks index.stale_ids()
+in batches on a daemon thread and overwrites them in place
+(index.update_vectors()), tagged with the new version.
+
+Throttling, so the Apply path keeps its latency:
+- max_duty_cycle: after a batch that took t seconds the job sleeps
+  t * (1 / max_duty_cycle - 1), i.e. 0.5 keeps the encoder idle half the time
+- busy(): while it returns True (default: the running coalescer has queued
+  texts) the job waits before starting its next batch
+
+Usage:
+    load_model(force_reload=True, backend="int8")
+    job = ReindexJob(index, resume_texts_by_id).start()
+    ...
+    print(job.progress())   # {"state": "running", "done": 12800, "percent": 42.7, ...}
+    job.join()
+    index.train()
+    index.save("talent_pool.npz")
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Union
+
+try:
+    from .ai_resume_matcher import generate_embeddings, get_coalescer, get_model_version, load_model
+    from .vector_index import EmbeddingIndex
+except ImportError:
+    from ai_resume_matcher import generate_embeddings, get_coalescer, get_model_version, load_model
+    from vector_index import EmbeddingIndex
+
+# Longest a batch is postponed because live requests are queued
+_MAX_YIELD_SECONDS = 1.0
+
+TextSource = Union[Mapping[Hashable, str], Callable[[Sequence[Hashable]], Sequence[Optional[str]]]]
+
+
+def _live_traffic_waiting() -> bool:
+    """Default busy() check: texts queued in the running coalescer."""
+    coalescer = get_coalescer()
+    return coalescer is not None and coalescer.queue_depth() > 0
+
+
+class ReindexJob:
+    """
+    Throttled background re-embedding of stale index vectors.
+
+    States: "pending" -> "running" <-> "paused" -> "completed" | "cancelled" | "failed"
+    """
+
+    def __init__(
+        self,
+        index: EmbeddingIndex,
+        texts: TextSource,
+        model=None,
+        target_version: Optional[str] = None,
+        batch_size: int = 64,
+        max_duty_cycle: float = 0.5,
+        busy: Optional[Callable[[], bool]] = _live_traffic_waiting
+    ):
+        """
+        Args:
+            index: EmbeddingIndex to re-embed
+            texts: Mapping id -> text, or callable(ids) -> texts (None for unknown ids,
+                   which are skipped) used to fetch source texts, e.g. from a database
+            model: Model producing the new embeddings (default: the cached model,
+                   not the coalescer, so batches do not queue ahead of live requests)
+            target_version: Version tag of the new embeddings (default: get_model_version(model))
+            batch_size: Texts encoded per batch (default: 64)
+            max_duty_cycle: Fraction of wall time spent encoding, in (0, 1] (default: 0.5)
+            busy: Callable returning True while live traffic should go first
+                  (default: running coalescer has queued texts; None to disable)
+
+        Raises:
+            ValueError: If arguments are invalid or the version cannot be determined
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if not isinstance(max_duty_cycle, (int, float)) or max_duty_cycle <= 0.0 or max_duty_cycle > 1.0:
+            raise ValueError("max_duty_cycle must be a float in (0.0, 1.0]")
+
+        self.index = index
+        self.texts = texts
+        self.model = model
+        self.target_version = target_version
+        self.batch_size = batch_size
+        self.max_duty_cycle = float(max_duty_cycle)
+        self.busy = busy
+
+        if self.model is not None and self.target_version is None:
+            self.target_version = get_model_version(self.model)
+            if self.target_version is None:
+                raise ValueError("model has no embedding version tag; pass target_version")
+
+        self._lock = threading.Lock()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.state = "pending"
+        self.total = 0
+        self.done = 0
+        self.skipped = 0
+        self.failed = 0
+        self.batches = 0
+        self.yield_waits = 0
+        self.last_error: Optional[str] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._encode_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def start(self) -> "ReindexJob":
+        """
+        Start re-embedding on a daemon thread.
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            RuntimeError: If the job was already started
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("ReindexJob already started")
+            self._thread = threading.Thread(target=self._run, name="embedding-reindex", daemon=True)
+            self._thread.start()
+        return self
+
+    def run(self) -> Dict:
+        """
+        Re-embed in the calling thread (blocking).
+
+        Returns:
+            Final progress()
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("ReindexJob already started")
+            self._thread = threading.current_thread()
+        self._run()
+        return self.progress()
+
+    def pause(self) -> None:
+        """Pause after the current batch."""
+        self._resume.clear()
+
+    def resume(self) -> None:
+        """Continue a paused job."""
+        self._resume.set()
+
+    def cancel(self) -> None:
+        """Stop after the current batch. Vectors already re-embedded stay updated."""
+        self._cancel.set()
+        self._resume.set()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the job to finish.
+
+        Args:
+            timeout: Seconds to wait (default: None, forever)
+
+        Returns:
+            True if the job has finished
+        """
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        return self.state in ("completed", "cancelled", "failed")
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def progress(self) -> Dict:
+        """
+        Get progress and throughput metrics.
+
+        Returns:
+            Dictionary with state, target_version, total, done, skipped, failed,
+            remaining, percent, batches, elapsed_seconds, texts_per_second
+            (wall clock, including throttling), encode_texts_per_second (while
+            encoding), duty_cycle, yield_waits, eta_seconds and last_error
+        """
+        with self._lock:
+            now = self._finished_at or time.perf_counter()
+            elapsed = (now - self._started_at) if self._started_at else 0.0
+            processed = self.done + self.skipped + self.failed
+            remaining = max(self.total - processed, 0)
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+
+            return {
+                "state": self.state,
+                "target_version": self.target_version,
+                "total": self.total,
+                "done": self.done,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "remaining": remaining,
+                "percent": round(100.0 * processed / self.total, 2) if self.total else 100.0,
+                "batches": self.batches,
+                "elapsed_seconds": round(elapsed, 3),
+                "texts_per_second": round(rate, 2),
+                "encode_texts_per_second": round(self.done / self._encode_seconds, 2) if self._encode_seconds else 0.0,
+                "duty_cycle": round(self._encode_seconds / elapsed, 3) if elapsed > 0 else 0.0,
+                "yield_waits": self.yield_waits,
+                "eta_seconds": round(remaining / rate, 1) if rate > 0 else None,
+                "last_error": self.last_error
+            }
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _fetch_texts(self, ids: List[Hashable]) -> List[Optional[str]]:
+        if callable(self.texts):
+            texts = list(self.texts(ids))
+            if len(texts) != len(ids):
+                raise ValueError("text source returned a different number of texts than ids")
+            return texts
+        return [self.texts.get(id_) for id_ in ids]
+
+    def _yield_to_live_traffic(self) -> None:
+        if self.busy is None:
+            return
+        deadline = time.monotonic() + _MAX_YIELD_SECONDS
+        waited = False
+        while self.busy() and time.monotonic() < deadline and not self._cancel.is_set():
+            waited = True
+            time.sleep(0.005)
+        if waited:
+            with self._lock:
+                self.yield_waits += 1
+
+    def _run(self) -> None:
+        try:
+            if self.model is None:
+                self.model = load_model()
+                if self.target_version is None:
+                    self.target_version = get_model_version(self.model)
+            if self.target_version is None:
+                raise ValueError("model has no embedding version tag; pass target_version")
+
+            stale = self.index.stale_ids(self.target_version)
+            with self._lock:
+                self.total = len(stale)
+                self.state = "running"
+                self._started_at = time.perf_counter()
+
+            for start in range(0, len(stale), self.batch_size):
+                if not self._resume.is_set():
+                    with self._lock:
+                        self.state = "paused"
+                    self._resume.wait()
+                if self._cancel.is_set():
+                    break
+                with self._lock:
+                    self.state = "running"
+
+                self._yield_to_live_traffic()
+                self._reembed_batch(stale[start:start + self.batch_size])
+
+            with self._lock:
+                self.state = "cancelled" if self._cancel.is_set() else "completed"
+
+        except Exception as e:
+            with self._lock:
+                self.state = "failed"
+                self.last_error = str(e)
+        finally:
+            with self._lock:
+                if self._started_at is None:
+                    self._started_at = time.perf_counter()
+                self._finished_at = time.perf_counter()
+
+    def _reembed_batch(self, ids: List[Hashable]) -> None:
+        batch_start = time.perf_counter()
+        try:
+            texts = self._fetch_texts(ids)
+            known = [(id_, text) for id_, text in zip(ids, texts) if isinstance(text, str) and text.strip()]
+
+            updated = 0
+            if known:
+                embeddings = generate_embeddings(self.model, [text for _, text in known])
+                updated = self.index.update_vectors(
+                    [id_ for id_, _ in known], embeddings, model_version=self.target_version
+                )
+            with self._lock:
+                self.done += updated
+                self.skipped += len(ids) - updated   # No text, or removed meanwhile
+        except Exception as e:
+            with self._lock:
+                self.failed += len(ids)
+                self.last_error = str(e)
+
+        elapsed = time.perf_counter() - batch_start
+        with self._lock:
+            self.batches += 1
+            self._encode_seconds += elapsed
+
+        # Throttle: stay idle long enough to respect max_duty_cycle
+        if self.max_duty_cycle < 1.0 and not self._cancel.is_set():
+            self._cancel.wait(elapsed * (1.0 / self.max_duty_cycle - 1.0))
+
+
+def start_reindex(index: EmbeddingIndex, texts: TextSource, **kwargs: Any) -> ReindexJob:
+    """
+    Start a background ReindexJob for the stale vectors of an index.
+
+    Args:
+        index: EmbeddingIndex to re-embed
+        texts: Mapping id -> text, or callable(ids) -> texts
+        **kwargs: ReindexJob arguments (model, batch_size, max_duty_cycle, busy, ...)
+
+    Returns:
+        The running ReindexJob
+    """
+    return ReindexJob(index, texts, **kwargs).start()
@@ -0,0 +1,244 @@
+"""
+Skill Explainer - Per-skill explanations for match scores
+Turns "Strong semantic match" into "matched: Spring Boot, Docker; missing: Kubernetes"
+
+The skill vocabulary is encoded once per model and kept in memory. For each
+JD the skill phrases it mentions are extracted once (memoized by JD hash).
+A resume is then explained with:
+- a lexical check of each JD skill against the resume text, and
+- one batched (windows x skills) matrix product between the resume
+  embeddings already computed for scoring and the JD skill embeddings
+  (catches paraphrases such as "k8s" or "containerised with Docker Swarm")
+
+No extra model call is made per application, so the cost is a few regex
+searches and one small matmul.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import clean_text, generate_embeddings
+    from .embedding_cache import text_hash
+except ImportError:
+    from ai_resume_matcher import clean_text, generate_embeddings
+    from embedding_cache import text_hash
+
+# Semantic score (resume window vs skill phrase) that counts as a match when
+# the skill is not mentioned verbatim
+SKILL_MATCH_THRESHOLD = 0.60
+
+DEFAULT_SKILL_VOCABULARY = [
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Golang", "Rust", "Kotlin",
+    "Swift", "Scala", "Ruby", "PHP", "SQL", "Bash",
+    # Backend / frameworks
+    "Spring Boot", "Hibernate", "Django", "Flask", "FastAPI", "Node.js",
+    "Express.js", ".NET", "Ruby on Rails", "GraphQL", "REST APIs", "gRPC", "Microservices",
+    # Frontend / mobile
+    "React", "Angular", "Vue.js", "Next.js", "Redux", "HTML", "CSS", "Tailwind CSS",
+    "React Native", "Flutter", "Android", "iOS",
+    # Data / ML
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "PyTorch",
+    "TensorFlow", "scikit-learn", "Pandas", "NumPy", "Spark", "Hadoop", "Airflow",
+    "Kafka", "ETL", "Data Warehousing", "Tableau", "Power BI", "MLOps", "LLM",
+    # Databases
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "Cassandra",
+    "DynamoDB", "Oracle", "Snowflake",
+    # Cloud / DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "CI/CD", "GitHub Actions", "Linux", "Prometheus", "Grafana", "Helm", "Serverless",
+    # Practices / other
+    "Git", "Agile", "Scrum", "Unit Testing", "Test Automation", "Selenium",
+    "System Design", "Distributed Systems", "Security", "OAuth", "Jira",
+]
+
+
+def _skill_pattern(skill: str) -> "re.Pattern":
+    """Case-insensitive pattern that does not match inside longer tokens (Java vs JavaScript)."""
+    return re.compile(r"(?<![a-z0-9+#.])" + re.escape(skill.lower()) + r"(?![a-z0-9+#])")
+
+
+class SkillExplainer:
+    """
+    Explains a JD/resume match in terms of individual skills.
+
+    Example:
+        explainer = SkillExplainer()
+        skills = explainer.explain(jd_text, resume_text, resume_embeddings, model)
+        print(skills["explanation"])   # "matched: Spring Boot, Docker; missing: Kubernetes"
+    """
+
+    def __init__(
+        self,
+        vocabulary: Optional[Sequence[str]] = None,
+        match_threshold: float = SKILL_MATCH_THRESHOLD,
+        max_jd_entries: int = 1000
+    ):
+        """
+        Args:
+            vocabulary: Skill phrases to recognise (default: DEFAULT_SKILL_VOCABULARY)
+            match_threshold: Semantic score counting as a match (default: 0.60)
+            max_jd_entries: Number of JDs whose extracted skills are memoized (default: 1000)
+
+        Raises:
+            ValueError: If arguments are invalid
+        """
+        vocabulary = list(DEFAULT_SKILL_VOCABULARY if vocabulary is None else vocabulary)
+        if not vocabulary or not all(isinstance(s, str) and s.strip() for s in vocabulary):
+            raise ValueError("vocabulary must be a non-empty list of non-empty strings")
+
+        if not isinstance(match_threshold, (int, float)) or match_threshold < 0.0 or match_threshold > 1.0:
+            raise ValueError("match_threshold must be a float between 0.0 and 1.0")
+
+        if not isinstance(max_jd_entries, int) or max_jd_entries < 1:
+            raise ValueError("max_jd_entries must be a positive integer")
+
+        self.vocabulary = list(dict.fromkeys(vocabulary))
+        self.match_threshold = float(match_threshold)
+        self.max_jd_entries = max_jd_entries
+
+        self._patterns = [_skill_pattern(skill) for skill in self.vocabulary]
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        self._embeddings_model = None
+        self._jd_skills: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def skill_embeddings(self, model) -> np.ndarray:
+        """
+        Embeddings of the whole vocabulary, encoded once per model.
+
+        Args:
+            model: Loaded model (or any encoder exposing encode())
+
+        Returns:
+            numpy array of shape (len(vocabulary), 768)
+        """
+        with self._lock:
+            if self._embeddings is None or self._embeddings_model is not model:
+                self._embeddings = generate_embeddings(model, self.vocabulary).astype(np.float32)
+                self._embeddings_model = model
+            return self._embeddings
+
+    def extract_skills(self, jd_text: str) -> List[str]:
+        """
+        Skill phrases from the vocabulary mentioned in a JD (memoized by JD hash).
+
+        Args:
+            jd_text: Job description text
+
+        Returns:
+            Skills in vocabulary order
+        """
+        return [self.vocabulary[i] for i in self._jd_skill_indices(jd_text)]
+
+    def explain(
+        self,
+        jd_text: str,
+        resume_text: str,
+        resume_embeddings: np.ndarray,
+        model
+    ) -> Dict:
+        """
+        Explain which JD skills a resume covers.
+
+        Args:
+            jd_text: Job description text
+            resume_text: Resume text
+            resume_embeddings: Normalized resume embedding(s) already computed for
+                               scoring, shape (768,) or (windows, 768)
+            model: Model used for resume_embeddings (the vocabulary must share it)
+
+        Returns:
+            {
+                "matched": [str],          # JD skills found in the resume
+                "missing": [str],          # JD skills not found
+                "skill_scores": {str: float},
+                "explanation": str         # "matched: ...; missing: ..."
+            }
+        """
+        indices = self._jd_skill_indices(jd_text)
+        if indices.size == 0:
+            return {"matched": [], "missing": [], "skill_scores": {}, "explanation": "no known skills in job description"}
+
+        # One (windows x skills) product; best window per skill
+        skills = self.skill_embeddings(model)[indices]
+        windows = np.asarray(resume_embeddings, dtype=np.float32).reshape(-1, skills.shape[1])
+        scores = np.clip((windows @ skills.T).max(axis=0), 0.0, 1.0)
+
+        resume_lower = clean_text(resume_text).lower()
+        matched, missing, skill_scores = [], [], {}
+        for idx, score in zip(indices.tolist(), scores.tolist()):
+            skill = self.vocabulary[idx]
+            skill_scores[skill] = round(score, 4)
+            if score >= self.match_threshold or self._patterns[idx].search(resume_lower):
+                matched.append(skill)
+            else:
+                missing.append(skill)
+
+        return {
+            "matched": matched,
+            "missing": missing,
+            "skill_scores": skill_scores,
+            "explanation": format_skill_explanation(matched, missing)
+        }
+
+    def clear(self) -> None:
+        """Drop cached vocabulary embeddings and JD skill lists."""
+        with self._lock:
+            self._embeddings = None
+            self._embeddings_model = None
+            self._jd_skills.clear()
+
+    def _jd_skill_indices(self, jd_text: str) -> np.ndarray:
+        key = text_hash(clean_text(jd_text))
+        with self._lock:
+            indices = self._jd_skills.get(key)
+            if indices is not None:
+                self._jd_skills.move_to_end(key)
+                return indices
+
+        jd_lower = clean_text(jd_text).lower()
+        indices = np.array(
+            [i for i, pattern in enumerate(self._patterns) if pattern.search(jd_lower)], dtype=np.intp
+        )
+
+        with self._lock:
+            self._jd_skills[key] = indices
+            while len(self._jd_skills) > self.max_jd_entries:
+                self._jd_skills.popitem(last=False)
+        return indices
+
+
+def format_skill_explanation(matched: List[str], missing: List[str]) -> str:
+    """
+    Format matched/missing skills for display.
+
+    Example:
+        format_skill_explanation(["Spring Boot", "Docker"], ["Kubernetes"])
+        # "matched: Spring Boot, Docker; missing: Kubernetes"
+    """
+    parts = []
+    if matched:
+        parts.append("matched: " + ", ".join(matched))
+    if missing:
+        parts.append("missing: " + ", ".join(missing))
+    return "; ".join(parts)
+
+
+_default_explainer: Optional[SkillExplainer] = None
+_default_lock = threading.Lock()
+
+
+def get_skill_explainer() -> SkillExplainer:
+    """Get the process-wide SkillExplainer (default vocabulary), creating it on first use."""
+    global _default_explainer
+
+    with _default_lock:
+        if _default_explainer is None:
+            _default_explainer = SkillExplainer()
+        return _default_explainer
@@ -0,0 +1,298 @@
+"""
+Streaming Encoder - Memory-bounded encoding and scoring of very large resume sets
+Peak memory is bounded by chunk size, not corpus size
+
+generate_embeddings() materializes every cleaned text and the full (N, 768)
+array at once. The helpers here consume an iterable of resume texts (or
+file paths), encode fixed-size chunks, optionally write the rows into a
+pre-allocated or memory-mapped array, and score each chunk as it arrives.
+
+Stream items are resume TEXT when they are plain strings; files must be
+passed as os.PathLike (e.g. pathlib.Path). A str that looks like a PDF path
+is rejected with ValueError rather than silently encoded as text. Files
+that cannot be read or extracted are reported under "failed" (with the
+row, path and error) and are never ranked.
+
+Usage:
+    result = stream_match_for_recruiter(jd_text, iter_resumes_from_db(), chunk_size=512)
+
+    out = open_embedding_memmap("embeddings.f16", count=500_000, dtype="float16")
+    encode_into(model, resume_paths, out)
+"""
+
+import os
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import (
+        _resolve_model, clean_text, compute_similarity, generate_embeddings, iter_ranked_results
+    )
+    from .embedding_cache import EmbeddingCache
+except ImportError:
+    from ai_resume_matcher import (
+        _resolve_model, clean_text, compute_similarity, generate_embeddings, iter_ranked_results
+    )
+    from embedding_cache import EmbeddingCache
+
+EMBEDDING_DIM = 768
+
+ResumeSource = Union[str, os.PathLike]
+
+
+def _load_resume(item: ResumeSource) -> Tuple[str, Optional[Dict]]:
+    """
+    Resolve one stream item to text. Plain strings are resume text;
+    os.PathLike objects (e.g. pathlib.Path) are read from disk.
+    
+    Returns:
+        (text, None), or ("", {"path", "error", "error_type"}) if the file
+        could not be read or extracted. None yields ("", None).
+    
+    Raises:
+        ValueError: If a str looks like a PDF path, or the item is another type
+    """
+    if item is None:
+        return "", None
+    if isinstance(item, str):
+        stripped = item.strip()
+        if stripped.lower().endswith(".pdf") and not any(c.isspace() for c in stripped):
+            raise ValueError(
+                f"{stripped!r} looks like a file path; plain strings are resume text, "
+                "pass pathlib.Path(...) to read a file"
+            )
+        return item, None
+    if not isinstance(item, os.PathLike):
+        raise ValueError(f"resume items must be str (text) or os.PathLike (file), got {type(item).__name__}")
+
+    path = os.fspath(item)
+    try:
+        if path.lower().endswith(".pdf"):
+            try:
+                from .pdf_to_text import extract_resume_text
+            except ImportError:
+                from pdf_to_text import extract_resume_text
+            return extract_resume_text(path), None
+
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read(), None
+    except Exception as e:
+        return "", {"path": path, "error": str(e), "error_type": type(e).__name__}
+
+
+def _encode_chunk(model, texts: List[str], cache: Optional[EmbeddingCache]) -> np.ndarray:
+    """Encode one chunk; empty texts (and failed reads) get a zero vector without a forward pass."""
+    embeddings = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    non_empty = [i for i, text in enumerate(texts) if clean_text(text)]
+    if non_empty:
+        embeddings[non_empty] = generate_embeddings(model, [texts[i] for i in non_empty], cache=cache)
+    return embeddings
+
+
+def iter_embedding_chunks(
+    model,
+    resumes: Iterable[ResumeSource],
+    chunk_size: int = 256,
+    cache: Optional[EmbeddingCache] = None,
+    failed: Optional[List[Dict]] = None
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Encode an iterable of resumes chunk by chunk.
+
+    Only chunk_size texts and one (chunk_size, 768) array are alive at a time.
+    Rows whose file could not be read get a zero vector and are appended to
+    failed (if given) before their chunk is yielded; without failed, the
+    first unreadable file raises RuntimeError.
+
+    Args:
+        model: Loaded SentenceTransformer model (or coalescer)
+        resumes: Iterable of resume texts (str) or os.PathLike paths (.pdf or
+                 text files); a str is always text, never a path
+        chunk_size: Number of resumes encoded per model call (default: 256)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+        failed: Optional list receiving {"candidate_id", "path", "error",
+                "error_type"} per unreadable file (default: None)
+
+    Yields:
+        (start_index, embeddings) where embeddings has shape (chunk, 768)
+
+    Raises:
+        ValueError: If chunk_size is invalid, or an item is not str / os.PathLike
+                    (or is a str that looks like a PDF path)
+        RuntimeError: If a file cannot be read and failed is None
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    iterator = iter(resumes)
+    start = 0
+    while True:
+        texts = []
+        for row, item in enumerate(islice(iterator, chunk_size), start=start):
+            text, error = _load_resume(item)
+            if error is not None:
+                if failed is None:
+                    raise RuntimeError(f"Failed to read {error['path']}: {error['error']}")
+                failed.append({"candidate_id": row, **error})
+            texts.append(text)
+        if not texts:
+            return
+        yield start, _encode_chunk(model, texts, cache)
+        start += len(texts)
+
+
+def open_embedding_memmap(path: str, count: int, dtype: str = "float32", mode: str = "w+") -> np.memmap:
+    """
+    Create (or open) a disk-backed (count, 768) embedding array.
+
+    Args:
+        path: File path of the raw memmap
+        count: Number of rows
+        dtype: "float32" or "float16" (default: "float32")
+        mode: numpy memmap mode, "w+" to create, "r" / "r+" to reopen (default: "w+")
+
+    Returns:
+        numpy memmap of shape (count, 768)
+    """
+    if dtype not in ("float32", "float16"):
+        raise ValueError("dtype must be 'float32' or 'float16'")
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(count, EMBEDDING_DIM))
+
+
+def encode_into(
+    model,
+    resumes: Iterable[ResumeSource],
+    out: np.ndarray,
+    chunk_size: int = 256,
+    cache: Optional[EmbeddingCache] = None,
+    failed: Optional[List[Dict]] = None
+) -> int:
+    """
+    Encode resumes directly into a pre-allocated or memory-mapped array.
+
+    Rows of unreadable files are written as zero vectors and reported in
+    failed (see iter_embedding_chunks()).
+
+    Args:
+        model: Loaded SentenceTransformer model (or coalescer)
+        resumes: Iterable of resume texts (str) or os.PathLike paths
+        out: Array of shape (>= N, 768), e.g. from open_embedding_memmap()
+        chunk_size: Number of resumes encoded per model call (default: 256)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+        failed: Optional list receiving one dict per unreadable file
+                (default: None - an unreadable file raises RuntimeError)
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If out has the wrong shape or is too small
+        RuntimeError: If a file cannot be read and failed is None
+    """
+    if out.ndim != 2 or out.shape[1] != EMBEDDING_DIM:
+        raise ValueError(f"out must have shape (N, {EMBEDDING_DIM})")
+
+    written = 0
+    for start, embeddings in iter_embedding_chunks(model, resumes, chunk_size, cache, failed):
+        end = start + len(embeddings)
+        if end > out.shape[0]:
+            raise ValueError(f"out has {out.shape[0]} rows but more resumes were provided")
+        out[start:end] = embeddings
+        written = end
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return written
+
+
+def stream_match_for_recruiter(
+    jd_text: str,
+    resumes: Iterable[ResumeSource],
+    min_score_threshold: float = 0.50,
+    chunk_size: int = 256,
+    model=None,
+    cache: Optional[EmbeddingCache] = None,
+    out: Optional[np.ndarray] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Dict:
+    """
+    Streaming variant of batch_match_for_recruiter() for very large pools.
+
+    Each chunk is scored as soon as it is encoded; only the float32 score
+    vector (4 bytes per resume) grows with corpus size. If out is given,
+    embeddings are also written into it (see encode_into()).
+
+    Args:
+        jd_text: Job description text
+        resumes: Iterable of resume texts (str) or os.PathLike paths
+        min_score_threshold: Minimum similarity score required (default: 0.50)
+        chunk_size: Number of resumes encoded per model call (default: 256)
+        model: Optional pre-loaded model instance (for backend efficiency)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+        out: Optional (N, 768) array / memmap receiving the embeddings
+        limit: Optional page size (default: None, all qualified)
+        offset: Number of top-ranked candidates to skip when paging (default: 0)
+
+    Returns:
+        Same format as batch_match_for_recruiter(); candidate_id is the
+        position of the resume in the input stream. Files that could not be
+        read or extracted are not scored or ranked; they are listed under
+            "failed": [{"candidate_id", "path", "error", "error_type"}, ...]
+
+    Raises:
+        ValueError: If inputs are invalid
+        RuntimeError: If encoding fails
+    """
+    if not jd_text or not isinstance(jd_text, str):
+        raise ValueError("jd_text must be a non-empty string")
+
+    if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
+        raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
+
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError("limit must be a non-negative integer")
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("offset must be a non-negative integer")
+
+    if out is not None and (out.ndim != 2 or out.shape[1] != EMBEDDING_DIM):
+        raise ValueError(f"out must have shape (N, {EMBEDDING_DIM})")
+
+    model = _resolve_model(model)
+
+    try:
+        jd_embedding = generate_embeddings(model, [jd_text], cache=cache)[0]
+
+        failed: List[Dict] = []
+        score_chunks: List[np.ndarray] = []
+        for start, embeddings in iter_embedding_chunks(model, resumes, chunk_size, cache, failed):
+            if out is not None:
+                if start + len(embeddings) > out.shape[0]:
+                    raise ValueError(f"out has {out.shape[0]} rows but more resumes were provided")
+                out[start:start + len(embeddings)] = embeddings
+            score_chunks.append(compute_similarity(jd_embedding, embeddings).astype(np.float32))
+
+        similarities = np.concatenate(score_chunks) if score_chunks else np.array([], dtype=np.float32)
+        if isinstance(out, np.memmap):
+            out.flush()
+
+        # Failed rows never meet a threshold (-inf), so they are not ranked
+        if failed:
+            similarities[[f["candidate_id"] for f in failed]] = -np.inf
+
+        shortlisted = int(np.count_nonzero(similarities.astype(np.float64) >= min_score_threshold))
+
+        return {
+            "total_candidates": int(similarities.shape[0]),
+            "shortlisted": shortlisted,
+            "results": list(iter_ranked_results(similarities, min_score_threshold, limit, offset)),
+            "failed": failed
+        }
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Error during streaming resume matching: {str(e)}")
@@ -0,0 +1,68 @@
+"""
+Benchmark: Single-Pass Batched Encoding
+Compares two encode() calls (JD, then resumes) against one joint,
+length-sorted batch via encode_jd_and_resumes()
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import encode_jd_and_resumes, generate_embeddings, load_model
+
+jd = "Backend Developer with Spring Boot, REST APIs, SQL, Docker. 2-4 years of experience required."
+
+resume_pool = [
+    "Backend developer with 3 years experience in Spring Boot, REST APIs, and SQL. Worked on microservices.",
+    "Frontend engineer skilled in React, JavaScript, and CSS.",
+    "Software engineer with experience in Java, SQL, Docker, and RESTful services. " * 4,
+    "Data analyst with Python, Pandas, and Machine Learning experience.",
+    "DevOps engineer. Kubernetes, Terraform, AWS, GitHub Actions, observability with Prometheus. " * 2,
+]
+
+BATCH_SIZES = [1, 10, 100, 1000]
+REPEATS = 3
+
+
+def two_pass(model, resumes):
+    jd_embedding = generate_embeddings(model, [jd])[0]
+    resume_embeddings = generate_embeddings(model, resumes)
+    return jd_embedding, resume_embeddings
+
+
+def single_pass(model, resumes):
+    jd_embeddings, resume_embeddings = encode_jd_and_resumes(model, [jd], resumes)
+    return jd_embeddings[0], resume_embeddings
+
+
+def best_time(fn, model, resumes) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(model, resumes)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("BATCHED ENCODING BENCHMARK - resumes/sec")
+    print("=" * 80)
+
+    model = load_model()
+    single_pass(model, resume_pool)  # Warm-up
+    print("✅ Model loaded\n")
+
+    # Both paths must produce the same embeddings
+    jd_a, resumes_a = two_pass(model, resume_pool)
+    jd_b, resumes_b = single_pass(model, resume_pool)
+    assert np.allclose(jd_a, jd_b, atol=1e-5) and np.allclose(resumes_a, resumes_b, atol=1e-5)
+
+    print(f"{'Resumes':>8}{'two-pass /s':>16}{'single-pass /s':>18}{'speedup':>10}")
+    for n in BATCH_SIZES:
+        resumes = [resume_pool[i % len(resume_pool)] + f" #{i}" for i in range(n)]
+        before = best_time(two_pass, model, resumes)
+        after = best_time(single_pass, model, resumes)
+        print(f"{n:>8}{n / before:>16.1f}{n / after:>18.1f}{before / after:>9.2f}x")
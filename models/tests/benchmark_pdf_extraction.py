@@ -0,0 +1,210 @@
+"""
+Benchmark: PDF Extraction Throughput and Quality
+Generates a reproducible synthetic corpus (single/multi-column, long,
+tables, accented text, bottom-up content streams) and measures each extraction engine, the "fast"
+strategy and the parallel batch API: pages/s, files/s, peak RSS, and
+word-order agreement with the ground truth and between engines
+
+Each mode runs in a fresh process, so peak RSS is per mode.
+
+Usage:
+    python benchmark_pdf_extraction.py                      # 20 documents per kind
+    python benchmark_pdf_extraction.py --quick              # 4 documents per kind
+    python benchmark_pdf_extraction.py --json results.json  # save results
+    python benchmark_pdf_extraction.py --baseline results.json
+        # exit 1 if pages/s, peak RSS or quality regressed past --tolerance
+"""
+
+import sys
+import os
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from typing import Dict, List
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic_pdfs import CORPUS_KINDS, write_benchmark_corpus
+
+MODES = ("pymupdf", "pdfplumber", "fast", "batch")
+COMPARE_WORDS = 3000          # Cap for the O(n^2) word alignment
+QUALITY_TOLERANCE = 0.02      # Allowed absolute drop in similarity vs baseline
+
+
+def _rss_mb(who: int) -> float:
+    import resource
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024   # bytes on macOS, KB on Linux
+
+
+def run_mode(mode: str, paths: List[str], workers: int) -> Dict:
+    """Extract the corpus with one mode (runs in its own process)."""
+    import resource
+    from pdf_to_text import (
+        extract_resume_batch, extract_resume_text, extract_text_with_pdfplumber, extract_text_with_pymupdf,
+        get_extraction_stats, reset_extraction_stats
+    )
+
+    extractors = {
+        "pymupdf": extract_text_with_pymupdf,
+        "pdfplumber": extract_text_with_pdfplumber,
+        "fast": lambda path: extract_resume_text(path, strategy="fast"),
+    }
+
+    if mode == "batch":
+        start = time.perf_counter()
+        results = extract_resume_batch(paths, num_workers=workers, strategy="fast")
+        seconds = time.perf_counter() - start
+        texts = [r["text"] for r in results]
+        errors = sum(not r["ok"] for r in results)
+        base_rss = _rss_mb(resource.RUSAGE_SELF)
+    else:
+        extract = extractors[mode]
+        extract(paths[0])   # Imports and first-call setup outside the timing
+        reset_extraction_stats()
+        base_rss = _rss_mb(resource.RUSAGE_SELF)
+        texts = []
+        errors = 0
+        start = time.perf_counter()
+        for path in paths:
+            try:
+                texts.append(extract(path))
+            except Exception:
+                texts.append("")
+                errors += 1
+        seconds = time.perf_counter() - start
+
+    return {
+        "seconds": seconds,
+        "texts": texts,
+        "errors": errors,
+        "escalation_rate": get_extraction_stats()["escalation_rate"] if mode == "fast" else None,
+        "base_rss_mb": base_rss,
+        # Largest single process: this one, or a batch worker
+        "peak_rss_mb": max(_rss_mb(resource.RUSAGE_SELF), _rss_mb(resource.RUSAGE_CHILDREN)),
+    }
+
+
+def similarity(a: str, b: str) -> float:
+    """Word-order similarity (1.0 = same words in the same order)."""
+    words_a, words_b = a.split()[:COMPARE_WORDS], b.split()[:COMPARE_WORDS]
+    if not words_a and not words_b:
+        return 1.0
+    return SequenceMatcher(None, words_a, words_b, autojunk=False).ratio()
+
+
+def find_regressions(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    regressions = []
+    for mode, base in baseline.get("modes", {}).items():
+        now = current["modes"].get(mode)
+        if now is None:
+            continue
+        if now["pages_per_sec"] < base["pages_per_sec"] * (1 - tolerance):
+            regressions.append(f"{mode}: {now['pages_per_sec']:.1f} pages/s vs baseline {base['pages_per_sec']:.1f}")
+        if now["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(f"{mode}: peak RSS {now['peak_rss_mb']:.0f} MB vs baseline {base['peak_rss_mb']:.0f}")
+    for kind, base in baseline.get("quality", {}).items():
+        for column, value in base.items():
+            now = current["quality"].get(kind, {}).get(column)
+            if now is not None and now < value - QUALITY_TOLERANCE:
+                regressions.append(f"{kind}/{column}: similarity {now:.3f} vs baseline {value:.3f}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--per-kind", type=int, default=20, help="Documents per corpus kind (default: 20)")
+    parser.add_argument("--quick", action="store_true", help="4 documents per kind")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Batch API workers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Compare against a previous --json file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative drop in pages/s / growth in RSS (default: 0.25)")
+    args = parser.parse_args()
+    per_kind = 4 if args.quick else args.per_kind
+
+    print("=" * 80)
+    print(f"PDF EXTRACTION BENCHMARK ({per_kind} documents x {len(CORPUS_KINDS)} kinds)")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        documents = write_benchmark_corpus(tmp, per_kind=per_kind, seed=args.seed)
+        paths = [doc["path"] for doc in documents]
+        total_pages = sum(doc["pages"] for doc in documents)
+        print(f"Corpus: {len(documents)} files, {total_pages} pages (seed {args.seed})\n")
+
+        runs = {}
+        context = multiprocessing.get_context("spawn")
+        for mode in MODES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                runs[mode] = executor.submit(run_mode, mode, paths, args.workers).result()
+
+    assert runs["batch"]["texts"] == runs["fast"]["texts"], "Batch API must match sequential extraction"
+
+    results = {
+        "corpus": {"per_kind": per_kind, "files": len(documents), "pages": total_pages, "seed": args.seed},
+        "modes": {},
+        "quality": {},
+    }
+
+    print(f"{'Mode':<24}{'seconds':>9}{'pages/s':>10}{'files/s':>10}{'peak RSS MB':>13}{'errors':>8}")
+    for mode, run in runs.items():
+        label = f"batch (fast, {args.workers} workers)" if mode == "batch" else mode
+        stats = {
+            "seconds": round(run["seconds"], 3),
+            "pages_per_sec": round(total_pages / run["seconds"], 1),
+            "files_per_sec": round(len(documents) / run["seconds"], 1),
+            "peak_rss_mb": round(run["peak_rss_mb"], 1),
+            "errors": run["errors"],
+        }
+        if run["escalation_rate"] is not None:
+            stats["escalation_rate"] = run["escalation_rate"]
+        results["modes"][mode] = stats
+        print(f"{label:<24}{stats['seconds']:>9.2f}{stats['pages_per_sec']:>10.1f}"
+              f"{stats['files_per_sec']:>10.1f}{stats['peak_rss_mb']:>13.1f}{stats['errors']:>8}")
+
+    print(f"\n\"fast\" escalated {results['modes']['fast']['escalation_rate']:.0%} of files to pdfplumber")
+
+    columns = ("pymupdf", "pdfplumber", "fast", "agreement")
+    print("\nText quality: word-order similarity to ground truth (agreement = pymupdf vs pdfplumber)")
+    print(f"{'Kind':<16}" + "".join(f"{c:>12}" for c in columns))
+    for kind in CORPUS_KINDS:
+        indices = [i for i, doc in enumerate(documents) if doc["kind"] == kind]
+        row = {}
+        for mode in ("pymupdf", "pdfplumber", "fast"):
+            row[mode] = sum(similarity(runs[mode]["texts"][i], documents[i]["truth"]) for i in indices) / len(indices)
+        row["agreement"] = sum(
+            similarity(runs["pymupdf"]["texts"][i], runs["pdfplumber"]["texts"][i]) for i in indices
+        ) / len(indices)
+        results["quality"][kind] = {c: round(row[c], 4) for c in columns}
+        print(f"{kind:<16}" + "".join(f"{row[c]:>12.3f}" for c in columns))
+
+    assert results["quality"]["single_column"]["agreement"] > 0.99, "Engines must agree on plain resumes"
+    # "fast" keeps PyMuPDF where the engines read alike and escalates where
+    # PyMuPDF follows a wrong content-stream order
+    for kind, row in results["quality"].items():
+        if kind != "bottom_up":
+            assert abs(row["fast"] - row["pymupdf"]) < 1e-3, f"{kind} must stay on the fast path"
+    assert results["quality"]["bottom_up"]["fast"] == results["quality"]["bottom_up"]["pdfplumber"], \
+        "Bottom-up streams must escalate to pdfplumber"
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n❌ Regressions vs baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n✅ No regressions vs baseline")
+
+    print("\n✅ PDF extraction benchmark complete!")
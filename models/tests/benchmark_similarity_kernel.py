@@ -0,0 +1,75 @@
+"""
+Benchmark: Similarity Scoring Kernel
+Compares sklearn cosine_similarity against score_matrix() (normalized dot
+product) for 1 JD x N resumes and M JDs x N resumes, with float32 and
+float16 resume storage
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import score_matrix
+
+try:
+    from sklearn.metrics.pairwise import cosine_similarity
+    HAS_SKLEARN = True
+except ImportError:
+    HAS_SKLEARN = False
+
+REPEATS = 5
+
+CASES = [
+    (1, 1),
+    (1, 10_000),
+    (1, 100_000),
+    (100, 10_000),
+    (2_000, 1),      # All open jobs vs one new resume
+]
+
+
+def normalized(rng, n):
+    vectors = rng.standard_normal((n, 768)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def best_ms(fn) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("SIMILARITY KERNEL BENCHMARK (best of 5, ms)")
+    print("=" * 80)
+    if not HAS_SKLEARN:
+        print("⚠️  scikit-learn not installed - sklearn column skipped\n")
+
+    rng = np.random.default_rng(0)
+    print(f"{'M x N':>16}{'sklearn':>12}{'kernel f32':>12}{'kernel f16':>12}{'max |Δ| f16':>14}")
+
+    for m, n in CASES:
+        jds, resumes = normalized(rng, m), normalized(rng, n)
+        resumes_f16 = resumes.astype(np.float16)
+
+        kernel = best_ms(lambda: score_matrix(jds, resumes))
+        kernel_f16 = best_ms(lambda: score_matrix(jds, resumes_f16))
+
+        reference = score_matrix(jds, resumes)
+        f16_error = float(np.max(np.abs(score_matrix(jds, resumes_f16) - reference)))
+
+        if HAS_SKLEARN:
+            sklearn_ms = best_ms(lambda: np.clip(cosine_similarity(jds, resumes), 0.0, 1.0))
+            assert np.allclose(np.clip(cosine_similarity(jds, resumes), 0.0, 1.0), reference, atol=1e-5)
+            sklearn_col = f"{sklearn_ms:>12.3f}"
+        else:
+            sklearn_col = f"{'-':>12}"
+
+        assert f16_error < 2e-3, "float16 storage must stay within 2e-3 of float32"
+        print(f"{f'{m:,} x {n:,}':>16}{sklearn_col}{kernel:>12.3f}{kernel_f16:>12.3f}{f16_error:>14.5f}")
@@ -0,0 +1,73 @@
+"""
+Benchmark: Skill Explanation Overhead
+Measures evaluate_application() latency with and without explain_skills
+(whole-resume and chunked modes) and checks the overhead stays within budget
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import load_model, evaluate_application
+from skill_explainer import get_skill_explainer
+
+REQUESTS = 200
+OVERHEAD_BUDGET_MS = 3.0
+
+JD = (
+    "We are hiring a Senior Java Developer. Requirements: Java, Spring Boot, "
+    "Microservices, REST APIs, PostgreSQL, Docker, Kubernetes, AWS, CI/CD, Git. "
+    "Experience with Kafka and Terraform is a plus."
+)
+
+RESUME = (
+    "Backend engineer with 6 years of Java and Spring Boot experience. Designed "
+    "microservices exposing REST APIs backed by PostgreSQL and Redis. Containerised "
+    "services with Docker and deployed to AWS through Jenkins pipelines. Comfortable "
+    "with Git, Agile and unit testing. "
+) * 6
+
+
+def latencies_ms(**kwargs) -> np.ndarray:
+    timings = []
+    for i in range(REQUESTS):
+        resume = f"{RESUME} Candidate {i}."   # New resume each time, as in production
+        start = time.perf_counter()
+        evaluate_application(JD, resume, 0.5, model=model, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.array(timings)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("SKILL EXPLANATION BENCHMARK")
+    print("=" * 80)
+
+    model = load_model()
+
+    result = evaluate_application(JD, RESUME, 0.5, model=model, explain_skills=True)
+    print(f"Reason: {result['reason']}\n")
+    assert "Spring Boot" in result["skills"]["matched"]
+    assert "Docker" in result["skills"]["matched"]
+    assert "Kubernetes" in result["skills"]["missing"]
+
+    # Vocabulary encode is a one-off cost per model
+    explainer = get_skill_explainer()
+    explainer.clear()
+    start = time.perf_counter()
+    explainer.skill_embeddings(model)
+    print(f"One-off vocabulary encode ({len(explainer.vocabulary)} skills): "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    print(f"{'Mode':<24}{'p50 base':>10}{'p50 +skills':>13}{'overhead':>11}")
+    for label, kwargs in [("whole resume", {}), ("chunked (windows)", {"chunked": True})]:
+        latencies_ms(**kwargs)   # Warm up JD registry and caches
+        base = np.median(latencies_ms(**kwargs))
+        explained = np.median(latencies_ms(explain_skills=True, **kwargs))
+        overhead = explained - base
+        print(f"{label:<24}{base:>10.2f}{explained:>13.2f}{overhead:>11.2f}")
+        assert overhead < OVERHEAD_BUDGET_MS, f"Skill explanations add {overhead:.2f} ms (budget {OVERHEAD_BUDGET_MS} ms)"
+
+    print(f"\n✅ Skill explanations within {OVERHEAD_BUDGET_MS} ms budget!")
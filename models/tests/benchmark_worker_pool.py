@@ -0,0 +1,56 @@
+"""
+Benchmark: Multi-Process Embedding Worker Pool
+Scaling of resumes/sec from 1 to N worker processes vs the in-process model
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import generate_embeddings, load_model
+from embedding_pool import EmbeddingWorkerPool
+
+RESUMES = 2000
+
+resume_pool = [
+    "Backend developer with 3 years experience in Spring Boot, REST APIs, and SQL. Worked on microservices.",
+    "Frontend engineer skilled in React, JavaScript, and CSS. Built design systems and dashboards.",
+    "Software engineer with experience in Java, SQL, Docker, and RESTful services. " * 3,
+    "Data analyst with Python, Pandas, and Machine Learning experience.",
+]
+
+
+def worker_counts() -> list:
+    cpu_count = os.cpu_count() or 1
+    counts, n = [], 1
+    while n < cpu_count:
+        counts.append(n)
+        n *= 2
+    return counts + [cpu_count]
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(f"WORKER POOL SCALING - {RESUMES} resumes, {os.cpu_count()} CPUs")
+    print("=" * 80)
+
+    resumes = [resume_pool[i % len(resume_pool)] + f" #{i}" for i in range(RESUMES)]
+
+    model = load_model()
+    generate_embeddings(model, resumes[:32])  # Warm-up
+    start = time.perf_counter()
+    reference = generate_embeddings(model, resumes)
+    baseline = RESUMES / (time.perf_counter() - start)
+    print(f"\n{'In-process':<14}{baseline:>12.1f} resumes/s")
+
+    for n in worker_counts():
+        with EmbeddingWorkerPool(num_workers=n) as pool:
+            pool.warm_up()
+            start = time.perf_counter()
+            embeddings = generate_embeddings(pool, resumes)
+            rate = RESUMES / (time.perf_counter() - start)
+
+        assert np.allclose(embeddings, reference, atol=1e-4), "Pool embeddings must match in-process model"
+        print(f"{f'{n} worker(s)':<14}{rate:>12.1f} resumes/s  {rate / baseline:>5.2f}x")
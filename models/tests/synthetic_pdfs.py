@@ -0,0 +1,307 @@
+"""
+Synthetic resume PDFs for extraction tests and benchmarks
+Writes minimal, valid PDF files by hand (no PDF library needed)
+
+Each page is a list of (x, y, text) runs drawn in Helvetica with
+WinAnsiEncoding, so Latin-1 text (accents, bullets) round-trips through
+pdfplumber and PyMuPDF. Scripts outside cp1252 (CJK, Cyrillic) would need
+an embedded font and are not generated.
+
+write_benchmark_corpus() mixes single-column, two-column, long, table and
+accented-text resumes and records each document's reading-order text, so
+benchmarks can score extraction quality as well as speed.
+"""
+
+import os
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+TextRun = Tuple[float, float, str]
+
+SKILLS = ["Java", "Spring Boot", "Python", "Django", "React", "TypeScript", "AWS", "Docker",
+          "Kubernetes", "PostgreSQL", "Kafka", "Terraform", "Redis", "GraphQL", "Spark", "Node.js"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimised", "Maintained", "Automated", "Shipped"]
+OBJECTS = ["payment APIs", "data pipelines", "a design system", "CI/CD pipelines", "the search service",
+           "a mobile backend", "analytics dashboards", "a recommendation engine", "the auth service"]
+
+
+def _escape(text: str) -> bytes:
+    """PDF literal string body: escape delimiters, octal-encode non-ASCII (cp1252)."""
+    out = bytearray()
+    for byte in text.encode("cp1252", errors="replace"):
+        if byte in (0x28, 0x29, 0x5C):          # ( ) \
+            out += b"\\" + bytes([byte])
+        elif byte < 0x20 or byte > 0x7E:
+            out += b"\\%03o" % byte
+        else:
+            out.append(byte)
+    return bytes(out)
+
+
+def pdf_bytes(
+    pages: Sequence[Sequence[TextRun]],
+    font_size: float = 11,
+    images_per_page: Sequence[int] = ()
+) -> bytes:
+    """
+    Build a PDF document.
+
+    Args:
+        pages: One list of (x, y, text) runs per page (origin bottom-left, points)
+        font_size: Helvetica size in points (default: 11)
+        images_per_page: Number of tiny image XObjects drawn on each page
+                         (default: none)
+
+    Returns:
+        PDF file contents
+    """
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")   # Filled in once the page tree id is known
+    pages_id = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    page_ids = []
+    for number, runs in enumerate(pages):
+        content = bytearray(b"BT\n/F1 %g Tf\n" % font_size)
+        for x, y, text in runs:
+            content += b"1 0 0 1 %.2f %.2f Tm (" % (x, y) + _escape(text) + b") Tj\n"
+        content += b"ET\n"
+
+        xobjects = bytearray()
+        image_count = images_per_page[number] if number < len(images_per_page) else 0
+        for i in range(image_count):
+            # 1x1 grey pixel; each image is its own object, as in scanned/pasted pages
+            image = add(
+                b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"
+            )
+            xobjects += b"/Im%d %d 0 R " % (i, image)
+            content += b"q 4 0 0 4 %d %d cm /Im%d Do Q\n" % (20 + 5 * (i % 100), 20 + 5 * (i // 100), i)
+
+        resources = b"/Font << /F1 %d 0 R >>" % font
+        if xobjects:
+            resources += b" /XObject << " + bytes(xobjects) + b">>"
+        stream = add(b"<< /Length %d >>\nstream\n" % len(content) + bytes(content) + b"endstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << %s >> /Contents %d 0 R >>"
+            % (pages_id, PAGE_WIDTH, PAGE_HEIGHT, resources, stream)
+        ))
+
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % p for p in page_ids), len(page_ids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(out)
+
+
+def line_runs(lines: Sequence[str], x: float = 50, top: float = 750, leading: float = 14) -> List[TextRun]:
+    """Lay out lines top to bottom starting at (x, top)."""
+    return [(x, top - i * leading, line) for i, line in enumerate(lines)]
+
+
+def two_column_runs(
+    left: Sequence[str],
+    right: Sequence[str],
+    x_left: float = 50,
+    x_right: float = 320,
+    top: float = 750,
+    leading: float = 14
+) -> List[TextRun]:
+    """
+    Side-by-side columns drawn row by row (left, right, left, ...), the
+    content-stream order that makes naive extractors interleave columns.
+    """
+    runs: List[TextRun] = []
+    for i in range(max(len(left), len(right))):
+        y = top - i * leading
+        if i < len(left):
+            runs.append((x_left, y, left[i]))
+        if i < len(right):
+            runs.append((x_right, y, right[i]))
+    return runs
+
+
+def resume_lines(rng: np.random.Generator, index: int, count: int = 48) -> List[str]:
+    """Plausible resume text, one entry per line."""
+    skills = ", ".join(rng.choice(SKILLS, 6, replace=False))
+    lines = [
+        f"Candidate {index}",
+        f"Software Engineer - {int(rng.integers(1, 15))} years experience",
+        f"Skills: {skills}",
+        "Experience",
+    ]
+    while len(lines) < count:
+        lines.append(
+            f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} for {int(rng.integers(2, 90))} teams "
+            f"({int(rng.integers(2012, 2025))})"
+        )
+    return lines
+
+
+def write_resume_pdf(path: str, rng: np.random.Generator, index: int, pages: int = 1) -> str:
+    """Write a resume PDF with `pages` pages of 48 lines each."""
+    with open(path, "wb") as f:
+        f.write(pdf_bytes([line_runs(resume_lines(rng, index)) for _ in range(pages)]))
+    return path
+
+
+def write_corpus(directory: str, count: int, pages: int = 1, seed: int = 0) -> List[str]:
+    """
+    Write `count` synthetic resume PDFs into a directory.
+
+    Returns:
+        List of file paths
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    return [
+        write_resume_pdf(os.path.join(directory, f"resume_{i:05d}.pdf"), rng, i, pages)
+        for i in range(count)
+    ]
+
+
+# ============================================================================
+# BENCHMARK CORPUS
+# ============================================================================
+
+CORPUS_KINDS = ("single_column", "multi_column", "long", "tables", "unicode", "bottom_up")
+LONG_PAGES = 12
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+ROLES = ["Backend Engineer", "Data Engineer", "Tech Lead", "SRE", "Frontend Engineer", "ML Engineer"]
+UNICODE_NAMES = ["José Álvarez", "Zoë Müller", "François Lefèvre", "Søren Ødegård", "Núria Peña", "Chloé Brontë"]
+UNICODE_CITIES = ["Zürich", "São Paulo", "Malmö", "Besançon", "Reykjavík", "Kraków"]
+UNICODE_LINES = [
+    "• Led the “self-service” café ordering rollout — €2M revenue",
+    "• Reduced p99 latency by 40% (Señor Café, Köln)",
+    "• Maintained Ærø ferry booking APIs — 99.95% uptime",
+    "• Mentored 6 engineers; organised Ångström hackathon",
+    "• Migrated façade services to Kubernetes — ½ the cost",
+]
+
+
+def _tables_document(rng: np.random.Generator, index: int, rows: int = 40) -> Tuple[List[TextRun], List[str]]:
+    """Experience table drawn cell by cell, row-major."""
+    columns = [50, 190, 330, 420]
+    table = [["Company", "Role", "Years", "Stack"]]
+    for _ in range(rows):
+        start = int(rng.integers(2008, 2022))
+        table.append([
+            str(rng.choice(COMPANIES)), str(rng.choice(ROLES)),
+            f"{start}-{start + int(rng.integers(1, 4))}", str(rng.choice(SKILLS))
+        ])
+
+    runs: List[TextRun] = [(50, 760, f"Candidate {index} - Employment history")]
+    truth = [f"Candidate {index} - Employment history"]
+    for row_number, row in enumerate(table):
+        y = 735 - row_number * 16
+        runs.extend((x, y, cell) for x, cell in zip(columns, row))
+        truth.append(" ".join(row))
+    return runs, truth
+
+
+def _unicode_lines(rng: np.random.Generator, index: int, count: int = 48) -> List[str]:
+    lines = [
+        f"{rng.choice(UNICODE_NAMES)} ({index})",
+        f"Ingénieure logiciel — {rng.choice(UNICODE_CITIES)}",
+        f"Compétences: {', '.join(rng.choice(SKILLS, 5, replace=False))}",
+    ]
+    while len(lines) < count:
+        lines.append(str(rng.choice(UNICODE_LINES)))
+    return lines
+
+
+def make_benchmark_document(kind: str, rng: np.random.Generator, index: int) -> Tuple[bytes, int, str]:
+    """
+    Build one benchmark PDF.
+
+    Args:
+        kind: One of CORPUS_KINDS
+        rng: Random generator (document content)
+        index: Candidate number written into the document
+
+    Returns:
+        (PDF bytes, page count, reading-order text)
+    """
+    if kind == "single_column":
+        pages = [resume_lines(rng, index), resume_lines(rng, index)]
+        return pdf_bytes([line_runs(lines) for lines in pages]), 2, "\n".join(sum(pages, []))
+
+    if kind == "multi_column":
+        left = resume_lines(rng, index, count=40)
+        right = ["Projects"] + [
+            f"{rng.choice(SKILLS)} {rng.choice(OBJECTS)}" for _ in range(30)
+        ]
+        # Narrow font so both columns fit side by side
+        left = [line[:40] for line in left]
+        right = [line[:34] for line in right]
+        return pdf_bytes([two_column_runs(left, right)], font_size=9), 1, "\n".join(left + right)
+
+    if kind == "long":
+        pages = [resume_lines(rng, index) for _ in range(LONG_PAGES)]
+        return pdf_bytes([line_runs(lines) for lines in pages]), LONG_PAGES, "\n".join(sum(pages, []))
+
+    if kind == "tables":
+        runs, truth = _tables_document(rng, index)
+        return pdf_bytes([runs], font_size=9), 1, "\n".join(truth)
+
+    if kind == "unicode":
+        pages = [_unicode_lines(rng, index), _unicode_lines(rng, index)]
+        return pdf_bytes([line_runs(lines) for lines in pages]), 2, "\n".join(sum(pages, []))
+
+    if kind == "bottom_up":
+        # Producers that lay text out from the PDF origin (bottom-left) write
+        # the last line first: content-stream order is the reverse of reading order
+        lines = resume_lines(rng, index)
+        return pdf_bytes([line_runs(lines)[::-1]]), 1, "\n".join(lines)
+
+    raise ValueError(f"kind must be one of {CORPUS_KINDS}")
+
+
+def write_benchmark_corpus(directory: str, per_kind: int = 20, seed: int = 0) -> List[Dict]:
+    """
+    Write a mixed benchmark corpus (per_kind documents of each CORPUS_KINDS).
+
+    Returns:
+        List of {"path", "kind", "pages", "truth"} dicts
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    documents = []
+    for kind in CORPUS_KINDS:
+        for i in range(per_kind):
+            data, pages, truth = make_benchmark_document(kind, rng, i)
+            path = os.path.join(directory, f"{kind}_{i:04d}.pdf")
+            with open(path, "wb") as f:
+                f.write(data)
+            documents.append({"path": path, "kind": kind, "pages": pages, "truth": truth})
+    return documents
+
+
+def write_malformed_pdf(path: str) -> str:
+    """Write a truncated PDF (header and half an object, no xref)."""
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R")
+    return path
@@ -0,0 +1,165 @@
+"""
+Test: Concurrent Assessment Section Generation (offline)
+Tests that generate_assessment() requests its three sections concurrently,
+enforces per-section timeouts, reports partial failures and tracks latency,
+using a fake GenerativeModel with injected latency (no API key needed)
+"""
+
+import sys
+import os
+import json
+import re
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from assessment_generator import (
+    AssessmentGenerationError, generate_assessment, get_generation_stats, reset_generation_stats
+)
+
+CONFIG = {
+    "experience_years": 2,
+    "experience_level": "Mid",
+    "difficulty": "Medium",
+    "sections": {
+        "mcq": {"total_time_minutes": 20, "question_count": 5},
+        "subjective": {"topic": "SQL", "total_time_minutes": 30, "question_count": 3},
+        "coding": {"topic": "DSA", "total_time_minutes": 120, "question_count": 2}
+    }
+}
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """
+    Stands in for genai.GenerativeModel: answers each section's prompt with
+    valid JSON after an injected delay, or raises for sections in `fail`.
+    """
+
+    name = "models/fake-gemini"
+
+    def __init__(self, latency=None, fail=()):
+        self.latency = latency or {}
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _section(prompt: str) -> str:
+        if "Multiple Choice" in prompt:
+            return "mcq"
+        if "Subjective" in prompt:
+            return "subjective"
+        return "coding"
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        section = self._section(prompt)
+        count = int(re.search(r"Generate exactly (\d+)", prompt).group(1))
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency.get(section, 0.0))
+            if section in self.fail:
+                raise ConnectionError(f"{section} backend unavailable")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        if section == "mcq":
+            items = [{"question": f"Q{i}", "options": ["a", "b", "c", "d"], "correct_answer": "a",
+                      "difficulty": "Low", "estimated_time": 1} for i in range(count)]
+            return FakeResponse(json.dumps({"questions": items}))
+        if section == "subjective":
+            items = [{"question": f"SQL {i}", "difficulty": "Medium", "estimated_time": 3} for i in range(count)]
+            return FakeResponse("```json\n" + json.dumps({"questions": items}) + "\n```")
+        items = [{"problem": f"Problem {i}", "pattern": "Array + Hashing", "problem_type": "two_sum",
+                  "difficulty": "Medium", "estimated_time": 60} for i in range(count)]
+        return FakeResponse(json.dumps({"problems": items}))
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("CONCURRENT ASSESSMENT GENERATION TEST")
+    print("=" * 80)
+
+    reset_generation_stats()
+    delay = 0.4
+
+    # Sections overlap: wall time ~ slowest section, not the sum
+    model = FakeGenerativeModel(latency={"mcq": delay, "subjective": delay, "coding": delay})
+    start = time.perf_counter()
+    result = generate_assessment(CONFIG, model=model)
+    elapsed = time.perf_counter() - start
+
+    assert list(result) == ["mcq", "subjective", "coding"], "Output format must be unchanged"
+    assert len(result["mcq"]) == 5 and len(result["subjective"]) == 3 and len(result["coding"]) == 2
+    assert model.max_in_flight == 3, f"Expected 3 concurrent requests, saw {model.max_in_flight}"
+    assert elapsed < 2 * delay, f"Sections must overlap ({elapsed:.2f}s for 3 x {delay}s)"
+    print(f"✅ 3 sections of {delay}s each generated in {elapsed:.2f}s (sequential: {3 * delay:.1f}s)")
+
+    stats = get_generation_stats()
+    assert stats["assessments"] == 1 and stats["partial_failures"] == 0
+    assert stats["last_latency_ms"] < stats["avg_sequential_ms"]
+    assert all(stats["sections"][s]["calls"] == 1 for s in ("mcq", "subjective", "coding"))
+    print(f"✅ Latency tracked: {stats['last_latency_ms']:.0f} ms vs {stats['avg_sequential_ms']:.0f} ms sequential")
+
+    # A hung section times out without holding back the others
+    model = FakeGenerativeModel(latency={"mcq": 0.1, "subjective": 0.1, "coding": 3.0})
+    start = time.perf_counter()
+    try:
+        generate_assessment(CONFIG, model=model, section_timeout=0.5)
+        raise AssertionError("Timed-out section must fail the assessment")
+    except AssessmentGenerationError as e:
+        elapsed = time.perf_counter() - start
+        assert isinstance(e, RuntimeError), "Existing RuntimeError handlers must still catch it"
+        assert set(e.errors) == {"coding"} and "Timed out" in e.errors["coding"]
+        assert len(e.partial["mcq"]) == 5 and len(e.partial["subjective"]) == 3
+        assert "coding" in str(e)
+    assert elapsed < 1.5, f"Timeout must bound latency ({elapsed:.2f}s)"
+    print(f"✅ Hung section timed out after {elapsed:.2f}s; other sections kept in .partial")
+
+    # Partial results instead of an exception
+    model = FakeGenerativeModel(fail={"subjective"})
+    result = generate_assessment(CONFIG, model=model, allow_partial=True)
+    assert result["subjective"] == [] and "unavailable" in result["errors"]["subjective"]
+    assert len(result["mcq"]) == 5 and len(result["coding"]) == 2
+    assert set(result["errors"]) == {"subjective"}
+
+    complete = generate_assessment(CONFIG, model=FakeGenerativeModel(), allow_partial=True)
+    assert complete["errors"] == {}
+
+    # An injected model plus api_key: the key is for the DSA engine only, no
+    # section (re)configures or imports the Gemini SDK
+    sdk_loaded = "google.generativeai" in sys.modules
+    keyed = generate_assessment(CONFIG, api_key="x", model=FakeGenerativeModel(), allow_partial=True)
+    assert keyed["errors"] == {}, keyed["errors"]
+    assert ("google.generativeai" in sys.modules) == sdk_loaded, "Injected model must not load the SDK"
+    print("✅ allow_partial=True reports failed sections under 'errors'")
+
+    stats = get_generation_stats()
+    assert stats["assessments"] == 5 and stats["partial_failures"] == 2
+    assert stats["sections"]["coding"]["timeouts"] == 1
+    assert stats["sections"]["subjective"]["failures"] == 1
+    print(f"Stats: {json.dumps(stats, indent=2)}")
+
+    # Validation is unchanged and happens before any request
+    for bad in ({**CONFIG, "difficulty": "Impossible"}, {k: v for k, v in CONFIG.items() if k != "sections"}):
+        try:
+            generate_assessment(bad, model=FakeGenerativeModel())
+            raise AssertionError("Invalid config must be rejected")
+        except ValueError:
+            pass
+    try:
+        generate_assessment(CONFIG, model=FakeGenerativeModel(), section_timeout=0)
+        raise AssertionError("section_timeout must be positive")
+    except ValueError:
+        pass
+    print("✅ Invalid configuration rejected")
+
+    print("\n✅ Concurrent assessment generation test passed!")
@@ -0,0 +1,130 @@
+"""
+Test: Async Matcher
+Tests that the event loop stays responsive during a large batch, and
+checks concurrency limits, timeouts, cancellation, load shedding and
+parity with the blocking API
+"""
+
+import sys
+import os
+import json
+import asyncio
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ai_resume_matcher import load_model, evaluate_application, batch_match_for_recruiter
+from async_matcher import AsyncMatcher, MatcherOverloadedError
+
+JD = "Senior Python developer with Django, REST APIs, PostgreSQL and AWS experience"
+RESUME = "Python backend engineer, 5 years Django and Flask, PostgreSQL, deployed on AWS"
+
+
+class SlowEncoder:
+    """Wraps the model and adds a fixed delay per encode() call."""
+
+    def __init__(self, model, delay_s: float):
+        self.model = model
+        self.delay_s = delay_s
+
+    def encode(self, sentences, **kwargs):
+        time.sleep(self.delay_s)
+        return self.model.encode(sentences, **kwargs)
+
+
+async def heartbeat_gaps(stop: asyncio.Event) -> float:
+    """Largest gap (ms) between 10 ms ticks while the loop is busy."""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.01)
+        now = time.perf_counter()
+        worst = max(worst, (now - last) * 1000 - 10)
+        last = now
+    return worst
+
+
+async def main():
+    model = load_model()
+    resumes = [f"{RESUME} project {i}" for i in range(600)]
+
+    # Parity with the blocking API (small batch path and chunked path)
+    matcher = AsyncMatcher(model=model, chunk_size=128)
+    expected = batch_match_for_recruiter(JD, resumes, 0.3, model=model, limit=25)
+    got = await matcher.batch_match_for_recruiter(JD, resumes, 0.3, limit=25)
+    assert got["shortlisted"] == expected["shortlisted"]
+    assert [r["candidate_id"] for r in got["results"]] == [r["candidate_id"] for r in expected["results"]]
+    small = await matcher.batch_match_for_recruiter(JD, resumes[:10], 0.3)
+    assert small == batch_match_for_recruiter(JD, resumes[:10], 0.3, model=model)
+    for options in ({"dedupe": True}, {"chunked": True, "pooling": "mean"}):
+        pool = resumes[:300] * 2   # Every resume submitted twice
+        got = await matcher.batch_match_for_recruiter(JD, pool, 0.3, **options)
+        expected = batch_match_for_recruiter(JD, pool, 0.3, model=model, **options)
+        assert got["shortlisted"] == expected["shortlisted"] and got.get("duplicates") == expected.get("duplicates")
+        assert [r["candidate_id"] for r in got["results"]] == [r["candidate_id"] for r in expected["results"]]
+    single = await matcher.evaluate_application(JD, RESUME, 0.5)
+    assert single == evaluate_application(JD, RESUME, 0.5, model=model)
+    print("✅ Results match blocking API")
+
+    # Event loop keeps ticking while a slow batch runs
+    slow = AsyncMatcher(model=SlowEncoder(model, 0.05), max_workers=1, chunk_size=64)
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat_gaps(stop))
+    await slow.batch_match_for_recruiter(JD, resumes, 0.3)
+    stop.set()
+    worst_gap = await ticker
+    print(f"Worst event-loop stall during batch: {worst_gap:.1f} ms")
+    assert worst_gap < 40, "Event loop was blocked by encoding"
+
+    # Apply requests interleave with a big batch on a single worker
+    batch_task = asyncio.create_task(slow.batch_match_for_recruiter(JD, resumes, 0.3))
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await slow.evaluate_application(JD, RESUME, 0.5)
+    apply_ms = (time.perf_counter() - start) * 1000
+    await batch_task
+    print(f"Apply latency behind a 600-resume batch: {apply_ms:.0f} ms")
+    assert apply_ms < 500
+    print("✅ Large batches do not monopolise the worker")
+
+    # Timeout and cancellation: no further chunks after the caller gives up
+    try:
+        await slow.batch_match_for_recruiter(JD, resumes, 0.3, timeout=0.1)
+        raise AssertionError("Expected timeout")
+    except asyncio.TimeoutError:
+        pass
+
+    task = asyncio.create_task(slow.batch_match_for_recruiter(JD, resumes, 0.3))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    try:
+        await task
+        raise AssertionError("Expected cancellation")
+    except asyncio.CancelledError:
+        pass
+    await asyncio.sleep(0.1)
+    assert slow.stats()["in_flight"] == 0 and slow.stats()["executor_queued"] == 0
+    print("✅ Timeout and cancellation")
+
+    # Concurrency limit and load shedding
+    limited = AsyncMatcher(model=SlowEncoder(model, 0.1), max_workers=2, max_concurrency=2, max_waiting=3)
+    calls = [limited.evaluate_application(JD, f"{RESUME} {i}", 0.5) for i in range(8)]
+    outcomes = await asyncio.gather(*calls, return_exceptions=True)
+    rejected = [o for o in outcomes if isinstance(o, MatcherOverloadedError)]
+    stats = limited.stats()
+    print("Load shedding:", json.dumps(stats, indent=2))
+    assert len(rejected) == 3 and stats["rejected"] == 3
+    assert stats["completed"] == 5 and stats["max_waiting_seen"] <= 5
+    print("✅ Concurrency limit and backpressure")
+
+    for m in (matcher, slow, limited):
+        m.shutdown()
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("ASYNC MATCHER TEST")
+    print("=" * 80)
+
+    asyncio.run(main())
+
+    print("\n✅ Async matcher test passed!")
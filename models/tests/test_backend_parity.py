@@ -0,0 +1,154 @@
+"""
+Test: Inference Backend Parity + Benchmark
+Checks that int8 and ONNX backends keep cosine scores within tolerance of
+the fp32 PyTorch model, and compares resumes/sec and peak RSS per backend
+
+Each backend runs in its own subprocess so RSS numbers are not mixed.
+A backend is skipped only when its optional dependency is not installed
+(onnxruntime / optimum for ONNX); any other error, a score outside the
+tolerance or a changed ranking fails the test.
+Usage:
+    python test_backend_parity.py                 # all backends
+    python test_backend_parity.py --backend int8  # single backend (JSON line)
+"""
+
+import sys
+import os
+import importlib.util
+import itertools
+import json
+import resource
+import subprocess
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+# Maximum allowed |score_backend - score_fp32| per JD/resume pair
+TOLERANCE = {"torch": 1e-6, "onnx": 1e-3, "int8": 0.03}
+
+# Optional packages per backend; only their absence is a skip, not a failure
+OPTIONAL_DEPENDENCIES = {"onnx": ("onnxruntime", "optimum")}
+
+BENCH_RESUMES = 256
+
+jd = """
+Java Full Stack Developer with 3+ years experience in Spring Boot,
+React.js, MySQL, Docker, and AWS. Must have REST APIs and microservices.
+"""
+
+resumes = [
+    "Java Full Stack Developer with 5 years experience in Spring Boot, React.js, MySQL, Docker, AWS",
+    "Software developer with 2 years experience in Java and Spring Boot.",
+    "Student learning HTML, CSS, JavaScript",
+    "Data analyst with Python, Pandas, and Machine Learning experience.",
+    "DevOps engineer with Kubernetes, Docker, Terraform and AWS experience",
+    "Backend developer with 3 years experience in Spring Boot, REST APIs, and SQL. Worked on microservices.",
+]
+
+
+def measure(backend: str) -> dict:
+    """Load one backend, score the fixed pairs and time a bulk encode."""
+    from ai_resume_matcher import compute_similarity, encode_jd_and_resumes, load_model
+
+    start = time.perf_counter()
+    model = load_model(backend=backend)
+    load_s = time.perf_counter() - start
+
+    jd_embeddings, resume_embeddings = encode_jd_and_resumes(model, [jd], resumes)
+    scores = compute_similarity(jd_embeddings[0], resume_embeddings)
+
+    bulk = [resumes[i % len(resumes)] + f" (candidate {i})" for i in range(BENCH_RESUMES)]
+    start = time.perf_counter()
+    encode_jd_and_resumes(model, [jd], bulk)
+    encode_s = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+    return {
+        "backend": backend,
+        "scores": [float(s) for s in scores],
+        "load_s": round(load_s, 2),
+        "resumes_per_s": round(BENCH_RESUMES / encode_s, 1),
+        "peak_rss_mb": round(rss_mb, 1)
+    }
+
+
+def missing_dependencies(backend: str) -> list:
+    return [m for m in OPTIONAL_DEPENDENCIES.get(backend, ()) if importlib.util.find_spec(m) is None]
+
+
+def measure_or_skip(backend: str) -> dict:
+    """measure(), or a skip record if an optional dependency of the backend is missing."""
+    missing = missing_dependencies(backend)
+    if missing:
+        return {"backend": backend, "skipped": f"optional dependency not installed: {', '.join(missing)}"}
+    try:
+        return measure(backend)
+    except ImportError as e:
+        if (e.name or "").split(".")[0] in OPTIONAL_DEPENDENCIES.get(backend, ()):
+            return {"backend": backend, "skipped": f"optional dependency not installed: {e.name}"}
+        raise
+
+
+def rank_disagreements(scores: list, reference: list, tolerance: float) -> list:
+    """Pairs whose fp32 scores differ by more than 2 * tolerance but swap order."""
+    return [
+        (i, j) for i, j in itertools.combinations(range(len(reference)), 2)
+        if abs(reference[i] - reference[j]) > 2 * tolerance
+        and (reference[i] > reference[j]) != (scores[i] > scores[j])
+    ]
+
+
+def run_in_subprocess(backend: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--backend", backend],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        return {"backend": backend, "error": proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--backend":
+        print(json.dumps(measure_or_skip(sys.argv[2])))
+        sys.exit(0)
+
+    print("=" * 80)
+    print("BACKEND PARITY + BENCHMARK")
+    print("=" * 80)
+
+    results = {b: run_in_subprocess(b) for b in ("torch", "int8", "onnx")}
+    reference = results["torch"]
+    if "error" in reference:
+        print(f"❌ fp32 reference failed: {reference['error']}")
+        sys.exit(1)
+
+    print(f"\n{'Backend':<10}{'max |Δscore|':>14}{'resumes/s':>12}{'peak RSS MB':>14}{'load s':>9}")
+    failed = False
+    for backend, r in results.items():
+        if "skipped" in r:
+            print(f"{backend:<10}  skipped: {r['skipped']}")
+            continue
+        if "error" in r:
+            print(f"{backend:<10}  ❌ failed: {r['error']}")
+            failed = True
+            continue
+        max_diff = float(np.max(np.abs(np.array(r["scores"]) - np.array(reference["scores"]))))
+        swapped = rank_disagreements(r["scores"], reference["scores"], TOLERANCE[backend])
+        problems = []
+        if max_diff > TOLERANCE[backend]:
+            problems.append(f"exceeds {TOLERANCE[backend]}")
+        if swapped:
+            problems.append(f"ranking changed for pairs {swapped}")
+        failed |= bool(problems)
+        print(f"{backend:<10}{max_diff:>14.5f}{r['resumes_per_s']:>12}{r['peak_rss_mb']:>14}{r['load_s']:>9}"
+              f"  {'❌ ' + '; '.join(problems) if problems else '✅'}")
+
+    if failed:
+        print("\n❌ Backend parity test failed")
+        sys.exit(1)
+    print("\n✅ Backend parity test passed!")
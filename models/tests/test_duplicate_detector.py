@@ -0,0 +1,102 @@
+"""
+Test: Near-Duplicate Resume Detection (MinHash/LSH)
+Tests recall on lightly edited copies, false positives on distinct resumes,
+candidates checked per query (sub-linear), and the dedupe pass in
+batch_match_for_recruiter
+"""
+
+import sys
+import os
+import json
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from duplicate_detector import DuplicateDetector, find_near_duplicates
+
+POOL_SIZE = 5000
+COPIES = 200
+
+SKILLS = ["Java", "Spring Boot", "Python", "Django", "React", "TypeScript", "AWS", "Docker",
+          "Kubernetes", "PostgreSQL", "Kafka", "Terraform", "Go", "Redis", "GraphQL", "Spark"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimised", "Maintained", "Automated", "Shipped"]
+OBJECTS = ["payment APIs", "data pipelines", "a design system", "CI/CD pipelines", "search service",
+           "mobile backend", "analytics dashboards", "recommendation engine", "auth service"]
+
+
+def synthetic_resume(rng, i: int) -> str:
+    skills = ", ".join(rng.choice(SKILLS, 6, replace=False))
+    bullets = " ".join(
+        f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for {rng.integers(2, 90)} teams in {rng.integers(2012, 2025)}."
+        for _ in range(12)
+    )
+    return f"Candidate {i}. Software engineer with {rng.integers(1, 15)} years experience. Skills: {skills}. {bullets}"
+
+
+def light_edit(rng, text: str) -> str:
+    """Mass-application style copy: new name/contact line and one tweaked word."""
+    words = text.split()
+    words[0:2] = ["Applicant", f"{rng.integers(10**6)}."]
+    words[int(rng.integers(5, len(words)))] = "Senior"
+    return " ".join(words)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("NEAR-DUPLICATE DETECTION TEST")
+    print("=" * 80)
+
+    rng = np.random.default_rng(11)
+    originals = [synthetic_resume(rng, i) for i in range(POOL_SIZE)]
+    copied_from = rng.choice(POOL_SIZE, COPIES, replace=False)
+    copies = [light_edit(rng, originals[i]) for i in copied_from]
+
+    # Apply path: index originals, then check each copy as it "applies"
+    detector = DuplicateDetector()
+    start = time.perf_counter()
+    for i, text in enumerate(originals):
+        assert detector.check_and_add(f"app-{i}", text) == [], f"False positive for distinct resume {i}"
+    index_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    found = 0
+    for source, text in zip(copied_from.tolist(), copies):
+        matches = detector.query(text)
+        found += any(doc_id == f"app-{source}" for doc_id, _ in matches)
+    query_ms = (time.perf_counter() - start) * 1000 / COPIES
+
+    stats = detector.stats()
+    print(json.dumps(stats, indent=2))
+    print(f"Indexed {POOL_SIZE} resumes in {index_ms:.0f} ms; {query_ms:.2f} ms per duplicate check")
+    print(f"Recall on edited copies: {found}/{COPIES}")
+    assert found / COPIES >= 0.98
+    assert stats["avg_candidates_per_query"] < 5, "LSH should check a handful of candidates, not the pool"
+    print("✅ Apply-path detection")
+
+    # Bulk pass
+    texts = originals[:1000] + copies
+    representative = find_near_duplicates(texts)
+    flagged = np.flatnonzero(representative != np.arange(len(texts)))
+    in_subset = copied_from < 1000
+    assert set(flagged.tolist()) >= set((1000 + np.flatnonzero(in_subset)).tolist())
+    assert all(representative[1000 + k] == copied_from[k] for k in np.flatnonzero(in_subset).tolist())
+    print(f"✅ Bulk pass flagged {len(flagged)} duplicates among {len(texts)} resumes")
+
+    # Dedupe before scoring: each group is scored once, through its representative
+    from ai_resume_matcher import load_model, batch_match_for_recruiter
+
+    model = load_model()
+    jd = "Software engineer with Java, Spring Boot, AWS and Kafka experience"
+    batch = originals[:50] + [light_edit(rng, originals[3]), light_edit(rng, originals[7])]
+    result = batch_match_for_recruiter(jd, batch, 0.0, model=model, dedupe=True)
+    assert result["duplicates"] == {50: 3, 51: 7}
+    rows = {r["candidate_id"]: r for r in result["results"]}
+    assert 50 not in rows and 51 not in rows, "Members must not inherit a score or rank"
+    assert rows[3]["duplicates"] == [50] and rows[7]["duplicates"] == [51] and rows[0]["duplicates"] == []
+    assert result["shortlisted"] == len(result["results"]) == 50
+    assert [r["rank"] for r in result["results"]] == list(range(1, 51))
+    plain = batch_match_for_recruiter(jd, batch[:50], 0.0, model=model)
+    assert [r["candidate_id"] for r in result["results"]] == [r["candidate_id"] for r in plain["results"]]
+    print("✅ batch_match_for_recruiter(dedupe=True) encodes each group once")
+
+    print("\n✅ Duplicate detection test passed!")
@@ -0,0 +1,87 @@
+"""
+Test: Embedding Cache
+Tests that repeat scoring is served from the cache instead of the model,
+and that a model/backend switch never reuses the previous model's vectors
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ai_resume_matcher import batch_match_for_recruiter, get_model_version, load_model
+from embedding_cache import EmbeddingCache
+import json
+
+jd = "Backend Developer with Spring Boot, REST APIs, SQL, Docker"
+
+
+
+class OtherBackend:
+    """The same weights under another backend tag (what load_model(backend=...) produces)."""
+
+    model_version = "all-mpnet-base-v2:onnx"
+
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+
+    def encode(self, sentences, **kwargs):
+        self.calls += 1
+        return self.model.encode(sentences, **kwargs)
+
+
+resumes = [
+    "Backend developer with 3 years Spring Boot REST APIs SQL microservices",
+    "Frontend engineer React JavaScript",
+    "Data analyst Python Pandas ML",
+]
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("EMBEDDING CACHE TEST")
+    print("=" * 80)
+
+    model = load_model()
+    print("✅ Model loaded\n")
+
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = EmbeddingCache(max_entries=2, disk_dir=disk_dir, disk_dtype="float16")
+
+        start = time.perf_counter()
+        first = batch_match_for_recruiter(jd, resumes, min_score_threshold=0.0, model=model, cache=cache)
+        cold_ms = (time.perf_counter() - start) * 1000
+        print(f"Cold run: {cold_ms:.1f} ms  {json.dumps(cache.stats())}")
+
+        # Same JD re-scored with a different threshold - everything should be a hit
+        start = time.perf_counter()
+        second = batch_match_for_recruiter(jd, resumes, min_score_threshold=0.50, model=model, cache=cache)
+        warm_ms = (time.perf_counter() - start) * 1000
+        print(f"Warm run: {warm_ms:.1f} ms  {json.dumps(cache.stats())}")
+
+        stats = cache.stats()
+        assert stats["misses"] == len(resumes) + 1, "Cold run should miss once per distinct text"
+        assert stats["hits"] == len(resumes) + 1, "Warm run should be served entirely from cache"
+        assert stats["memory_entries"] <= 2, "LRU must respect max_entries"
+
+        # float16 disk storage must not change the scores beyond rounding
+        first_scores = {r["candidate_id"]: r["score"] for r in first["results"]}
+        for r in second["results"]:
+            assert abs(first_scores[r["candidate_id"]] - r["score"]) < 1e-3
+
+        # Backend switch: the cache (memory and disk) must miss for the new tag
+        other = OtherBackend(model)
+        assert get_model_version(other) != get_model_version(model)
+        misses = cache.stats()["misses"]
+        batch_match_for_recruiter(jd, resumes, min_score_threshold=0.0, model=other, cache=cache)
+        assert cache.stats()["misses"] == misses + len(resumes) + 1, "Another backend must not hit old vectors"
+        assert other.calls == 1, "All texts must be re-encoded by the new backend"
+
+        # ...and its entries are its own: a second run with it is all hits
+        hits = cache.stats()["hits"]
+        batch_match_for_recruiter(jd, resumes, min_score_threshold=0.0, model=other, cache=cache)
+        assert cache.stats()["hits"] == hits + len(resumes) + 1 and other.calls == 1
+        print(f"✅ Backend switch misses the cache  {json.dumps(cache.stats())}")
+
+        print("\n✅ Embedding cache test passed!")
@@ -0,0 +1,58 @@
+"""
+Test: Encoding Coalescer
+Tests that concurrent Apply evaluations share batched model.encode() calls
+(thread-pool callers and asyncio callers)
+"""
+
+import sys
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import evaluate_application, load_model, start_coalescer, stop_coalescer
+import json
+
+jd = "Java Full Stack Developer with Spring Boot, React.js, MySQL, Docker and AWS"
+
+resumes = [
+    f"Java developer number {i} with Spring Boot, React and {skill} experience"
+    for i, skill in enumerate(["Docker", "AWS", "MySQL", "Kafka", "Redis", "GraphQL", "Kotlin", "Go"] * 8)
+]
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("ENCODING COALESCER TEST")
+    print("=" * 80)
+
+    model = load_model()
+    print("✅ Model loaded\n")
+
+    # Reference scores without coalescing
+    expected = [evaluate_application(jd, r, 0.60, model=model)["score"] for r in resumes]
+
+    coalescer = start_coalescer(max_wait_ms=10, max_batch_size=32)
+
+    # Sync callers: many threads calling evaluate_application() at once
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda r: evaluate_application(jd, r, 0.60), resumes))
+
+    # Batch composition changes padding, so floats differ slightly on real models
+    assert np.allclose([r["score"] for r in results], expected, atol=1e-3), "Coalesced scores must match direct scores"
+    print("Thread callers:", json.dumps(coalescer.stats(), indent=2))
+
+    # Async callers: encode_async() from many coroutines
+    async def encode_all():
+        return await asyncio.gather(*(coalescer.encode_async([r]) for r in resumes))
+
+    embeddings = asyncio.run(encode_all())
+    assert all(e.shape == (1, 768) for e in embeddings)
+    assert np.allclose(np.vstack(embeddings), model.encode(resumes, normalize_embeddings=True), atol=1e-4)
+    print("Async callers:", json.dumps(coalescer.stats(), indent=2))
+
+    stats = coalescer.stats()
+    assert stats["batches"] < stats["requests"], "Concurrent requests should be coalesced"
+
+    stop_coalescer()
+    print("\n✅ Encoding coalescer test passed!")
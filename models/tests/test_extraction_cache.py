@@ -0,0 +1,122 @@
+"""
+Test: PDF Extraction Cache
+Tests SHA-256 keyed hits across paths/bytes, per-strategy keys, LRU
+eviction, SQLite and disk stores shared across cache instances, extractor
+version invalidation and cache-aware batch extraction
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from extraction_cache import DiskExtractionStore, ExtractionCache, SQLiteExtractionStore, pdf_digest
+from pdf_to_text import (
+    extract_resume_batch, extract_resume_text, extract_resume_text_detailed, extract_resume_texts,
+    get_extractor_version
+)
+from synthetic_pdfs import write_corpus, write_malformed_pdf
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("PDF EXTRACTION CACHE TEST")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(os.path.join(tmp, "pdfs"), 8, pages=2)
+        with open(paths[0], "rb") as f:
+            data = f.read()
+
+        cache = ExtractionCache(max_entries=100)
+        assert cache.extractor_version == get_extractor_version()
+
+        start = time.perf_counter()
+        first = extract_resume_text_detailed(paths[0], strategy="pdfplumber", cache=cache)
+        miss_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        again = extract_resume_text_detailed(data, strategy="pdfplumber", cache=cache)   # Same bytes, no path
+        hit_ms = (time.perf_counter() - start) * 1000
+
+        assert not first["cached"] and again["cached"]
+        assert again["text"] == first["text"] == extract_resume_text(paths[0])
+        assert again["engine"] == "pdfplumber"
+        assert hit_ms < miss_ms / 5, (hit_ms, miss_ms)
+        print(f"✅ Re-upload served from cache ({miss_ms:.1f} ms → {hit_ms:.2f} ms)")
+
+        # Each strategy has its own entry
+        fast = extract_resume_text_detailed(data, strategy="fast", cache=cache)
+        assert not fast["cached"] and fast["engine"] == "pymupdf"
+        assert extract_resume_text(data, strategy="fast", cache=cache) == fast["text"]
+        assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+        print("✅ Entries keyed by content hash and strategy")
+
+        small = ExtractionCache(max_entries=2)
+        for path in paths[:3]:
+            extract_resume_text(path, cache=small)
+        assert len(small) == 2 and small.stats()["evictions"] == 1
+        print("✅ Memory LRU evicts beyond max_entries")
+
+        for store_factory in (
+            lambda: SQLiteExtractionStore(os.path.join(tmp, "cache", "extractions.db")),
+            lambda: DiskExtractionStore(os.path.join(tmp, "cache", "extractions")),
+        ):
+            writer = ExtractionCache(store=store_factory())
+            texts = extract_resume_texts(paths[:4], cache=writer)
+
+            # Fresh cache instance (e.g. another worker or a restart) reads the store
+            reader = ExtractionCache(store=store_factory())
+            assert extract_resume_texts(paths[:4], cache=reader) == texts
+            stats = reader.stats()
+            assert stats["store_hits"] == 4 and stats["misses"] == 0, stats
+            assert len(reader.store) == 4
+
+            # Upgrading the extractor invalidates old entries
+            upgraded = ExtractionCache(store=store_factory(), extractor_version="pdf_to_text-next")
+            assert extract_resume_texts(paths[:4], cache=upgraded) == texts
+            stats = upgraded.stats()
+            assert stats["invalidations"] == 4 and stats["hits"] == 0, stats
+            entry = upgraded.store.get(f"{pdf_digest(data)}:pdfplumber")
+            assert entry["extractor_version"] == "pdf_to_text-next"
+            print(f"✅ {type(writer.store).__name__}: shared across instances, invalidated on version change")
+
+        # Batch: hits answered locally, misses go to the pool; failures are not cached
+        malformed = write_malformed_pdf(os.path.join(tmp, "broken.pdf"))
+        batch_cache = ExtractionCache()
+        batch = paths[4:] + [malformed]
+        first = extract_resume_batch(batch, num_workers=2, cache=batch_cache)
+        second = extract_resume_batch(batch, num_workers=2, cache=batch_cache)
+        assert [r["cached"] for r in first] == [False] * 5
+        assert [r["cached"] for r in second] == [True] * 4 + [False]
+        assert [r["text"] for r in second] == [r["text"] for r in first]
+        assert [r["path"] for r in second] == batch and second[4]["error_type"] == "RuntimeError"
+        assert extract_resume_texts(batch, num_workers=2, cache=batch_cache)[:4] == [r["text"] for r in first[:4]]
+        print(json.dumps(batch_cache.stats(), indent=2))
+        print("✅ Batch extraction consults the cache before dispatching")
+
+        # Archive reprocess: misses are read as workers free up, not all up front
+        class TrackingCache(ExtractionCache):
+            def __init__(self):
+                super().__init__()
+                self.puts = 0
+                self.max_outstanding = 0
+
+            def put(self, *args, **kwargs):
+                self.puts += 1
+                self.max_outstanding = max(self.max_outstanding, self.misses - self.puts + 1)
+                return super().put(*args, **kwargs)
+
+        archive = write_corpus(os.path.join(tmp, "archive"), 16, pages=1, seed=3)
+        tracking = TrackingCache()
+        extract_resume_batch(archive[:4], num_workers=2, cache=tracking)
+        mixed = archive[:4] + [os.path.join(tmp, "missing.pdf")] + archive[4:]
+        results = extract_resume_batch(mixed, num_workers=2, cache=tracking)
+        assert [r["cached"] for r in results] == [True] * 4 + [False] * 13
+        assert results[4]["error_type"] == "FileNotFoundError" and all(r["ok"] for r in results[5:])
+        assert [r["path"] for r in results] == mixed
+        assert tracking.max_outstanding <= 4, f"{tracking.max_outstanding} misses read ahead of the pool"
+        print(f"✅ Misses read lazily (at most {tracking.max_outstanding} PDFs held at once)")
+
+    print("\n✅ PDF extraction cache test passed!")
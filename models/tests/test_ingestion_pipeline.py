@@ -0,0 +1,180 @@
+"""
+Test: Streaming Ingestion Pipeline (PDF → text → embedding → index)
+Tests directory and iterator inputs, per-file failures, parity with the
+hand-glued extract/encode path, bounded read-ahead (backpressure), per-stage
+metrics and resuming a crashed import from its checkpoint
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import generate_embeddings, get_model_version, load_model
+from ingestion_pipeline import STAGES, IngestionPipeline
+from pdf_to_text import extract_resume_text
+from synthetic_pdfs import line_runs, pdf_bytes, resume_lines, write_corpus, write_malformed_pdf
+from vector_index import EmbeddingIndex
+
+
+class CountingEncoder:
+    """Wraps the model; counts encoded texts and can fail after some calls."""
+
+    def __init__(self, model, fail_after: int = None, delay: float = 0.0, on_encode=None):
+        self.model = model
+        self.model_version = get_model_version(model)
+        self.fail_after = fail_after
+        self.delay = delay
+        self.on_encode = on_encode
+        self.calls = 0
+        self.texts = 0
+
+    def encode(self, texts, **kwargs):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise RuntimeError("simulated crash")
+        if self.on_encode is not None:
+            self.on_encode()
+        time.sleep(self.delay)
+        self.calls += 1
+        self.texts += len(texts)
+        return self.model.encode(texts, **kwargs)
+
+
+def reference_vectors(model, paths):
+    texts = [extract_resume_text(p, strategy="fast") for p in paths]
+    return generate_embeddings(model, texts)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("INGESTION PIPELINE TEST")
+    print("=" * 80)
+
+    model = load_model()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_dir = os.path.join(tmp, "resumes")
+        paths = write_corpus(pdf_dir, 30)
+        nested = write_corpus(os.path.join(pdf_dir, "2024"), 3, seed=1)
+        write_malformed_pdf(os.path.join(pdf_dir, "broken.pdf"))
+        with open(os.path.join(pdf_dir, "notes.txt"), "w") as f:
+            f.write("not a resume")
+
+        # Directory import: ids are relative paths, failures are reported, not fatal
+        index = EmbeddingIndex()
+        pipeline = IngestionPipeline(index, model=model, num_workers=2, batch_size=8)
+        report = pipeline.run(pdf_dir)
+
+        expected_ids = [os.path.basename(p) for p in paths] + [f"2024/{os.path.basename(p)}" for p in nested]
+        assert report["state"] == "completed", report
+        assert report["indexed"] == 33 and report["failed"] == 1 and report["seen"] == 34
+        assert sorted(index.ids()) == sorted(expected_ids)
+        assert report["failures"][0]["id"] == "broken.pdf"
+        assert report["failures"][0]["error_type"] == "RuntimeError"
+        assert index.version_counts() == {get_model_version(model): 33}
+
+        reference = reference_vectors(model, paths + nested)
+        stored = np.vstack([index.get_vector(id_) for id_ in expected_ids])
+        assert np.allclose(stored, reference, atol=1e-6), "Pipeline must match extract + generate_embeddings"
+        print("✅ Directory import matches the hand-glued extract → encode path")
+
+        assert set(report["stages"]) == set(STAGES)
+        assert report["stages"]["extract"]["docs"] == 34
+        assert report["stages"]["clean"]["docs"] == 34
+        assert report["stages"]["encode"]["docs"] == 33
+        assert report["stages"]["index"]["docs"] == 33
+        assert report["bottleneck"] in STAGES
+        assert report["extraction"]["files"] == 34 and report["extraction"]["failed"] == 1
+        print("Stage throughput: " + ", ".join(
+            f"{name} {stats['docs_per_second']:.0f} docs/s ({stats['utilization']:.0%} busy)"
+            for name, stats in report["stages"].items()
+        ) + f"; bottleneck: {report['bottleneck']}")
+        print("✅ Per-stage metrics reported")
+
+        # Iterator of (id, bytes) pairs is consumed lazily: read-ahead stays bounded
+        rng = np.random.default_rng(5)
+        documents = [pdf_bytes([line_runs(resume_lines(rng, i))]) for i in range(80)]
+        pulled = [0]
+        ahead = []
+        index = EmbeddingIndex()
+
+        def uploads():
+            for i, data in enumerate(documents):
+                pulled[0] += 1
+                yield f"upload-{i}", data
+
+        encoder = CountingEncoder(model, delay=0.02, on_encode=lambda: ahead.append(pulled[0] - len(index)))
+        num_workers, batch_size, queued = 2, 4, 1
+        report = IngestionPipeline(
+            index, model=encoder, num_workers=num_workers, batch_size=batch_size, max_queued_batches=queued
+        ).run(uploads())
+
+        assert report["indexed"] == 80 and len(index) == 80 and encoder.texts == 80
+        # Workers + reorder buffer + every queue and every stage's batch in hand
+        bound = 2 * num_workers + 1 + batch_size * (3 * queued + 3)
+        assert max(ahead) <= bound, f"Read {max(ahead)} PDFs ahead of the index (bound {bound})"
+        assert max(ahead) < len(documents), "Input must not be materialized up front"
+        print(f"✅ In-memory uploads streamed; max read-ahead {max(ahead)} PDFs (bound {bound})")
+
+        # Crash mid-import, then resume from the checkpoint
+        checkpoint = os.path.join(tmp, "checkpoint")
+        crashing = CountingEncoder(model, fail_after=2)
+        failed = IngestionPipeline(
+            EmbeddingIndex(), model=crashing, num_workers=2, batch_size=8,
+            checkpoint_dir=checkpoint, checkpoint_every=8
+        )
+        try:
+            failed.run(pdf_dir)
+            raise AssertionError("Encoder crash must fail the pipeline")
+        except RuntimeError as e:
+            assert "simulated crash" in str(e)
+        crashed = failed.progress()
+        assert crashed["state"] == "failed" and crashed["indexed"] == 16 and crashed["checkpoints"] >= 2
+        segments = sorted(os.listdir(checkpoint))
+        assert segments and all(name.endswith(".npz") for name in segments), segments
+
+        counting = CountingEncoder(model)
+        index = EmbeddingIndex()
+        resumed = IngestionPipeline(
+            index, model=counting, num_workers=2, batch_size=8,
+            checkpoint_dir=checkpoint, checkpoint_every=8
+        )
+        report = resumed.run(pdf_dir)
+        done_before = 16 + sum(f["id"] == "broken.pdf" for f in crashed["failures"])
+        assert report["state"] == "completed"
+        assert report["resumed"] == done_before
+        assert counting.texts == 33 - 16, f"Resume re-encoded {counting.texts} texts"
+        assert sorted(index.ids()) == sorted(expected_ids)
+        stored = np.vstack([index.get_vector(id_) for id_ in expected_ids])
+        assert np.allclose(stored, reference, atol=1e-6)
+        print(f"✅ Crashed import resumed: {report['resumed']} documents skipped, {counting.texts} encoded")
+
+        # A completed checkpoint makes a rerun a no-op; clear_checkpoint() removes it
+        again = IngestionPipeline(EmbeddingIndex(), model=counting, num_workers=1, checkpoint_dir=checkpoint)
+        report = again.run(pdf_dir)
+        assert report["resumed"] == 34 and report["indexed"] == 0 and report["extraction"]["files"] == 0
+        assert again.clear_checkpoint() > 0 and os.listdir(checkpoint) == []
+        print("✅ Rerun of a finished import skips everything")
+
+        # Validation
+        for kwargs in ({"batch_size": 0}, {"max_queued_batches": 0}, {"checkpoint_every": 0}, {"strategy": "ocr"}):
+            try:
+                IngestionPipeline(model=model, **kwargs)
+                raise AssertionError(f"{kwargs} must be rejected")
+            except ValueError:
+                pass
+        try:
+            IngestionPipeline(model=model).run(paths[0])
+            raise AssertionError("A file is not a directory")
+        except ValueError:
+            pass
+        try:
+            IngestionPipeline(model=model, num_workers=1).run([documents[0]])
+            raise AssertionError("Bytes without an id must fail")
+        except RuntimeError as e:
+            assert "(id, pdf)" in str(e)
+        print("✅ Invalid arguments rejected")
+
+    print("\n✅ Ingestion pipeline test passed!")
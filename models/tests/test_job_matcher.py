@@ -0,0 +1,88 @@
+"""
+Test: Reverse Matching (one resume vs all open JDs)
+Tests incremental JD upserts, ranking against a brute-force reference,
+save/load of the JD matrix and match latency over a few thousand jobs
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import load_model, generate_embeddings, generate_reason
+from job_matcher import upsert_jobs, remove_jobs, match_jobs_for_resume
+from vector_index import EmbeddingIndex
+
+JOBS = {
+    "job-java": "Senior Java developer with Spring Boot, microservices and AWS experience",
+    "job-react": "Frontend engineer: React, TypeScript, CSS and accessibility",
+    "job-ml": "Machine learning engineer with Python, PyTorch and MLOps background",
+    "job-sales": "Enterprise sales manager for SaaS products, quota-carrying",
+}
+
+RESUME = "Backend engineer, 6 years Java, Spring Boot microservices deployed on AWS with Docker"
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("REVERSE MATCHING TEST")
+    print("=" * 80)
+
+    model = load_model()
+    jobs = EmbeddingIndex()
+
+    assert upsert_jobs(jobs, list(JOBS), list(JOBS.values()), model=model) == 4
+    assert upsert_jobs(jobs, list(JOBS), list(JOBS.values()), model=model) == 0, "Unchanged JDs must not be re-encoded"
+
+    JOBS["job-react"] = "Frontend engineer: React, Next.js and design systems"
+    assert upsert_jobs(jobs, ["job-react"], [JOBS["job-react"]], model=model) == 1
+    print("✅ Incremental upserts only re-encode new/edited JDs")
+
+    result = match_jobs_for_resume(RESUME, jobs, min_score_threshold=0.0, model=model)
+    print(json.dumps(result, indent=2))
+
+    # Brute-force reference with the original per-pair semantics
+    resume_emb = generate_embeddings(model, [RESUME])[0]
+    jd_embs = generate_embeddings(model, list(JOBS.values()))
+    expected = sorted(
+        ((job_id, float(np.clip(jd_embs[i] @ resume_emb, 0.0, 1.0))) for i, job_id in enumerate(JOBS)),
+        key=lambda x: x[1], reverse=True
+    )
+    # Compare scores rank by rank (tied jobs may be ordered by row position)
+    reference_scores = dict(expected)
+    assert {r["job_id"] for r in result["results"]} == set(JOBS)
+    for row, (_, score) in zip(result["results"], expected):
+        assert abs(row["score"] - score) < 1e-3
+        assert abs(row["score"] - reference_scores[row["job_id"]]) < 1e-3
+        assert row["reason"] == generate_reason(row["score"])
+    assert result["results"][0]["job_id"] == "job-java"
+    print("✅ Ranking matches brute-force reference")
+
+    remove_jobs(jobs, ["job-sales"])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "open_jobs.npz")
+        jobs.save(path)
+        restored = EmbeddingIndex.load(path)
+
+    assert upsert_jobs(restored, list(JOBS)[:3], list(JOBS.values())[:3], model=model) == 0
+    paged = match_jobs_for_resume(RESUME, restored, min_score_threshold=0.0, limit=1, offset=1, model=model)
+    assert paged["total_jobs"] == 3 and len(paged["results"]) == 1 and paged["results"][0]["rank"] == 2
+    print("✅ Save/load keeps JD matrix and hashes")
+
+    # Latency of one resume vs a few thousand open JDs (synthetic vectors)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((5000, 768)).astype(np.float32)
+    large = EmbeddingIndex()
+    large.add([f"job-{i}" for i in range(5000)], vectors / np.linalg.norm(vectors, axis=1, keepdims=True))
+
+    match_jobs_for_resume(RESUME, large, min_score_threshold=0.0, limit=20, model=model)
+    start = time.perf_counter()
+    large_result = match_jobs_for_resume(RESUME, large, min_score_threshold=0.0, limit=20, model=model)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert len(large_result["results"]) == 20
+    print(f"\n5,000 open JDs: {elapsed_ms:.1f} ms per resume (including encode)")
+
+    print("\n✅ Reverse matching test passed!")
@@ -0,0 +1,68 @@
+"""
+Test: Parallel PDF Extraction Pool
+Tests ordered results, structured per-file errors, per-file timeouts
+(hung worker killed and replaced) and parity with extract_resume_text()
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pdf_extraction_pool import PDFExtractionPool
+from pdf_to_text import extract_resume_text, extract_resume_batch, extract_resume_texts
+from synthetic_pdfs import write_corpus, write_malformed_pdf
+
+
+def hanging_extractor(path: str) -> str:
+    """Stands in for pdfplumber spinning forever on a malformed file."""
+    if "hang" in os.path.basename(path):
+        while True:
+            time.sleep(1)
+    return extract_resume_text(path)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("PDF EXTRACTION POOL TEST")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(tmp, 40, pages=2)
+        malformed = write_malformed_pdf(os.path.join(tmp, "broken.pdf"))
+        missing = os.path.join(tmp, "missing.pdf")
+        batch = paths[:10] + [malformed] + paths[10:20] + [missing] + paths[20:]
+
+        results = extract_resume_batch(batch, num_workers=4, timeout=30)
+        assert [r["path"] for r in results] == batch, "Results must keep input order"
+        assert [r["text"] for r in results if r["ok"]] == [extract_resume_text(p) for p in paths]
+        assert results[10]["ok"] is False and results[10]["error_type"] == "RuntimeError"
+        assert results[21]["ok"] is False and results[21]["error_type"] == "FileNotFoundError"
+        print("✅ Ordered results with structured errors")
+
+        # Backward-compatible wrapper
+        texts = extract_resume_texts(batch, num_workers=4)
+        assert texts[10] == "" and texts[0] == results[0]["text"]
+        print("✅ extract_resume_texts(num_workers=4) unchanged output format")
+
+        # A hung file is killed after the timeout; the rest still complete
+        hung = [os.path.join(tmp, "hang_1.pdf"), os.path.join(tmp, "hang_2.pdf")]
+        with PDFExtractionPool(num_workers=2, timeout=2.0, extractor=hanging_extractor) as pool:
+            start = time.perf_counter()
+            results = pool.extract(paths[:5] + hung + paths[5:10])
+            elapsed = time.perf_counter() - start
+            stats = pool.stats()
+
+            # Pool stays usable after respawning workers
+            again = pool.extract(paths[:4])
+
+        print(json.dumps(stats, indent=2))
+        assert [r["error_type"] for r in results[5:7]] == ["Timeout", "Timeout"]
+        assert all(r["ok"] for r in results[:5] + results[7:]) and all(r["ok"] for r in again)
+        assert stats["timeouts"] == 2 and stats["respawns"] == 2
+        assert elapsed < 15, f"Hung files must not block the batch ({elapsed:.1f}s)"
+        print("✅ Per-file timeout kills and replaces hung workers")
+
+    print("\n✅ PDF extraction pool test passed!")
@@ -0,0 +1,126 @@
+"""
+Test: Fast-Path PDF Extraction Strategy
+Tests that strategy="fast" keeps PyMuPDF output for clean resumes, escalates
+to pdfplumber on out-of-order content streams / sparse pages (but not on tables or
+row-by-row columns both engines read alike), and reports per-engine
+timings and the escalation rate
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from pdf_extraction_pool import PDFExtractionPool
+from pdf_to_text import (
+    assess_text_quality, escalation_reason, extract_resume_text, extract_resume_text_detailed,
+    extract_text_with_pymupdf, get_extraction_stats, reset_extraction_stats
+)
+from synthetic_pdfs import (
+    make_benchmark_document, pdf_bytes, line_runs, resume_lines, two_column_runs, write_corpus
+)
+
+
+def write_pdf(path: str, pages) -> str:
+    with open(path, "wb") as f:
+        f.write(pdf_bytes(pages))
+    return path
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("PDF EXTRACTION STRATEGY TEST")
+    print("=" * 80)
+
+    # Quality heuristic on plain strings
+    clean = assess_text_quality("Senior Python developer with Django and AWS experience " * 10)
+    assert escalation_reason(clean) is None
+    garbled = assess_text_quality("Senior ��thon develoer " * 20)
+    assert escalation_reason(garbled) == "garbled", garbled
+    assert escalation_reason(assess_text_quality("Jane Doe")) == "too_short"
+    assert escalation_reason(assess_text_quality("word " * 60, page_count=4)) == "sparse"
+    print("✅ Quality heuristic flags garbled, short and sparse text")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(tmp, 20, pages=2)
+        rng = np.random.default_rng(7)
+        row_by_row = two_column_runs(
+            resume_lines(rng, 1, 30), [f"Project {i}: Kafka streaming on AWS" for i in range(30)]
+        )
+        # Benchmark "bottom_up" kind: content stream written last line first,
+        # which PyMuPDF reproduces and pdfplumber re-sorts into reading order
+        data, _, truth = make_benchmark_document("bottom_up", rng, 1)
+        interleaved = os.path.join(tmp, "bottom_up.pdf")
+        with open(interleaved, "wb") as f:
+            f.write(data)
+        sparse = write_pdf(os.path.join(tmp, "sparse.pdf"), [
+            line_runs([f"Jane Doe page {i} - Python, Django, AWS, Docker"]) for i in range(4)
+        ])
+
+        reset_extraction_stats()
+        for path in paths:
+            detail = extract_resume_text_detailed(path, strategy="fast")
+            assert detail["engine"] == "pymupdf" and not detail["escalated"], detail["quality"]
+            assert detail["text"] == extract_resume_text(path)   # Same words as the pdfplumber path
+        print("✅ Clean resumes stay on the fast path")
+
+        detail = extract_resume_text_detailed(interleaved, strategy="fast")
+        assert detail["escalated"] and detail["reason"] == "interleaved", detail["quality"]
+        assert detail["engine"] == "pdfplumber"
+        assert detail["quality"]["interleave_ratio"] > 0.9
+        assert detail["text"].split() == truth.split(), "pdfplumber must restore reading order"
+        assert extract_text_with_pymupdf(interleaved).split() != truth.split()
+
+        detail = extract_resume_text_detailed(sparse, strategy="fast")
+        assert detail["escalated"] and detail["reason"] == "sparse" and detail["engine"] == "pdfplumber"
+        print("✅ Out-of-order content streams and sparse pages escalate to pdfplumber")
+
+        stats = get_extraction_stats()
+        print(json.dumps(stats, indent=2))
+        assert stats["files"] == 22 and stats["escalations"] == 2
+        assert stats["escalation_rate"] == round(2 / 22, 4)
+        assert stats["escalation_reasons"] == {"interleaved": 1, "sparse": 1}
+        # The 20 extract_resume_text() reference calls ran on pdfplumber too
+        assert stats["engines"]["pymupdf"]["calls"] == 22 and stats["engines"]["pdfplumber"]["calls"] == 22
+        assert stats["engines"]["pymupdf"]["avg_ms"] < stats["engines"]["pdfplumber"]["avg_ms"]
+        print("✅ Per-engine timing and escalation rate reported")
+
+        # Tables and row-by-row columns only move right/down: both engines read
+        # the words in the same order, so there is nothing to escalate for
+        for kind in ("tables", "multi_column"):
+            for i in range(3):
+                path = os.path.join(tmp, f"{kind}_{i}.pdf")
+                with open(path, "wb") as f:
+                    f.write(make_benchmark_document(kind, rng, i)[0])
+                detail = extract_resume_text_detailed(path, strategy="fast")
+                assert detail["engine"] == "pymupdf" and not detail["escalated"], (kind, detail["quality"])
+                assert detail["quality"]["interleave_ratio"] == 0.0, (kind, detail["quality"])
+                assert detail["text"].split() == extract_resume_text(path).split(), kind
+
+        # Overlapping row-by-row columns: pdfplumber would merge characters across them
+        path = write_pdf(os.path.join(tmp, "row_by_row.pdf"), [row_by_row])
+        detail = extract_resume_text_detailed(path, strategy="fast")
+        assert detail["engine"] == "pymupdf" and detail["quality"]["interleave_ratio"] == 0.0, detail["quality"]
+        print("✅ Tables and row-by-row columns stay on the fast path")
+
+        start = time.perf_counter()
+        extract_resume_text(paths[0], strategy="fast")
+        fast = time.perf_counter() - start
+        start = time.perf_counter()
+        extract_resume_text(paths[0])
+        slow = time.perf_counter() - start
+        print(f"fast: {fast * 1000:.1f} ms   pdfplumber: {slow * 1000:.1f} ms")
+
+        with PDFExtractionPool(num_workers=2, strategy="fast") as pool:
+            results = pool.extract(paths[:6] + [interleaved])
+            pool_stats = pool.stats()
+        assert [r["engine"] for r in results] == ["pymupdf"] * 6 + ["pdfplumber"]
+        assert pool_stats["engines"] == {"pymupdf": 6, "pdfplumber": 1}
+        assert pool_stats["escalations"] == 1
+        print("✅ Pool reports engines and escalations per file")
+
+    print("\n✅ PDF extraction strategy test passed!")
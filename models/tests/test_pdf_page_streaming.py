@@ -0,0 +1,106 @@
+"""
+Test: Page-Streaming PDF Extraction
+Tests lazy page iteration, max_pages / max_chars budgets (early exit on a
+300-page portfolio), and the size / page-count / image-heavy page guards
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from extraction_cache import ExtractionCache
+from pdf_to_text import (
+    MAX_DOCUMENT_PAGES, PDFLimitError, extract_resume_batch, extract_resume_text, extract_text_with_pymupdf,
+    iter_pdf_pages
+)
+from synthetic_pdfs import line_runs, pdf_bytes, resume_lines
+
+PORTFOLIO_PAGES = 300
+
+
+def expect_error(error_type, func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except error_type as e:
+        return str(e)
+    raise AssertionError(f"{func.__name__} should raise {error_type.__name__}")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("PAGE-STREAMING PDF EXTRACTION TEST")
+    print("=" * 80)
+
+    rng = np.random.default_rng(3)
+    portfolio = pdf_bytes([line_runs(resume_lines(rng, i)) for i in range(PORTFOLIO_PAGES)])
+
+    start = time.perf_counter()
+    full_text = extract_text_with_pymupdf(portfolio)
+    full_seconds = time.perf_counter() - start
+    all_pages = list(iter_pdf_pages(portfolio))
+    assert len(all_pages) == PORTFOLIO_PAGES and "\n".join(all_pages) == full_text
+
+    start = time.perf_counter()
+    pages = iter_pdf_pages(portfolio, engine="pdfplumber")
+    first = next(pages)
+    first_seconds = time.perf_counter() - start
+    pages.close()   # Early exit closes the document
+    assert first == all_pages[0]
+    print(f"✅ Pages stream lazily (first pdfplumber page in {first_seconds * 1000:.0f} ms, "
+          f"full PyMuPDF pass {full_seconds * 1000:.0f} ms)")
+
+    for engine in ("pymupdf", "pdfplumber"):
+        assert len(list(iter_pdf_pages(portfolio, engine, max_pages=3))) == 3
+        budgeted = list(iter_pdf_pages(portfolio, engine, max_chars=5000))
+        assert sum(len(page) for page in budgeted) == 5000 and len(budgeted) < 5
+        assert budgeted[:-1] == all_pages[:len(budgeted) - 1]
+    assert list(iter_pdf_pages(portfolio, max_chars=0)) == []
+    print("✅ max_pages / max_chars budgets stop early on both engines")
+
+    start = time.perf_counter()
+    text = extract_resume_text(portfolio, max_pages=2)
+    budget_seconds = time.perf_counter() - start
+    assert text == "\n".join(all_pages[:2])
+    fast_text = extract_resume_text(portfolio, strategy="fast", max_chars=3000)
+    assert fast_text == "\n".join(page for page in iter_pdf_pages(portfolio, max_chars=3000) if page)
+    print(f"✅ extract_resume_text(max_pages=2) on a {PORTFOLIO_PAGES}-page PDF: {budget_seconds * 1000:.0f} ms")
+
+    # Budgeted and full extractions are cached separately
+    cache = ExtractionCache()
+    short = extract_resume_text(portfolio, strategy="fast", max_pages=1, cache=cache)
+    assert extract_resume_text(portfolio, strategy="fast", cache=cache) != short
+    assert extract_resume_text(portfolio, strategy="fast", max_pages=1, cache=cache) == short
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+    # Guards: page count, file size, image-heavy pages
+    huge = pdf_bytes([line_runs([f"Page {i}"]) for i in range(MAX_DOCUMENT_PAGES + 1)])
+    message = expect_error(PDFLimitError, extract_resume_text, huge)
+    assert f"{MAX_DOCUMENT_PAGES + 1} pages" in message, message
+    expect_error(PDFLimitError, extract_resume_text, huge, strategy="fast")
+    assert len(list(iter_pdf_pages(huge, max_document_pages=None, max_pages=5))) == 5
+    expect_error(PDFLimitError, list, iter_pdf_pages(portfolio, max_bytes=len(portfolio) - 1))
+    expect_error(ValueError, list, iter_pdf_pages(portfolio, max_pages=-1))
+    expect_error(ValueError, extract_resume_text, portfolio, max_chars="1000")
+
+    resume_page = line_runs(resume_lines(rng, 0))
+    scanned = pdf_bytes([resume_page, resume_page], images_per_page=[0, 500])
+    for engine in ("pymupdf", "pdfplumber"):
+        pages = list(iter_pdf_pages(scanned, engine))
+        assert pages[0] and pages[1] == "", engine
+        assert list(iter_pdf_pages(scanned, engine, max_images_per_page=None))[1] == pages[0]
+    print("✅ Page-count / size limits raise PDFLimitError, image-heavy pages skipped")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "huge.pdf")
+        with open(path, "wb") as f:
+            f.write(huge)
+        results = extract_resume_batch([portfolio, path], num_workers=2, max_pages=2)
+        assert results[0]["text"] == "\n".join(all_pages[:2])
+        assert results[1]["error_type"] == "PDFLimitError"
+    print("✅ Batch extraction applies budgets and reports limit errors per file")
+
+    print("\n✅ Page-streaming PDF extraction test passed!")
@@ -0,0 +1,69 @@
+"""
+Test: In-Memory PDF Extraction
+Tests extraction from bytes, bytearray, memoryview and file-like objects
+(no temp files), input validation, and mixed path/buffer batches
+"""
+
+import sys
+import os
+import io
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pdf_to_text import extract_resume_batch, extract_resume_text, extract_resume_texts
+from synthetic_pdfs import write_corpus
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("IN-MEMORY PDF EXTRACTION TEST")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(tmp, 6, pages=2)
+        with open(paths[0], "rb") as f:
+            data = f.read()
+        expected = extract_resume_text(paths[0])
+
+        for strategy in (None, "fast", "pymupdf"):
+            reference = extract_resume_text(paths[0], strategy=strategy)
+            sources = [data, bytearray(data), memoryview(data), io.BytesIO(data)]
+            for source in sources:
+                assert extract_resume_text(source, strategy=strategy) == reference, (strategy, type(source))
+            with open(paths[0], "rb") as f:
+                assert extract_resume_text(f, strategy=strategy) == reference
+        print("✅ bytes / bytearray / memoryview / file-like match path extraction")
+
+        # PDF readers tolerate junk before the header
+        assert extract_resume_text(b"\r\n" + data) == expected
+
+        for bad, message in [
+            (b"<html>not a pdf</html>", "not a PDF"),
+            (io.StringIO("%PDF-1.4"), "binary mode"),
+            (12345, "PDF source must be"),
+        ]:
+            try:
+                extract_resume_text(bad)
+                raise AssertionError(f"{bad!r} should be rejected")
+            except ValueError as e:
+                assert message in str(e), str(e)
+        print("✅ Non-PDF buffers and text streams rejected with ValueError")
+
+        garbage = b"%PDF-1.4\ngarbage"
+        mixed = [paths[1], data, io.BytesIO(data), garbage, memoryview(data), paths[2]]
+        results = extract_resume_batch(mixed, num_workers=2, timeout=30)
+        assert [r["ok"] for r in results] == [True, True, True, False, True, True]
+        assert results[0]["path"] == paths[1] and results[1]["path"] == f"<in-memory PDF, {len(data)} bytes>"
+        assert results[1]["text"] == results[2]["text"] == results[4]["text"] == expected
+        assert results[5]["text"] == extract_resume_text(paths[2])
+        assert results[3]["error_type"] == "RuntimeError"
+
+        rejected = extract_resume_batch([io.StringIO("text"), data], num_workers=1)
+        assert rejected[0]["error_type"] == "ValueError" and rejected[1]["ok"]
+        print("✅ Pool batch accepts mixed paths and buffers")
+
+        texts = extract_resume_texts([paths[3], io.BytesIO(data), garbage])
+        assert texts == [extract_resume_text(paths[3]), expected, ""]
+        print("✅ extract_resume_texts() accepts buffers")
+
+    print("\n✅ In-memory PDF extraction test passed!")
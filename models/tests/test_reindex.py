@@ -0,0 +1,112 @@
+"""
+Test: Embedding Versioning and Background Re-index
+Tests version tags on stored vectors, stale detection, throttled
+re-embedding with progress metrics, pause/cancel, and version-aware
+search and caching
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import load_model, generate_embeddings, get_model_version
+from embedding_cache import EmbeddingCache
+from reindex import ReindexJob
+from vector_index import EmbeddingIndex, search_talent_pool
+
+POOL_SIZE = 2000
+OLD_VERSION = "previous-model:torch"
+
+
+def resume(i: int) -> str:
+    skills = ["Java", "Python", "React", "AWS", "Docker", "SQL", "Kubernetes", "Go"]
+    return f"Engineer {i} with {skills[i % 8]} and {skills[(i * 3) % 8]} experience, {i % 12} years"
+
+
+def stale_index(rng, texts) -> EmbeddingIndex:
+    """Index whose vectors all come from a 'previous model' (random vectors)."""
+    vectors = rng.standard_normal((len(texts), 768)).astype(np.float32)
+    index = EmbeddingIndex()
+    index.add(list(texts), vectors / np.linalg.norm(vectors, axis=1, keepdims=True),
+              metadata=[{"source": "ats"}] * len(texts), model_version=OLD_VERSION)
+    return index
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("EMBEDDING VERSIONING / RE-INDEX TEST")
+    print("=" * 80)
+
+    model = load_model()
+    version = get_model_version()
+    assert version is not None and get_model_version(model) == version
+    print(f"Current embedding version: {version}")
+
+    rng = np.random.default_rng(3)
+    texts = {f"cand-{i}": resume(i) for i in range(POOL_SIZE)}
+    index = stale_index(rng, texts)
+
+    assert len(index.stale_ids(version)) == POOL_SIZE
+    assert index.version_counts() == {OLD_VERSION: POOL_SIZE}
+    result = search_talent_pool("Senior Java developer", index, k=10, min_score_threshold=0.0, model=model, exact=True)
+    assert result["results"] == [], "Vectors from another model version must not be scored"
+    print("✅ Stale vectors detected and excluded from search")
+
+    # Full throttled re-index
+    job = ReindexJob(index, texts, model=model, batch_size=128, max_duty_cycle=0.5).start()
+    while not job.join(timeout=0.05):
+        pass
+    progress = job.progress()
+    print("Re-index:", json.dumps(progress, indent=2))
+
+    assert progress["state"] == "completed" and progress["done"] == POOL_SIZE and progress["remaining"] == 0
+    assert index.stale_ids(version) == [] and index.version_counts() == {version: POOL_SIZE}
+    assert index.get_metadata("cand-7") == {"source": "ats"}, "Metadata must survive re-embedding"
+    assert np.allclose(index.get_vector("cand-7"), generate_embeddings(model, [texts["cand-7"]])[0], atol=1e-5)
+    assert progress["duty_cycle"] <= 0.6, "Throttle must leave the encoder idle for live traffic"
+    print("✅ Re-index completed, vectors and metadata correct")
+
+    # Pause / resume / cancel; texts from a callable source with unknown ids
+    index = stale_index(rng, texts)
+    known = lambda ids: [texts[i] if int(i.split("-")[1]) % 10 else None for i in ids]
+    job = ReindexJob(index, known, model=model, batch_size=50, max_duty_cycle=0.25).start()
+    while job.progress()["done"] == 0:
+        time.sleep(0.01)
+    job.pause()
+    while job.progress()["state"] != "paused":
+        time.sleep(0.01)
+    paused_done = job.progress()["done"]
+    time.sleep(0.1)
+    assert job.progress()["done"] == paused_done, "No batches may run while paused"
+    job.resume()
+    job.cancel()
+    job.join()
+    progress = job.progress()
+    assert progress["state"] == "cancelled" and 0 < progress["done"] < POOL_SIZE
+    print(f"✅ Pause/resume/cancel ({progress['done']} re-embedded, {progress['skipped']} skipped)")
+
+    # Finish the job; ids without text stay stale
+    final = ReindexJob(index, known, model=model, max_duty_cycle=1.0).run()
+    assert final["skipped"] == POOL_SIZE // 10 and len(index.stale_ids(version)) == POOL_SIZE // 10
+
+    # Version tags survive save/load
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pool.npz")
+        index.save(path)
+        restored = EmbeddingIndex.load(path)
+    assert restored.version_counts() == index.version_counts()
+    assert restored.get_model_version("cand-10") == OLD_VERSION
+    print("✅ Version tags persisted")
+
+    # Cache entries are namespaced by version
+    cache = EmbeddingCache(model_version=OLD_VERSION)
+    cache.put("python developer", np.ones(768, dtype=np.float32))
+    cache.set_model_version(version)
+    assert cache.get("python developer") is None
+    print("✅ Cache ignores entries from another model version")
+
+    print("\n✅ Re-index test passed!")
@@ -0,0 +1,86 @@
+"""
+Test: Long-Resume Windows
+Tests split_resume_windows() window count and stride, pool_window_scores()
+max/mean pooling, and that chunked=True scores short resumes exactly like
+the default whole-resume mode
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import (
+    WINDOW_STRIDE_WORDS, WINDOW_WORDS, batch_match_for_recruiter, evaluate_application,
+    load_model, pool_window_scores, split_resume_windows
+)
+
+jd = "Senior Java developer with Spring Boot, Kafka, AWS and Docker"
+
+short_resumes = [
+    "Java developer with Spring Boot, Kafka and AWS experience",
+    "Python data engineer with Airflow and Spark",
+    "Frontend developer with React, TypeScript and CSS",
+]
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("LONG-RESUME WINDOWS TEST")
+    print("=" * 80)
+
+    # 500 words: windows start at 0, 150 and 300, the last one ending on the final word
+    long_resume = " ".join(f"word{i}" for i in range(500))
+    windows, offsets = split_resume_windows([long_resume])
+    starts = [int(w.split()[0][4:]) for w in windows]
+    assert starts == [0, WINDOW_STRIDE_WORDS, 2 * WINDOW_STRIDE_WORDS], starts
+    assert all(len(w.split()) == WINDOW_WORDS for w in windows)
+    assert windows[-1].split()[-1] == "word499", "Tail of the resume must be covered"
+    assert offsets.tolist() == [0, 3]
+
+    # 420 words: regular starts 0, 150 plus a tail window at 220
+    windows, _ = split_resume_windows([" ".join(f"word{i}" for i in range(420))])
+    assert [int(w.split()[0][4:]) for w in windows] == [0, 150, 220]
+    print(f"✅ {WINDOW_WORDS}-word windows every {WINDOW_STRIDE_WORDS} words, tail covered")
+
+    # Shorter than one window, and empty text: exactly one window each
+    windows, offsets = split_resume_windows([short_resumes[0], "", long_resume])
+    assert windows[0] == short_resumes[0]
+    assert windows[1] == ""
+    assert offsets.tolist() == [0, 1, 2, 5]
+
+    try:
+        split_resume_windows([long_resume], window_words=100, stride_words=150)
+        raise AssertionError("stride_words > window_words must be rejected")
+    except ValueError:
+        pass
+    print("✅ Short and empty resumes map to a single window")
+
+    # Pooling on known scores: resume 0 owns 3 windows, resume 1 owns 1
+    window_scores = np.array([0.2, 0.8, 0.5, 0.4], dtype=np.float32)
+    offsets = np.array([0, 3, 4])
+    assert np.allclose(pool_window_scores(window_scores, offsets, "max"), [0.8, 0.4])
+    assert np.allclose(pool_window_scores(window_scores, offsets, "mean"), [0.5, 0.4])
+    try:
+        pool_window_scores(window_scores, offsets, "median")
+        raise AssertionError("Unsupported pooling must be rejected")
+    except ValueError:
+        pass
+    print("✅ max and mean pooling")
+
+    # Chunked mode is a no-op for resumes that fit in one window
+    model = load_model()
+    for resume in short_resumes:
+        plain = evaluate_application(jd, resume, 0.5, model=model)
+        for pooling in ("max", "mean"):
+            chunked = evaluate_application(jd, resume, 0.5, model=model, chunked=True, pooling=pooling)
+            assert abs(chunked["score"] - plain["score"]) < 1e-6
+            assert chunked["shortlisted"] == plain["shortlisted"]
+
+    plain = batch_match_for_recruiter(jd, short_resumes, min_score_threshold=0.0, model=model)
+    chunked = batch_match_for_recruiter(jd, short_resumes, min_score_threshold=0.0, model=model,
+                                        chunked=True, pooling="mean")
+    assert [r["candidate_id"] for r in chunked["results"]] == [r["candidate_id"] for r in plain["results"]]
+    assert np.allclose([r["score"] for r in chunked["results"]], [r["score"] for r in plain["results"]], atol=1e-6)
+    print("✅ chunked=True matches whole-resume scoring for short resumes")
+
+    print("\n✅ Long-resume windows test passed!")
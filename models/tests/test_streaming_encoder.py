@@ -0,0 +1,130 @@
+"""
+Test: Streaming Encoder
+Tests parity of stream_match_for_recruiter() with batch_match_for_recruiter(),
+lazy chunk-by-chunk consumption (bounded memory), encode_into() memmap
+round-trips, the str-is-text / PathLike-is-file input rule and reporting
+of unreadable files
+"""
+
+import sys
+import os
+import pathlib
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from ai_resume_matcher import batch_match_for_recruiter, generate_embeddings, load_model
+from streaming_encoder import encode_into, iter_embedding_chunks, open_embedding_memmap, stream_match_for_recruiter
+
+POOL_SIZE = 500
+CHUNK_SIZE = 64
+
+
+def resume(i: int) -> str:
+    skills = ["Java", "Python", "React", "AWS", "Docker", "SQL", "Kubernetes", "Go"]
+    return f"Engineer {i} with {skills[i % 8]}, {skills[(i * 5) % 8]} and Spring Boot, {i % 15} years"
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("STREAMING ENCODER TEST")
+    print("=" * 80)
+
+    model = load_model()
+    jd = "Senior Java developer with Spring Boot, AWS and Docker"
+    resumes = [resume(i) for i in range(POOL_SIZE)] + [""]   # Empty resume scores 0.0
+
+    # Parity with the in-memory batch path
+    # (batch_match_for_recruiter rejects empty resumes; the stream scores them 0.0)
+    expected = batch_match_for_recruiter(jd, resumes[:-1], min_score_threshold=0.45, model=model)
+    streamed = stream_match_for_recruiter(jd, iter(resumes), min_score_threshold=0.45, chunk_size=CHUNK_SIZE, model=model)
+    assert streamed["total_candidates"] == expected["total_candidates"] + 1 == len(resumes)
+    assert streamed["shortlisted"] == expected["shortlisted"] and 0 < expected["shortlisted"] < POOL_SIZE
+    assert [r["candidate_id"] for r in streamed["results"]] == [r["candidate_id"] for r in expected["results"]]
+    assert np.allclose([r["score"] for r in streamed["results"]], [r["score"] for r in expected["results"]], atol=1e-3)
+
+    page = stream_match_for_recruiter(jd, resumes, min_score_threshold=0.45, chunk_size=CHUNK_SIZE,
+                                      model=model, limit=10, offset=5)
+    assert [r["candidate_id"] for r in page["results"]] == [r["candidate_id"] for r in expected["results"][5:15]]
+    print(f"✅ Streaming matches batch_match_for_recruiter ({expected['shortlisted']} shortlisted)")
+
+    # Lazy consumption: never more than one chunk read ahead of what was yielded
+    pulled = [0]
+
+    def from_db():
+        for text in resumes:
+            pulled[0] += 1
+            yield text
+
+    for start, embeddings in iter_embedding_chunks(model, from_db(), chunk_size=CHUNK_SIZE):
+        assert embeddings.shape == (min(CHUNK_SIZE, len(resumes) - start), 768)
+        assert pulled[0] <= start + CHUNK_SIZE, "Input must be consumed one chunk at a time"
+    print(f"✅ Input consumed lazily, {CHUNK_SIZE} resumes at a time")
+
+    reference = generate_embeddings(model, resumes[:-1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # memmap round-trip (float32 exact, float16 within half precision)
+        path = os.path.join(tmp, "embeddings.f32")
+        out = open_embedding_memmap(path, count=POOL_SIZE + 1)
+        assert encode_into(model, resumes, out, chunk_size=CHUNK_SIZE) == POOL_SIZE + 1
+        del out
+        reopened = open_embedding_memmap(path, count=POOL_SIZE + 1, mode="r")
+        assert np.allclose(reopened[:POOL_SIZE], reference, atol=1e-5)
+        assert not reopened[POOL_SIZE].any(), "Empty resume must get a zero vector"
+        del reopened
+
+        half = open_embedding_memmap(os.path.join(tmp, "embeddings.f16"), count=POOL_SIZE, dtype="float16")
+        encode_into(model, resumes[:-1], half, chunk_size=CHUNK_SIZE)
+        assert half.dtype == np.float16 and np.allclose(half.astype(np.float32), reference, atol=2e-3)
+        print("✅ encode_into() memmap round-trip (float32 and float16)")
+
+        too_small = open_embedding_memmap(os.path.join(tmp, "small.f32"), count=10)
+        try:
+            encode_into(model, resumes, too_small, chunk_size=CHUNK_SIZE)
+            raise AssertionError("Undersized out must be rejected")
+        except ValueError:
+            pass
+        del too_small
+
+        # str is text, PathLike is a file
+        text_file = pathlib.Path(tmp) / "resume.txt"
+        text_file.write_text(resumes[3], encoding="utf-8")
+        result = stream_match_for_recruiter(jd, [text_file, resumes[3]], min_score_threshold=0.0, model=model)
+        scores = {r["candidate_id"]: r["score"] for r in result["results"]}
+        assert abs(scores[0] - scores[1]) < 1e-4, "Path must be read from disk"
+
+        for bad in ([os.path.join(tmp, "resume.pdf")], [b"%PDF-1.4 bytes"]):
+            try:
+                stream_match_for_recruiter(jd, bad, model=model)
+                raise AssertionError(f"{bad!r} must be rejected")
+            except ValueError:
+                pass
+        print("✅ str is resume text; PathLike is read from disk; path-like strings rejected")
+
+        # Unreadable files are reported, not ranked as 0.0 candidates
+        broken_pdf = pathlib.Path(tmp) / "broken.pdf"
+        broken_pdf.write_bytes(b"%PDF-1.4 not really a pdf")
+        missing = pathlib.Path(tmp) / "missing.txt"
+        result = stream_match_for_recruiter(
+            jd, [text_file, missing, broken_pdf, resumes[3]], min_score_threshold=0.0, model=model
+        )
+        assert [(f["candidate_id"], f["error_type"]) for f in result["failed"]] == [
+            (1, "FileNotFoundError"), (2, "RuntimeError")
+        ], result["failed"]
+        assert sorted(r["candidate_id"] for r in result["results"]) == [0, 3]
+        assert result["shortlisted"] == 2 and result["total_candidates"] == 4
+        assert stream_match_for_recruiter(jd, resumes[:3], model=model)["failed"] == []
+
+        try:
+            list(iter_embedding_chunks(model, [missing], chunk_size=CHUNK_SIZE))
+            raise AssertionError("Unreadable file without failed= must raise")
+        except RuntimeError:
+            pass
+        failed = []
+        out = np.ones((2, 768), dtype=np.float32)
+        assert encode_into(model, [missing, resumes[3]], out, failed=failed) == 2
+        assert [f["candidate_id"] for f in failed] == [0] and not out[0].any()
+        print("✅ Unreadable files reported under 'failed' and excluded from ranking")
+
+    print("\n✅ Streaming encoder test passed!")
@@ -0,0 +1,84 @@
+"""
+Test: Vector Index (IVF) for talent-pool search
+Tests recall against exact search, incremental insert/delete and save/load
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from vector_index import EmbeddingIndex
+
+POOL_SIZE = 50_000
+QUERIES = 50
+K = 20
+
+
+def clustered_embeddings(rng, n, dim=768, clusters=200):
+    """Synthetic normalized embeddings with topic structure, like real resumes."""
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("VECTOR INDEX TEST")
+    print("=" * 80)
+
+    rng = np.random.default_rng(7)
+    vectors = clustered_embeddings(rng, POOL_SIZE)
+    ids = [f"cand-{i}" for i in range(POOL_SIZE)]
+
+    index = EmbeddingIndex()
+    index.add(ids, vectors)
+
+    start = time.perf_counter()
+    index.train()
+    print(f"Trained {POOL_SIZE:,} vectors in {time.perf_counter() - start:.1f}s\n")
+
+    queries = clustered_embeddings(rng, QUERIES)
+
+    def recall(idx, nprobe):
+        hits, ivf_ms, exact_ms = 0, 0.0, 0.0
+        for q in queries:
+            t0 = time.perf_counter()
+            approx = idx.search(q, k=K, nprobe=nprobe)
+            t1 = time.perf_counter()
+            exact = idx.search(q, k=K, exact=True)
+            t2 = time.perf_counter()
+            hits += len({i for i, _ in approx} & {i for i, _ in exact})
+            ivf_ms += (t1 - t0) * 1000
+            exact_ms += (t2 - t1) * 1000
+        return hits / (QUERIES * K), ivf_ms / QUERIES, exact_ms / QUERIES
+
+    for nprobe in (4, 16, 32):
+        r, ivf_ms, exact_ms = recall(index, nprobe)
+        print(f"nprobe={nprobe:<3} recall@{K}={r:.3f}  ivf={ivf_ms:.2f} ms  exact={exact_ms:.2f} ms")
+
+    # Exact search must agree with a plain matrix product
+    q = queries[0]
+    expected = np.argsort(-(vectors @ q), kind="stable")[:K]
+    assert [i for i, _ in index.search(q, k=K, exact=True)] == [ids[i] for i in expected]
+
+    # Incremental insert / delete
+    new_vector = queries[1]
+    index.add(["cand-new"], new_vector.reshape(1, -1), metadata=[{"source": "apply"}])
+    assert index.search(new_vector, k=1, nprobe=4)[0][0] == "cand-new"
+    assert index.remove(["cand-new"]) == 1
+    assert all(i != "cand-new" for i, _ in index.search(new_vector, k=K, exact=True))
+    print("\n✅ Incremental insert/delete")
+
+    # Save / load round trip
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "talent_pool.npz")
+        index.save(path)
+        loaded = EmbeddingIndex.load(path)
+        assert len(loaded) == len(index) and loaded.is_trained
+        assert loaded.search(q, k=K, nprobe=16) == index.search(q, k=K, nprobe=16)
+    print("✅ Save/load round trip")
+
+    print("\n✅ Vector index test passed!")
@@ -0,0 +1,633 @@
+"""
+Vector Index - Persistent ANN index over candidate embeddings
+Recruiter-side "top candidates for this JD across the whole talent pool"
+
+Pure NumPy IVF (inverted file) index:
+- Vectors are pre-normalized MPNet embeddings, so inner product == cosine
+- train() clusters the pool with spherical k-means into n_lists cells
+- search() scans only the nprobe cells closest to the query
+- exact=True (or an untrained index) does a brute-force scan, used as the
+  correctness reference for recall tests
+
+Supports incremental add/delete (by external id), per-id metadata and
+save/load to a single .npz file. Every vector carries the embedding version
+tag of the model that produced it (see get_model_version()), so vectors
+from a previous model can be found with stale_ids() and re-embedded
+(see reindex.ReindexJob).
+
+Usage:
+    index = EmbeddingIndex()
+    index_resumes(index, candidate_ids, resume_texts, model=model)
+    index.train()
+    index.save("talent_pool.npz")
+
+    result = search_talent_pool(jd_text, EmbeddingIndex.load("talent_pool.npz"), k=50)
+"""
+
+import json
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .ai_resume_matcher import _resolve_model, generate_embeddings, generate_reason, get_model_version
+    from .embedding_cache import EmbeddingCache
+except ImportError:
+    from ai_resume_matcher import _resolve_model, generate_embeddings, generate_reason, get_model_version
+    from embedding_cache import EmbeddingCache
+
+EMBEDDING_DIM = 768
+
+# k-means assignment is done in row blocks to bound the (rows x n_lists) score matrix
+_ASSIGN_BLOCK = 65536
+
+
+class EmbeddingIndex:
+    """
+    Inner-product IVF index with exact-search fallback.
+
+    Ids are any JSON-serializable hashable value (candidate id, application id, ...).
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        """
+        Args:
+            dim: Embedding dimension (default: 768)
+        """
+        self.dim = dim
+
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._size = 0                                  # Rows used in _vectors
+        self._alive = np.zeros(0, dtype=bool)
+        self._row_ids: List[Hashable] = []
+        self._id_to_row: Dict[Hashable, int] = {}
+        self._metadata: Dict[Hashable, Dict] = {}
+
+        # Per-row embedding version: code into _version_names, -1 = untagged
+        self._version_codes = np.zeros(0, dtype=np.int32)
+        self._version_names: List[str] = []
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= self._vectors.shape[0]:
+            return
+        capacity = max(needed, 2 * self._vectors.shape[0], 1024)
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        codes = np.full(capacity, -1, dtype=np.int32)
+        codes[:self._size] = self._version_codes[:self._size]
+        self._vectors, self._alive, self._version_codes = vectors, alive, codes
+
+    def _version_code(self, model_version: Optional[str], create: bool = True) -> int:
+        """Code for a version tag (-1 for None, -2 for an unknown tag when create=False)."""
+        if model_version is None:
+            return -1
+        if model_version not in self._version_names:
+            if not create:
+                return -2
+            self._version_names.append(model_version)
+        return self._version_names.index(model_version)
+
+    def add(
+        self,
+        ids: Sequence[Hashable],
+        embeddings: np.ndarray,
+        metadata: Optional[Sequence[Optional[Dict]]] = None,
+        model_version: Optional[str] = None
+    ) -> None:
+        """
+        Insert or replace vectors.
+
+        Args:
+            ids: External ids, one per row
+            embeddings: Normalized embeddings of shape (len(ids), dim)
+            metadata: Optional per-id dicts stored alongside the vectors
+            model_version: Embedding version tag of the model that produced the
+                           embeddings (default: None, untagged)
+
+        Raises:
+            ValueError: If shapes or lengths do not match, or ids repeat
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        if len(ids) != embeddings.shape[0]:
+            raise ValueError("ids and embeddings must have the same length")
+        if metadata is not None and len(metadata) != len(ids):
+            raise ValueError("metadata must have the same length as ids")
+        if len(set(ids)) != len(ids):
+            raise ValueError("ids must be unique within one add() call")
+
+        with self._lock:
+            for id_ in ids:
+                if id_ in self._id_to_row:
+                    self._remove_row(id_)
+
+            self._reserve(len(ids))
+            start = self._size
+            rows = np.arange(start, start + len(ids))
+            self._vectors[rows] = embeddings
+            self._alive[rows] = True
+            self._version_codes[rows] = self._version_code(model_version)
+            self._size += len(ids)
+
+            for i, id_ in enumerate(ids):
+                self._row_ids.append(id_)
+                self._id_to_row[id_] = start + i
+                if metadata is not None and metadata[i] is not None:
+                    self._metadata[id_] = dict(metadata[i])
+
+            if self._centroids is not None:
+                for row, list_id in zip(rows.tolist(), self._assign(embeddings).tolist()):
+                    self._lists[list_id].append(row)
+
+    def update_vectors(
+        self,
+        ids: Sequence[Hashable],
+        embeddings: np.ndarray,
+        model_version: Optional[str] = None
+    ) -> int:
+        """
+        Overwrite vectors in place, keeping metadata and cell assignment.
+        Used for re-embedding; ids no longer in the index are skipped.
+
+        Retrain after a full re-embed: cells trained under the old model do
+        not partition the new embedding space well.
+
+        Args:
+            ids: External ids
+            embeddings: Normalized embeddings of shape (len(ids), dim)
+            model_version: Embedding version tag of the new embeddings
+
+        Returns:
+            Number of vectors updated
+
+        Raises:
+            ValueError: If ids and embeddings lengths differ
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        if len(ids) != embeddings.shape[0]:
+            raise ValueError("ids and embeddings must have the same length")
+
+        with self._lock:
+            code = self._version_code(model_version)
+            updated = 0
+            for id_, embedding in zip(ids, embeddings):
+                row = self._id_to_row.get(id_)
+                if row is not None:
+                    self._vectors[row] = embedding
+                    self._version_codes[row] = code
+                    updated += 1
+            return updated
+
+    def _remove_row(self, id_: Hashable) -> None:
+        row = self._id_to_row.pop(id_)
+        self._alive[row] = False
+        self._metadata.pop(id_, None)
+
+    def remove(self, ids: Sequence[Hashable]) -> int:
+        """
+        Delete vectors by id. Unknown ids are ignored.
+
+        Args:
+            ids: External ids to delete
+
+        Returns:
+            Number of vectors removed
+        """
+        removed = 0
+        with self._lock:
+            for id_ in ids:
+                if id_ in self._id_to_row:
+                    self._remove_row(id_)
+                    removed += 1
+
+            # Reclaim space once a quarter of the rows are tombstones
+            if self._size and (self._size - len(self._id_to_row)) > self._size // 4:
+                self.compact()
+        return removed
+
+    def compact(self) -> None:
+        """Drop deleted rows and renumber the inverted lists."""
+        with self._lock:
+            live_rows = np.flatnonzero(self._alive[:self._size])
+            remap = np.full(self._size, -1, dtype=np.int64)
+            remap[live_rows] = np.arange(len(live_rows))
+
+            self._vectors = self._vectors[live_rows].copy()
+            self._alive = np.ones(len(live_rows), dtype=bool)
+            self._version_codes = self._version_codes[live_rows].copy()
+            self._row_ids = [self._row_ids[r] for r in live_rows.tolist()]
+            self._id_to_row = {id_: i for i, id_ in enumerate(self._row_ids)}
+            self._size = len(live_rows)
+
+            if self._centroids is not None:
+                self._lists = [
+                    [int(remap[r]) for r in rows if remap[r] >= 0] for rows in self._lists
+                ]
+
+    # ------------------------------------------------------------------
+    # IVF training
+    # ------------------------------------------------------------------
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Nearest centroid (max inner product) for each row."""
+        assignments = np.empty(vectors.shape[0], dtype=np.int64)
+        for start in range(0, vectors.shape[0], _ASSIGN_BLOCK):
+            block = vectors[start:start + _ASSIGN_BLOCK]
+            assignments[start:start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        return assignments
+
+    def train(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Cluster the current vectors into n_lists cells (spherical k-means).
+
+        Call again after large bulk inserts; incremental adds are assigned to
+        the existing cells.
+
+        Args:
+            n_lists: Number of cells (default: ~sqrt(N), at most 4096)
+            iterations: k-means iterations (default: 10)
+            seed: Random seed for reproducible clustering (default: 0)
+
+        Raises:
+            ValueError: If the index is empty
+        """
+        with self._lock:
+            self.compact()
+            if self._size == 0:
+                raise ValueError("Cannot train an empty index")
+
+            vectors = self._vectors[:self._size]
+            if n_lists is None:
+                n_lists = int(np.sqrt(self._size))
+            n_lists = max(1, min(n_lists, self._size, 4096))
+
+            rng = np.random.default_rng(seed)
+            self._centroids = vectors[rng.choice(self._size, n_lists, replace=False)].copy()
+
+            for _ in range(iterations):
+                assignments = self._assign(vectors)
+                sums = np.zeros_like(self._centroids)
+                np.add.at(sums, assignments, vectors)
+                counts = np.bincount(assignments, minlength=n_lists)
+
+                empty = counts == 0
+                if empty.any():
+                    # Re-seed empty cells with random points
+                    sums[empty] = vectors[rng.choice(self._size, int(empty.sum()))]
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+                self._centroids = sums / np.maximum(norms, 1e-12)
+
+            assignments = self._assign(vectors)
+            self._lists = [[] for _ in range(n_lists)]
+            for row, list_id in enumerate(assignments.tolist()):
+                self._lists[list_id].append(row)
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        nprobe: int = 8,
+        exact: bool = False,
+        model_version: Optional[str] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Top-k ids by inner product with the query.
+
+        Args:
+            query: Normalized query embedding of shape (dim,)
+            k: Number of results (default: 10)
+            nprobe: Cells scanned in IVF mode (default: 8)
+            exact: If True, brute-force scan of every vector (default: False)
+            model_version: If set, skip vectors tagged with a different version
+                           (untagged vectors are kept) (default: None)
+
+        Returns:
+            List of (id, score) sorted by score descending
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+
+        with self._lock:
+            comparable = self._comparable_rows(model_version)
+
+            if exact or self._centroids is None:
+                if len(self._id_to_row) == self._size and comparable is None:
+                    rows = None  # No tombstones: scan the matrix in place, no gather copy
+                else:
+                    live = self._alive[:self._size]
+                    rows = np.flatnonzero(live if comparable is None else live & comparable)
+            else:
+                cells = np.argsort(-(self._centroids @ query))[:max(1, nprobe)]
+                rows = np.fromiter(
+                    (r for c in cells.tolist() for r in self._lists[c]), dtype=np.int64
+                )
+                rows = rows[self._alive[rows]]
+                if comparable is not None:
+                    rows = rows[comparable[rows]]
+
+            if rows is None:
+                rows = np.arange(self._size)
+                scores = self._vectors[:self._size] @ query
+            elif rows.size == 0:
+                return []
+            else:
+                scores = self._vectors[rows] @ query
+
+            if rows.size == 0 or k <= 0:
+                return []
+            if k < rows.size:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(rows.size)
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [(self._row_ids[r], float(s)) for r, s in zip(rows[top].tolist(), scores[top].tolist())]
+
+    # ------------------------------------------------------------------
+    # Embedding versions
+    # ------------------------------------------------------------------
+
+    def _comparable_rows(self, model_version: Optional[str]) -> Optional[np.ndarray]:
+        """Row mask of vectors comparable with model_version, or None if all are (lock held)."""
+        if model_version is None:
+            return None
+        codes = self._version_codes[:self._size]
+        mask = (codes == self._version_code(model_version, create=False)) | (codes == -1)
+        return None if mask.all() else mask
+
+    def get_model_version(self, id_: Hashable) -> Optional[str]:
+        """Embedding version tag stored for an id (None if untagged or unknown id)."""
+        with self._lock:
+            row = self._id_to_row.get(id_)
+            if row is None or self._version_codes[row] < 0:
+                return None
+            return self._version_names[self._version_codes[row]]
+
+    def stale_ids(self, model_version: str) -> List[Hashable]:
+        """
+        Ids whose vectors were not produced under model_version (untagged included).
+
+        Args:
+            model_version: Current embedding version tag
+
+        Returns:
+            List of ids to re-embed
+        """
+        with self._lock:
+            code = self._version_code(model_version, create=False)
+            rows = np.flatnonzero(self._alive[:self._size] & (self._version_codes[:self._size] != code))
+            return [self._row_ids[r] for r in rows.tolist()]
+
+    def version_counts(self) -> Dict[Optional[str], int]:
+        """Number of live vectors per embedding version tag (None = untagged)."""
+        with self._lock:
+            codes = self._version_codes[:self._size][self._alive[:self._size]]
+            values, counts = np.unique(codes, return_counts=True)
+            return {
+                (None if c < 0 else self._version_names[c]): int(n)
+                for c, n in zip(values.tolist(), counts.tolist())
+            }
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def __contains__(self, id_: Hashable) -> bool:
+        return id_ in self._id_to_row
+
+    def ids(self) -> List[Hashable]:
+        """All live ids."""
+        with self._lock:
+            return list(self._id_to_row.keys())
+
+    def vectors(self, model_version: Optional[str] = None) -> Tuple[List[Hashable], np.ndarray]:
+        """
+        All live ids and their embedding matrix (row i belongs to ids[i]).
+        Compacts first if there are deleted rows; the matrix is a view, do not modify.
+
+        Args:
+            model_version: If set, leave out vectors tagged with a different
+                           version (the matrix is then a copy) (default: None)
+
+        Returns:
+            Tuple of (ids, float32 array of shape (len(ids), dim))
+        """
+        with self._lock:
+            if len(self._id_to_row) != self._size:
+                self.compact()
+            comparable = self._comparable_rows(model_version)
+            if comparable is None:
+                return list(self._row_ids[:self._size]), self._vectors[:self._size]
+            rows = np.flatnonzero(comparable)
+            return [self._row_ids[r] for r in rows.tolist()], self._vectors[rows]
+
+    def get_vector(self, id_: Hashable) -> Optional[np.ndarray]:
+        """Stored embedding for an id, or None."""
+        with self._lock:
+            row = self._id_to_row.get(id_)
+            return None if row is None else self._vectors[row].copy()
+
+    def get_metadata(self, id_: Hashable) -> Dict:
+        """Stored metadata for an id (empty dict if none)."""
+        with self._lock:
+            return dict(self._metadata.get(id_, {}))
+
+    def set_metadata(self, id_: Hashable, metadata: Dict) -> None:
+        """
+        Replace the metadata stored for an id.
+
+        Raises:
+            KeyError: If the id is not in the index
+        """
+        with self._lock:
+            if id_ not in self._id_to_row:
+                raise KeyError(id_)
+            self._metadata[id_] = dict(metadata)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """
+        Save the index (compacted) to a .npz file.
+
+        Args:
+            path: Output file path
+        """
+        with self._lock:
+            self.compact()
+            header = {
+                "dim": self.dim,
+                "ids": self._row_ids,
+                "metadata": [self._metadata.get(id_) for id_ in self._row_ids],
+                "versions": self._version_names,
+                "lists": self._lists if self._centroids is not None else None
+            }
+            arrays: Dict[str, Any] = {
+                "vectors": self._vectors[:self._size],
+                "version_codes": self._version_codes[:self._size],
+                "header": np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+            }
+            if self._centroids is not None:
+                arrays["centroids"] = self._centroids
+            with open(path, "wb") as f:
+                np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingIndex":
+        """
+        Load an index written by save().
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            EmbeddingIndex instance
+        """
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes().decode("utf-8"))
+            index = cls(dim=header["dim"])
+            vectors = data["vectors"].astype(np.float32)
+            centroids = data["centroids"] if "centroids" in data.files else None
+            version_codes = data["version_codes"] if "version_codes" in data.files else None
+
+        index._vectors = vectors
+        index._size = vectors.shape[0]
+        index._alive = np.ones(index._size, dtype=bool)
+        if version_codes is not None:
+            index._version_codes = version_codes.astype(np.int32)
+            index._version_names = header.get("versions", [])
+        else:
+            index._version_codes = np.full(index._size, -1, dtype=np.int32)  # Saved before versioning
+        index._row_ids = [tuple(i) if isinstance(i, list) else i for i in header["ids"]]
+        index._id_to_row = {id_: row for row, id_ in enumerate(index._row_ids)}
+        index._metadata = {
+            id_: meta for id_, meta in zip(index._row_ids, header["metadata"]) if meta is not None
+        }
+        if centroids is not None:
+            index._centroids = centroids.astype(np.float32)
+            index._lists = header["lists"]
+        return index
+
+
+# ============================================================================
+# Matcher integration
+# ============================================================================
+
+def index_resumes(
+    index: EmbeddingIndex,
+    candidate_ids: Sequence[Hashable],
+    resume_texts: List[str],
+    model=None,
+    cache: Optional[EmbeddingCache] = None
+) -> None:
+    """
+    Encode resumes with generate_embeddings() and insert them into the index,
+    tagged with the model's embedding version.
+
+    Args:
+        index: Target EmbeddingIndex
+        candidate_ids: External ids, one per resume
+        resume_texts: Resume texts
+        model: Optional pre-loaded model instance (for backend efficiency)
+        cache: Optional EmbeddingCache consulted before encoding (default: None)
+
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    if len(candidate_ids) != len(resume_texts):
+        raise ValueError("candidate_ids and resume_texts must have the same length")
+    if not resume_texts:
+        return
+
+    model = _resolve_model(model)
+    index.add(
+        candidate_ids,
+        generate_embeddings(model, resume_texts, cache=cache),
+        model_version=get_model_version(model)
+    )
+
+
+def search_talent_pool(
+    jd_text: str,
+    index: EmbeddingIndex,
+    k: int = 50,
+    min_score_threshold: float = 0.50,
+    model=None,
+    nprobe: int = 8,
+    exact: bool = False
+) -> Dict:
+    """
+    Top candidates for a JD across the whole indexed talent pool.
+
+    Only the JD is encoded; resumes come from the index. Vectors tagged with
+    a different embedding version than the model are skipped until re-embedded.
+
+    Args:
+        jd_text: Job description text
+        index: EmbeddingIndex holding resume embeddings
+        k: Maximum number of candidates returned (default: 50)
+        min_score_threshold: Minimum similarity score required (default: 0.50)
+        model: Optional pre-loaded model instance (for backend efficiency)
+        nprobe: Cells scanned in IVF mode (default: 8)
+        exact: If True, brute-force search (default: False)
+
+    Returns:
+        {
+            "total_candidates": int,   # Size of the indexed pool
+            "shortlisted": int,        # Returned candidates meeting threshold
+            "results": [{"candidate_id", "score", "rank", "reason"}]
+        }
+
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    if not jd_text or not isinstance(jd_text, str):
+        raise ValueError("jd_text must be a non-empty string")
+
+    if not isinstance(min_score_threshold, (int, float)) or min_score_threshold < 0.0 or min_score_threshold > 1.0:
+        raise ValueError("min_score_threshold must be a float between 0.0 and 1.0")
+
+    model = _resolve_model(model)
+    jd_embedding = generate_embeddings(model, [jd_text])[0]
+
+    results = []
+    hits = index.search(jd_embedding, k=k, nprobe=nprobe, exact=exact, model_version=get_model_version(model))
+    for candidate_id, score in hits:
+        score = max(0.0, min(1.0, score))  # Clip to [0, 1]
+        if score < min_score_threshold:
+            break  # Sorted descending - nothing further qualifies
+        results.append({
+            "candidate_id": candidate_id,
+            "score": round(score, 4),
+            "rank": len(results) + 1,
+            "reason": generate_reason(score)
+        })
+
+    return {
+        "total_candidates": len(index),
+        "shortlisted": len(results),
+        "results": results
+    }